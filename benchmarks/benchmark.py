@@ -9,9 +9,102 @@ import csv
 from unification.utils.logique.litteral import Litteral
 from typing import List, Tuple
 from unification.discrimination_tree import benchmark_arbre_discrimination
+from unification.substitution_tree import benchmark_arbre_substitution
 from benchmark_robinson import benchRobinson
+from unification.robinson import unifLitterauxUF
+from unification.robinson_plat import unifLitterauxPlat
 from benchmark_martelli_montanari import bench
+from benchmark_paterson_wegman import benchPatersonWegman
 from unification.utils.serialisation import deserialiser
+from unification.utils.logique.substitution import OCCURS_TOUJOURS, OCCURS_DIFFERE, POLITIQUES_OCCURS, verifier_politique
+
+
+# Variantes de Robinson comparables sur les mêmes structures : algo -> unification de deux littéraux
+UNIFICATEURS_ROBINSON = {
+    "robinson": None,                   # unifLitteraux
+    "robinson_uf": unifLitterauxUF,     # classes de variables (union-find)
+    "robinson_plat": unifLitterauxPlat, # encodage plat des littéraux
+}
+
+
+# Moteurs de Martelli-Montanari comparables sur les mêmes structures : algo -> nom du moteur (cf. martelli_montanari.MOTEURS)
+MOTEURS_MM = {
+    "mm": "regles",                 # système de règles
+    "mm_multi": "multi_equations",  # multi-équations (algorithme efficace de Martelli et Montanari)
+}
+
+
+# Politiques d'occurs check acceptées par chaque algo. Les algos absents ont un comportement fixe
+# (robinson_uf : détection de cycle à la fin ; robinson_plat, pw : vérification à chaque liaison) :
+# la politique demandée ne s'applique pas et la colonne Occurs vaut SANS_POLITIQUE.
+POLITIQUES_ALGOS = {
+    "robinson": POLITIQUES_OCCURS,
+    "mm": POLITIQUES_OCCURS,
+    "mm_multi": (OCCURS_TOUJOURS, OCCURS_DIFFERE), # Cycles détectés par les compteurs, "jamais" refusé
+    "arbre": POLITIQUES_OCCURS,
+    "arbre_substitution": POLITIQUES_OCCURS,
+}
+ALGOS = ("robinson", "robinson_uf", "robinson_plat", "mm", "mm_multi", "pw", "arbre", "arbre_substitution")
+SANS_POLITIQUE = "n/a"
+
+
+def politique_appliquee(algo: str, occurs: str) -> str:
+    """
+    Politique d'occurs check réellement appliquée par `algo` quand `occurs` est demandée :
+    `occurs` si l'algo la prend en charge, SANS_POLITIQUE s'il n'a pas de politique.
+    Lève ValueError pour un algo inconnu, une politique inconnue ou refusée par l'algo.
+    """
+    verifier_politique(occurs)
+    if algo not in ALGOS:
+        raise ValueError(f"Algo inconnu : {algo}")
+    acceptees = POLITIQUES_ALGOS.get(algo)
+    if acceptees is None:
+        return SANS_POLITIQUE
+    if occurs not in acceptees:
+        raise ValueError(f"Politique d'occurs check {occurs!r} non supportée par {algo} (attendu : {', '.join(acceptees)})")
+    return occurs
+
+
+# Colonnes des fichiers brut_<algo>.csv. Les fichiers antérieurs à la politique d'occurs check n'ont pas la
+# colonne Occurs : leurs mesures ont été faites avec l'occurs check à chaque liaison ("toujours").
+EN_TETE_CSV = ["Jeu", "Algo", "Structure", "TouteUnif", "Iteration", "Temps_Pretraitement", "Temps_Total", "RAM_Pic_Mo", "CPU_Percent", "Nb_Unifications", "Occurs"]
+
+
+def _preparer_csv(fichier_csv: str) -> bool:
+    """
+    Vérifie l'en-tête d'un fichier brut existant avant d'y ajouter des lignes. Un fichier à l'ancien format
+    (sans Occurs) est réécrit avec la colonne Occurs ("toujours" pour ses lignes à 10 valeurs ; les lignes à
+    11 valeurs déjà ajoutées sous cet en-tête gardent leur politique) ; un autre en-tête est refusé.
+    Les lignes d'un algo sans politique d'occurs check qui en indiquent une sont corrigées (SANS_POLITIQUE).
+
+    Returns:
+        True si le fichier n'existe pas (l'en-tête reste à écrire), False sinon.
+    """
+    if not os.path.exists(fichier_csv):
+        return True
+    with open(fichier_csv, newline='') as f:
+        lignes = list(csv.reader(f))
+    if not lignes:
+        return True
+    if lignes[0] != EN_TETE_CSV and lignes[0] != EN_TETE_CSV[:-1]:
+        sys.exit(f"{fichier_csv} : en-tête inattendu {lignes[0]}, rien n'est ajouté (attendu : {EN_TETE_CSV})")
+    corrigees = []
+    for ligne in lignes[1:]:
+        if not ligne:
+            continue
+        if len(ligne) < len(EN_TETE_CSV):
+            ligne = ligne + [OCCURS_TOUJOURS]
+        if ligne[1] in ALGOS and ligne[1] not in POLITIQUES_ALGOS:
+            ligne = ligne[:-1] + [SANS_POLITIQUE]
+        corrigees.append(ligne)
+    if lignes[0] == EN_TETE_CSV and corrigees == [ligne for ligne in lignes[1:] if ligne]:
+        return False
+    with open(fichier_csv, mode='w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(EN_TETE_CSV)
+        writer.writerows(corrigees)
+    print(f"{fichier_csv} : colonne Occurs mise à jour pour les {len(corrigees)} lignes existantes")
+    return False
 
 
 # ATTENTION : Aide de l'IA pour connaitre psutil et tracemalloc, et pour faire un affichage correct
@@ -69,7 +162,7 @@ def _mesurer_ressources(fonction_algo, *args, **kwargs):
     }
 
 
-def _afficher_mesures(algo: str, structure: str, candidats: List[str], mesures: dict):
+def _afficher_mesures(algo: str, structure: str, candidats: List[str], mesures: dict, occurs: str = OCCURS_TOUJOURS):
     """
     Joli affichage uniforme pour comparer les algos.
     Affiche :
@@ -86,7 +179,7 @@ def _afficher_mesures(algo: str, structure: str, candidats: List[str], mesures:
     moy_tps_unif = total_tps_unif / nb_candidats if nb_candidats else 0.0
 
     print("\n" + "=" * 70)
-    print(f" Résultats  —  algo: {algo}   structure: {structure}")
+    print(f" Résultats  —  algo: {algo}   structure: {structure}   occurs check: {occurs}")
     print(f" Nombre de candidats   : {nb_candidats}")
     print("=" * 70)
     print(f"  Temps prétraitement       : {tps_pre} s")
@@ -112,16 +205,23 @@ def _afficher_mesures(algo: str, structure: str, candidats: List[str], mesures:
     print("=" * 70)
 
 
-def benchmark(candidats: List[str], filename: str, algo: str, structure: str, touteUnif: bool = True, pretraitement: bool = True):
+def benchmark(candidats: List[str], filename: str, algo: str, structure: str, touteUnif: bool = True, pretraitement: bool = True,
+              occurs: str = OCCURS_TOUJOURS):
     """
     Mesure temps, RAM et CPU de manière uniforme pour permettre la comparaison.
 
     Paramètres :
       - candidats : liste de chaînes représentant les littéraux candidats à unifier
       - filename  : nom du fichier de jeu de données (dans Util/Serialisation/Output)
-      - algo      : "arbre" | "robinson" | "mm"
+      - algo      : "arbre" | "arbre_substitution" | "robinson" | "robinson_uf" | "robinson_plat" | "mm" | "mm_multi" | "pw"
       - structure : structure de données utilisée par l'algo (pour Robinson/MM)
+      - occurs    : politique d'occurs check "toujours" | "differe" | "jamais" (cf. POLITIQUES_ALGOS : mm_multi refuse
+                    "jamais", robinson_uf, robinson_plat et pw n'en ont pas)
+
+    Le dict retourné indique sous "occurs" la politique réellement appliquée (cf. politique_appliquee).
+    Une politique refusée par l'algo lève ValueError avant tout chargement.
     """
+    occurs = politique_appliquee(algo, occurs)
     # --- chargement des données ---
     print("Début déserialisation")
     predList = deserialiser(os.path.basename(filename), False)
@@ -137,22 +237,33 @@ def benchmark(candidats: List[str], filename: str, algo: str, structure: str, to
     if algo == "arbre":
         mesures = _mesurer_ressources(
             benchmark_arbre_discrimination,
-            predList, realCandidats, touteUnif
+            predList, realCandidats, touteUnif, occurs
+        )
+    elif algo == "arbre_substitution":
+        mesures = _mesurer_ressources(
+            benchmark_arbre_substitution,
+            predList, realCandidats, touteUnif, occurs
         )
-    elif algo == "robinson":
+    elif algo in UNIFICATEURS_ROBINSON:
         mesures = _mesurer_ressources(
             benchRobinson,
-            realCandidats, predList, structure, pretraitement, touteUnif
+            realCandidats, predList, structure, pretraitement, touteUnif, UNIFICATEURS_ROBINSON[algo], occurs
         )
-    elif algo == "mm":
+    elif algo in MOTEURS_MM:
         mesures = _mesurer_ressources(
             bench,
+            realCandidats, predList, structure, pretraitement, touteUnif, occurs, MOTEURS_MM[algo]
+        )
+    elif algo == "pw":
+        mesures = _mesurer_ressources(
+            benchPatersonWegman,
             realCandidats, predList, structure, pretraitement, touteUnif
         )
     else:
         raise ValueError(f"Algo inconnu : {algo}")
 
-    _afficher_mesures(algo, structure, candidats, mesures)
+    mesures["occurs"] = occurs
+    _afficher_mesures(algo, structure, candidats, mesures, occurs)
     return mesures
 
 
@@ -586,7 +697,7 @@ if __name__ == "__main__":
     }
 
     if len(sys.argv) < 6: # On attend 5 arguments + le nom du script
-        print("Usage: python benchmark.py <jeu> <algo> <structure> <touteUnif> <iteration>")
+        print("Usage: python benchmark.py <jeu> <algo> <structure> <touteUnif> <iteration> [<occurs>]")
         sys.exit(1)
 
     nom_jeu = sys.argv[1]
@@ -594,24 +705,29 @@ if __name__ == "__main__":
     structure = sys.argv[3]
     touteUnif = (sys.argv[4].lower() == "true")
     iteration = sys.argv[5]
+    occurs = sys.argv[6] if len(sys.argv) > 6 else OCCURS_TOUJOURS # Politique d'occurs check (optionnelle)
 
     candidats = jeux_candidats[nom_jeu]
 
     # Chemin du fichier de données
     file = os.path.join(os.path.dirname(__file__), "..", "src", "utils", "Output", nom_jeu)
 
-    # Lancement du benchmark
-    mesures = benchmark(candidats, file, algo, structure, touteUnif=touteUnif)
+    # Lancement du benchmark (arrêt sans mesure si l'algo refuse la politique demandée)
+    try:
+        politique_appliquee(algo, occurs)
+    except ValueError as e:
+        sys.exit(str(e))
+    mesures = benchmark(candidats, file, algo, structure, touteUnif=touteUnif, occurs=occurs)
 
     # --- Sauvegarde dans le CSV spécifique à l'ALGO ---
     fichier_csv = f"brut_{algo}.csv" # Un fichier par algo
-    fichier_existe = os.path.exists(fichier_csv)
+    nouveau_fichier = _preparer_csv(fichier_csv) # Met à niveau un fichier sans colonne Occurs
     
     with open(fichier_csv, mode='a', newline='') as csvfile:
         writer = csv.writer(csvfile)
         # En-tête si nouveau fichier
-        if not fichier_existe:
-            writer.writerow(["Jeu", "Algo", "Structure", "TouteUnif", "Iteration", "Temps_Pretraitement", "Temps_Total", "RAM_Pic_Mo", "CPU_Percent", "Nb_Unifications"])
+        if nouveau_fichier:
+            writer.writerow(EN_TETE_CSV)
         
         tps_pre, liste_resultats = mesures["resultat_algo"]
         nb_unif_total = sum(n for _, n in liste_resultats) # Somme de tous les n (nb d'unifs)
@@ -627,5 +743,6 @@ if __name__ == "__main__":
             mesures["temps_total_s"], 
             mesures["ram_pic_tracemalloc_Mo"],
             mesures["cpu_percent"],
-            nb_unif_total
+            nb_unif_total,
+            mesures["occurs"] # Politique réellement appliquée ("n/a" pour un algo sans politique)
         ])
@@ -0,0 +1,84 @@
+import gc
+import sys
+import time
+
+from typing import List, Dict
+
+from unification.utils.logique.litteral import Litteral
+from unification.utils.stores import DictStore, PathIndexStore
+from unification.robinson import rechercherUnifiablesOptimise
+from unification.discrimination_tree import ArbreDeDiscrimination
+from jeux import generer_jeu
+
+
+# Comparaison des index de recherche de candidats sur une grande base (100 000 littéraux par défaut) :
+# DictStore (prédicat, signe, tête du premier argument), PathIndexStore (intersection des postings
+# par chemin) et ArbreDeDiscrimination. Les requêtes "selectives" n'ont aucune variable en argument
+# (de premier niveau) : c'est là que l'indexation par chemins doit se démarquer.
+# L'arbre ne filtre pas sur le signe : ses résultats sont donc plus nombreux que ceux des stores.
+
+
+def _requetes(requetes: List[Litteral]) -> Dict[str, List[Litteral]]:
+    """Requêtes réparties par sélectivité."""
+    return {
+        "selectives": [q for q in requetes if None not in q.racines],
+        "toutes": requetes,
+    }
+
+
+def _mesurer_store(store, base: List[Litteral], requetes: List[Litteral]) -> Dict[str, float]:
+    debut = time.perf_counter()
+    for l in base:
+        store.push(l)
+    construction = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    candidats = sum(1 for q in requetes for _ in store.get_candidats_resolution(q))
+    selection = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    trouves = sum(len(rechercherUnifiablesOptimise(q, store)) for q in requetes)
+    recherche = time.perf_counter() - debut
+    return {"construction_s": construction, "selection_s": selection, "recherche_s": recherche,
+            "candidats": candidats, "unifiables": trouves}
+
+
+def _mesurer_arbre(base: List[Litteral], requetes: List[Litteral]) -> Dict[str, float]:
+    debut = time.perf_counter()
+    arbre = ArbreDeDiscrimination()
+    for i, l in enumerate(base):
+        arbre.inserer(l, i)
+    construction = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    trouves = sum(len(arbre.rechercher(q)) for q in requetes)
+    recherche = time.perf_counter() - debut
+    return {"construction_s": construction, "selection_s": float("nan"), "recherche_s": recherche,
+            "candidats": -1, "unifiables": trouves}
+
+
+def comparer(jeux: List[str], n: int, n_requetes: int) -> None:
+    print(f"{'Jeu':<6} {'Requêtes':<11} {'Index':<10} {'Construction (s)':>17} {'Sélection (s)':>14} "
+          f"{'Recherche (s)':>14} {'Candidats':>10} {'Unifiables':>11}")
+    for nom_jeu in jeux:
+        # Même tirage pour la base et les requêtes : le générateur fixe l'arité de chaque prédicat
+        litteraux = [Litteral.from_string(s) for s in generer_jeu(nom_jeu, n + n_requetes)]
+        base = litteraux[:n]
+        for famille, requetes in _requetes(litteraux[n:]).items():
+            for index in ("dict", "chemins", "arbre"):
+                gc.collect()
+                if index == "arbre":
+                    m = _mesurer_arbre(base, requetes)
+                else:
+                    m = _mesurer_store(DictStore() if index == "dict" else PathIndexStore(), base, requetes)
+                print(f"{nom_jeu:<6} {f'{famille} ({len(requetes)})':<11} {index:<10} {m['construction_s']:>17.3f} "
+                      f"{m['selection_s']:>14.4f} {m['recherche_s']:>14.4f} {m['candidats']:>10} {m['unifiables']:>11}")
+
+
+if __name__ == "__main__":
+    # Usage : python benchmark_index.py [n] [n_requetes] [jeu2 jeu5 ...]
+    args = sys.argv[1:]
+    n = int(args[0]) if len(args) > 0 else 100_000
+    n_requetes = int(args[1]) if len(args) > 1 else 200
+    jeux = args[2:] if len(args) > 2 else ["jeu2", "jeu14"]
+    comparer(jeux, n, n_requetes)
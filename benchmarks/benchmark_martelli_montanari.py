@@ -1,9 +1,22 @@
 import time
 
-from unification.utils.stores import TermSystem
-from unification.martelli_montanari import MartelliMontanari, UnificationError, indexer
-
-def bench(candidats: list, predList: list, structure: str, pretraitement: bool, touteUnif=True):
+from typing import List
+
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.utils.stores import TermSystem, Equation, PathIndexStore
+from unification.martelli_montanari import MartelliMontanari, indexer, MOTEURS
+from unification.utils.logique.substitution import OCCURS_TOUJOURS
+
+def _indexer_chemins(predList: list) -> PathIndexStore:
+    index = PathIndexStore()
+    for l in predList:
+        index.push(l)
+    return index
+
+def bench(candidats: list, predList: list, structure: str, pretraitement: bool, touteUnif=True, occurs=OCCURS_TOUJOURS, moteur="regles"):
+    # moteur : nom du moteur de résolution (cf. martelli_montanari.MOTEURS)
+    indexe = structure in ("dictionnaire", "chemins")
+    classe = MOTEURS[moteur]
     
     tps_pretraitement = 0.0
     collection = predList  
@@ -23,6 +36,10 @@ def bench(candidats: list, predList: list, structure: str, pretraitement: bool,
         elif structure == "dictionnaire":
             # On transforme la liste en index
             collection = indexer(predList)
+
+        elif structure == "chemins":
+            # Index par chemins (PathIndexStore)
+            collection = _indexer_chemins(predList)
             
 
         tps_pretraitement = time.perf_counter() - debut
@@ -34,22 +51,21 @@ def bench(candidats: list, predList: list, structure: str, pretraitement: bool,
 
         elif structure == "dictionnaire":
             collection = indexer(predList)
+
+        elif structure == "chemins":
+            collection = _indexer_chemins(predList)
         
     for candidat in candidats:
         debut = time.perf_counter() #Ici on mesure le temps d'unification pour chaque candidat
         resultat = {}
 
         sousCollection = collection
-        if structure == "dictionnaire":
-            dict = collection.get(candidat.predicat, {})
-            
-            if candidat.sign:
-                sousCollection = dict.get("negatif", [])
-            else:
-                sousCollection = dict.get("positif", [])
+        if indexe:
+            # Index incrémental (DictStore, PathIndexStore) : même prédicat, même arité, signe opposé
+            sousCollection = collection.get_candidats_resolution(candidat)
         for l2 in sousCollection:
             # Si il y a pas de prétraitement, le filtre se fait ici pendant l'unification
-            if structure != "dictionnaire":
+            if not indexe:
                 if l2.predicat != candidat.predicat or l2.sign == candidat.sign or l2.arity != candidat.arity:
                     continue
 
@@ -57,13 +73,12 @@ def bench(candidats: list, predList: list, structure: str, pretraitement: bool,
             for t1, t2 in zip(candidat.enfants, l2.enfants):
                 system.add(t1, t2)
 
-            mm = MartelliMontanari(system)
-            try:
-                resultat[l2] = mm.solve()
+            mm = classe(system, occurs)
+            resolution = mm.resoudre() # sans exception en cas d'échec
+            if resolution.succes:
+                resultat[l2] = resolution.systeme
                 if not touteUnif:
                     break  # on s'arrête après la première unification réussie
-            except UnificationError:
-                pass
 
         tps_unification = time.perf_counter() - debut
 
@@ -74,4 +89,70 @@ def bench(candidats: list, predList: list, structure: str, pretraitement: bool,
     print(f"Temps prétraitement : {tps_pretraitement} s")
    
 
-    return (tps_pretraitement, resultats)
\ No newline at end of file
+    return (tps_pretraitement, resultats)
+
+def _systeme_chaine(profondeur: int, arite: int) -> TermSystem:
+    """
+    f(X1, ..., Xn) = f(X2, ..., Xn, a) sur des arbres complets de profondeur et d'arité données (n = arite^profondeur
+    feuilles) : la décomposition donne la chaîne X1 = X2, ..., Xn = a, qui oblige à éliminer toutes les variables.
+    """
+    n = arite ** profondeur
+    feuilles = [FabriqueDeTermes.creer_var(f"X{i}") for i in range(n)]
+
+    def arbre(niveau: List, k: int):
+        while len(niveau) > 1:
+            niveau = [FabriqueDeTermes.creer_fonc("f", k, niveau[i:i + k]) for i in range(0, len(niveau), k)]
+        return niveau[0]
+
+    return TermSystem([Equation(arbre(feuilles, arite), arbre(feuilles[1:] + [FabriqueDeTermes.creer_cons("a")], arite))])
+
+
+def bench_echelle(profondeurs=(1, 2, 3, 4), arites=(2, 3, 5, 7, 10), repetitions: int = 3, moteur: str = "regles"):
+    """
+    Temps de solve (moteur `moteur`, cf. MOTEURS) en fonction de la profondeur et de l'arité des termes (meilleur de
+    `repetitions` essais), sur les systèmes de _systeme_chaine, limités à 5000 feuilles.
+    """
+    print(f"{'profondeur':>10} {'arite':>6} {'feuilles':>9} {'temps (s)':>12}")
+    for profondeur in profondeurs:
+        for arite in arites:
+            if arite ** profondeur > 5000:
+                continue
+            meilleur = float("inf")
+            for _ in range(repetitions):
+                system = _systeme_chaine(profondeur, arite)
+                debut = time.perf_counter()
+                MOTEURS[moteur](system).solve()
+                meilleur = min(meilleur, time.perf_counter() - debut)
+            print(f"{profondeur:>10} {arite:>6} {arite ** profondeur:>9} {meilleur:>12.6f}")
+
+
+def _systeme_large(n: int) -> TermSystem:
+    """
+    f(X1, ..., Xn, Y1, ..., Yn) = f(g(Y1), ..., g(Yn), a, ..., a) : chaque Yi éliminée n'apparaît que dans
+    le terme résolu de Xi (le cas des littéraux larges, d'arité 7 à 10, des jeux 3 à 5).
+    """
+    xs = [FabriqueDeTermes.creer_var(f"X{i}") for i in range(n)]
+    ys = [FabriqueDeTermes.creer_var(f"Y{i}") for i in range(n)]
+    a = FabriqueDeTermes.creer_cons("a")
+    return TermSystem([Equation(FabriqueDeTermes.creer_fonc("f", 2 * n, xs + ys),
+                                FabriqueDeTermes.creer_fonc("f", 2 * n, [FabriqueDeTermes.creer_fonc("g", 1, [y]) for y in ys] + [a] * n))])
+
+
+def bench_largeur(largeurs=(10, 100, 1000, 3000), repetitions: int = 3, moteur: str = "regles"):
+    """Temps de solve (moteur `moteur`) sur les systèmes de _systeme_large (meilleur de `repetitions` essais)."""
+    print(f"{'variables':>9} {'temps (s)':>12}")
+    for n in largeurs:
+        meilleur = float("inf")
+        for _ in range(repetitions):
+            system = _systeme_large(n)
+            debut = time.perf_counter()
+            MOTEURS[moteur](system).solve()
+            meilleur = min(meilleur, time.perf_counter() - debut)
+        print(f"{2 * n:>9} {meilleur:>12.6f}")
+
+
+if __name__ == "__main__":
+    for moteur in MOTEURS:
+        print(f"--- {moteur} ---")
+        bench_echelle(moteur=moteur)
+        bench_largeur(moteur=moteur)
@@ -0,0 +1,18 @@
+from typing import List, Tuple
+
+from unification.utils.logique.litteral import Litteral
+from unification.paterson_wegman import unifLitterauxPW
+from benchmark_robinson import benchRobinson
+
+
+def benchPatersonWegman(candidats: List[Litteral], predList: list, structure: str,
+                        pretraitement: bool, touteUnif: bool = True) -> Tuple[float, List[Tuple[float, int]]]:
+    """
+    Bench de l'algorithme de Paterson-Wegman.
+    Même protocole et mêmes structures ("liste", "ensemble", "dictionnaire") que benchRobinson,
+    seule l'unification de deux littéraux change : les résultats sont donc directement comparables.
+
+    Returns:
+        Tuple[float, List[Tuple[float, int]]]: (temps_pretraitement, [(tps_unif_candidat_i, nb_unif_candidat_i), ...])
+    """
+    return benchRobinson(candidats, predList, structure, pretraitement, touteUnif, unifLitterauxPW)
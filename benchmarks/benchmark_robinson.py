@@ -2,13 +2,14 @@ import time
 
 from typing import List, Dict, Any, Optional, Tuple, NamedTuple
 
-from unification.utils.stores import DictStore, SetStore, ListStore, TermStore
+from unification.utils.stores import DictStore, SetStore, ListStore, PathIndexStore, TermStore
 from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
 from unification.utils.serialisation import serialiser, deserialiser
 from unification.robinson import rechercherUnifiablesOptimise, rechercherUnifiablesSimple, afficherResultat
+from unification.utils.logique.substitution import OCCURS_TOUJOURS
 
 def benchRobinson(candidats: List[Litteral], predList: list, structure: str,
-                  pretraitement: bool, touteUnif: bool = True) -> Tuple[float, List[Tuple[float, int]]]:
+                  pretraitement: bool, touteUnif: bool = True, unificateur=None, occurs: str = OCCURS_TOUJOURS) -> Tuple[float, List[Tuple[float, int]]]:
     """
     Fonction utilitaire pour bench de l'algo de Robinson sur une LISTE de candidats.
     Calcule :
@@ -22,9 +23,11 @@ def benchRobinson(candidats: List[Litteral], predList: list, structure: str,
     Args:
         candidats (List[Litteral]): Liste des littéraux que l'on cherche à unifier.
         predList (list): Les littéraux du jeu de données (la "base").
-        structure (str): Structure de données utilisée. ("liste", "ensemble", "dictionnaire")
+        structure (str): Structure de données utilisée. ("liste", "ensemble", "dictionnaire", "chemins")
         pretraitement (bool): Active ou non la phase de prétraitement.
         touteUnif (bool, optional): True = toutes les unifications, False = la première. Defaults to True.
+        unificateur (optional): Unification de deux littéraux (unifLitteraux par défaut, ou unifLitterauxUF, unifLitterauxPlat).
+        occurs (str, optional): Politique d'occurs check de l'unification par défaut ("toujours", "differe", "jamais").
 
     Returns:
         Tuple[float, List[Tuple[float, int]]]:
@@ -41,6 +44,8 @@ def benchRobinson(candidats: List[Litteral], predList: list, structure: str,
         store = SetStore()
     elif structure == "dictionnaire":
         store = DictStore()
+    elif structure == "chemins":
+        store = PathIndexStore()
     else:
         raise ValueError(f"Structure non supportée : {structure}")
 
@@ -80,7 +85,7 @@ def benchRobinson(candidats: List[Litteral], predList: list, structure: str,
     for i, candidat in enumerate(candidats):
         debut_unif = time.perf_counter()
         
-        result = rechercherUnifiablesOptimise(candidat, store, touteUnif)
+        result = rechercherUnifiablesOptimise(candidat, store, touteUnif, unificateur, occurs)
             
         tps_unif = time.perf_counter() - debut_unif
 
@@ -0,0 +1,133 @@
+import csv
+import random
+import sys
+import time
+
+from typing import List, Dict, Tuple
+
+from unification.utils.logique.litteral import Litteral
+from unification.utils.stores import DictStore, ListStore, SetStore, TermStore
+from jeux import generer_jeu
+
+
+# Churn des stores : mélanges d'insertions, de retraits (remove / pop) et de requêtes sur un ensemble
+# de littéraux qui évolue, comme l'ensemble de clauses d'un prouveur par saturation.
+# "liste_naive" est la référence d'avant remove en O(1) : list.remove, qui décale la fin de la liste.
+
+# (insertion, remove, pop, requête) : proportions des opérations
+MELANGES: Dict[str, Tuple[float, float, float, float]] = {
+    "insertions": (0.70, 0.10, 0.10, 0.10),
+    "equilibre": (0.40, 0.30, 0.10, 0.20),
+    "requetes": (0.20, 0.10, 0.05, 0.65),
+}
+
+
+class _ListeNaive:
+    """Liste avec le remove de Python (O(n)), pour comparaison."""
+    def __init__(self):
+        self._data: List[Litteral] = []
+    def push(self, item): self._data.append(item)
+    def pop(self): return self._data.pop()
+    def remove(self, item): self._data.remove(item)
+    def __len__(self): return len(self._data)
+    def __iter__(self): return iter(self._data)
+
+
+STRUCTURES = {
+    "liste_naive": _ListeNaive,
+    "liste": ListStore,
+    "ensemble": SetStore,
+    "dictionnaire": DictStore,
+}
+
+
+def _candidats(store: TermStore, requete: Litteral):
+    """Candidats à la résolution : l'index pour DictStore, un parcours filtré pour les autres."""
+    if isinstance(store, DictStore):
+        return store.get_candidats_resolution(requete)
+    return (l for l in store if l.symbole == requete.symbole and l.sign != requete.sign)
+
+
+def mesurer_churn(litteraux: List[Litteral], structure: str, melange: str, n_ops: int, graine: int = 0) -> Dict[str, float]:
+    """
+    Remplit le store avec la moitié des littéraux, puis applique n_ops opérations tirées selon le mélange.
+    Retourne le temps total, le débit et le nombre de candidats parcourus par les requêtes.
+    """
+    rng = random.Random(graine)
+    p_ins, p_rem, p_pop, _ = MELANGES[melange]
+    store = STRUCTURES[structure]()
+    # Miroir du contenu (même coût pour toutes les structures) : tirage des littéraux à retirer,
+    # et doublons écartés pour SetStore
+    miroir: ListStore = ListStore()
+    compte: Dict[Litteral, int] = {}
+
+    def ajouter(l: Litteral) -> None:
+        if structure == "ensemble" and compte.get(l):
+            return
+        store.push(l)
+        miroir.push(l)
+        compte[l] = compte.get(l, 0) + 1
+
+    def oublier(l: Litteral) -> None:
+        miroir.remove(l)
+        compte[l] -= 1
+
+    for l in litteraux[:len(litteraux) // 2]:
+        ajouter(l)
+
+    # Tirage des opérations hors chronométrage
+    tirages = [rng.random() for _ in range(n_ops)]
+    choix = [rng.random() for _ in range(n_ops)]
+    parcourus = 0
+
+    debut = time.perf_counter()
+    for t, c in zip(tirages, choix):
+        if t < p_ins or miroir.is_empty():
+            ajouter(litteraux[int(c * len(litteraux))])
+        elif t < p_ins + p_rem:
+            l = miroir._data[int(c * len(miroir))]
+            store.remove(l)
+            oublier(l)
+        elif t < p_ins + p_rem + p_pop:
+            oublier(store.pop())
+        else:
+            requete = litteraux[int(c * len(litteraux))]
+            parcourus += sum(1 for _ in _candidats(store, requete))
+    duree = time.perf_counter() - debut
+
+    assert len(store) == len(miroir)
+    return {"temps_s": duree, "ops_par_s": n_ops / duree, "candidats": parcourus, "taille_finale": len(store)}
+
+
+def comparer(jeux: List[str], n: int, n_ops: int, fichier_csv: str = None) -> None:
+    colonnes = ["temps_s", "ops_par_s", "candidats", "taille_finale"]
+    lignes = []
+    print(f"{'Jeu':<6} {'Mélange':<11} {'Structure':<13} {'Temps (s)':>10} {'ops/s':>10} {'Candidats':>11} {'Taille':>7}")
+    for nom_jeu in jeux:
+        litteraux = [Litteral.from_string(s) for s in generer_jeu(nom_jeu, n)]
+        for melange in MELANGES:
+            for structure in STRUCTURES:
+                m = mesurer_churn(litteraux, structure, melange, n_ops)
+                lignes.append([nom_jeu, melange, structure] + [round(m[c], 4) for c in colonnes])
+                print(f"{nom_jeu:<6} {melange:<11} {structure:<13} {m['temps_s']:>10.4f} {m['ops_par_s']:>10.0f} "
+                      f"{m['candidats']:>11} {m['taille_finale']:>7}")
+
+    if fichier_csv is not None:
+        with open(fichier_csv, mode="w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Jeu", "Melange", "Structure"] + colonnes)
+            writer.writerows(lignes)
+
+
+if __name__ == "__main__":
+    # Usage : python benchmark_stores.py [n] [n_ops] [jeu1 jeu4 ...] [--csv fichier]
+    args = sys.argv[1:]
+    fichier_csv = None
+    if "--csv" in args:
+        i = args.index("--csv")
+        fichier_csv = args[i + 1]
+        del args[i:i + 2]
+    n = int(args[0]) if len(args) > 0 else 10_000
+    n_ops = int(args[1]) if len(args) > 1 else 10_000
+    jeux = args[2:] if len(args) > 2 else ["jeu1", "jeu7", "jeu13"]
+    comparer(jeux, n, n_ops, fichier_csv)
@@ -0,0 +1,160 @@
+import gc
+import sys
+import time
+import tracemalloc
+import csv
+
+from typing import List, Dict
+
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.utils.logique.litteral import Litteral
+from unification.robinson import occurs_check, apply_subst, unifLitteraux
+from unification.robinson_plat import unifLitterauxPlat
+from unification.martelli_montanari import MartelliMontanari
+from unification.utils.stores import TermSystem
+from jeux import generer_jeu, SIGNATURES_JEUX
+
+
+# Comparaison mémoire / latence des termes internés (hash-consing) et des termes construits à chaque appel,
+# et débit (opérations par seconde) des opérations usuelles sur les termes.
+
+
+def _mesurer(litteraux_str: List[str], internement: bool) -> Dict[str, float]:
+    """
+    Construit les littéraux avec ou sans internement puis mesure :
+      - la mémoire occupée par les littéraux (tracemalloc),
+      - le temps de parsing,
+      - le temps de construction d'un ensemble (hash) et de recherche dans cet ensemble (hash + égalité),
+      - le temps de comparaison deux à deux de deux copies du jeu (égalité).
+    """
+    FabriqueDeTermes.internement = internement
+    gc.collect()
+
+    # --- Mémoire ---
+    tracemalloc.start()
+    litteraux = [Litteral.from_string(s) for s in litteraux_str]
+    memoire, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del litteraux
+    gc.collect()
+
+    # --- Latences (hors tracemalloc) ---
+    debut = time.perf_counter()
+    litteraux = [Litteral.from_string(s) for s in litteraux_str]
+    tps_parsing = time.perf_counter() - debut
+
+    copie = [Litteral.from_string(s) for s in litteraux_str]
+
+    debut = time.perf_counter()
+    ensemble = set(litteraux)
+    tps_ensemble = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    trouves = sum(1 for litteral in copie if litteral in ensemble)
+    tps_recherche = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    egaux = sum(1 for l1, l2 in zip(litteraux, copie) if l1 == l2)
+    tps_egalite = time.perf_counter() - debut
+
+    assert trouves == len(copie) and egaux == len(copie)
+
+    return {
+        "memoire_Mo": memoire / (1024 * 1024),
+        "octets_par_litteral": memoire / len(litteraux_str),
+        "parsing_s": tps_parsing,
+        "ensemble_s": tps_ensemble,
+        "recherche_s": tps_recherche,
+        "egalite_s": tps_egalite,
+    }
+
+
+def comparer(jeux: List[str], n: int) -> None:
+    print(f"{'Jeu':<6} {'Internement':<12} {'Mémoire (Mo)':>13} {'o/littéral':>11} {'Parsing (s)':>12} "
+          f"{'set() (s)':>10} {'in (s)':>9} {'== (s)':>9}")
+    for nom_jeu in jeux:
+        litteraux_str = generer_jeu(nom_jeu, n)
+        for internement in (False, True):
+            m = _mesurer(litteraux_str, internement)
+            print(f"{nom_jeu:<6} {str(internement):<12} {m['memoire_Mo']:>13.2f} {m['octets_par_litteral']:>11.0f} "
+                  f"{m['parsing_s']:>12.4f} {m['ensemble_s']:>10.4f} {m['recherche_s']:>9.4f} {m['egalite_s']:>9.4f}")
+    FabriqueDeTermes.internement = True
+
+
+def _debit(operation, elements) -> float:
+    """Nombre d'appels de `operation` par seconde sur `elements`."""
+    debut = time.perf_counter()
+    for element in elements:
+        operation(element)
+    duree = time.perf_counter() - debut
+    return len(elements) / duree if duree > 0 else float("inf")
+
+
+def mesurer_operations(nom_jeu: str, n: int) -> Dict[str, float]:
+    """
+    Mesure, pour un jeu, la mémoire par littéral et le débit des opérations qui lisent
+    les métadonnées des termes (hash, occurs check, application de substitution, variables,
+    unification de littéraux).
+    """
+    litteraux_str = generer_jeu(nom_jeu, n)
+    gc.collect()
+
+    tracemalloc.start()
+    litteraux = [Litteral.from_string(s) for s in litteraux_str]
+    memoire, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    termes = [terme for litteral in litteraux for terme in litteral.enfants]
+    X = FabriqueDeTermes.creer_var("X")
+    subst = {"X": FabriqueDeTermes.creer_cons("a"), "Y": FabriqueDeTermes.creer_fonc("f", 1, [X])}
+    mm = MartelliMontanari(TermSystem())
+    paires = list(zip(litteraux[::2], litteraux[1::2]))
+    for litteral in litteraux:
+        litteral.plat  # encodage plat mis en cache hors mesure
+
+    return {
+        "octets_par_litteral": memoire / len(litteraux),
+        "hash_ops": _debit(lambda t: hash(t), termes),
+        "occurs_check_ops": _debit(lambda t: occurs_check("X", t, subst), termes),
+        "apply_subst_ops": _debit(lambda t: apply_subst(t, subst), termes),
+        "get_variables_ops": _debit(mm.get_variables, termes),
+        "unif_litteraux_ops": _debit(lambda p: unifLitteraux(p[0], p[1]), paires),
+        "unif_plat_ops": _debit(lambda p: unifLitterauxPlat(p[0], p[1]), paires),
+    }
+
+
+def comparer_operations(jeux: List[str], n: int, fichier_csv: str = None) -> None:
+    """Affiche (et écrit éventuellement en CSV) les mesures de `mesurer_operations` pour chaque jeu."""
+    colonnes = ["octets_par_litteral", "hash_ops", "occurs_check_ops", "apply_subst_ops", "get_variables_ops", "unif_litteraux_ops", "unif_plat_ops"]
+    print(f"{'Jeu':<6} " + " ".join(f"{c:>19}" for c in colonnes))
+    lignes = []
+    for nom_jeu in jeux:
+        m = mesurer_operations(nom_jeu, n)
+        lignes.append([nom_jeu] + [round(m[c], 1) for c in colonnes])
+        print(f"{nom_jeu:<6} " + " ".join(f"{m[c]:>19.0f}" for c in colonnes))
+
+    if fichier_csv is not None:
+        with open(fichier_csv, mode="w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Jeu"] + colonnes)
+            writer.writerows(lignes)
+
+
+if __name__ == "__main__":
+    # Usage : python benchmark_termes.py [internement|operations] [n] [jeu1 jeu4 ...] [--csv fichier]
+    #   internement : mémoire et latences avec/sans internement
+    #   operations  : octets par littéral et opérations par seconde (à lancer sur deux révisions pour comparer)
+    args = sys.argv[1:]
+    fichier_csv = None
+    if "--csv" in args:
+        i = args.index("--csv")
+        fichier_csv = args[i + 1]
+        del args[i:i + 2]
+    mode = args[0] if args else "internement"
+    n = int(args[1]) if len(args) > 1 else 10_000
+    if mode == "operations":
+        jeux = args[2:] if len(args) > 2 else list(SIGNATURES_JEUX.keys())
+        comparer_operations(jeux, n, fichier_csv)
+    else:
+        jeux = args[2:] if len(args) > 2 else ["jeu1", "jeu4", "jeu7", "jeu10", "jeu13", "jeu16"]
+        comparer(jeux, n)
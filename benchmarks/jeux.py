@@ -0,0 +1,41 @@
+import random
+from typing import Dict, List, Tuple
+
+from unification.utils.logique.litteral import GenerateurLitteralAleatoire
+
+
+# Signatures des jeux de données (cf. generation.py) : (prédicats, arité max, profondeur max, nombre de littéraux)
+SIGNATURES_JEUX: Dict[str, Tuple[List[str], int, int, int]] = {}
+
+_PREDICATS_PQR = ["P", "Q", "R"]
+_PREDICATS_PQRSTU = ["P", "Q", "R", "S", "T", "U"]
+_PROFONDEURS = [1, 5, 10, 20]
+_TAILLES = [10_000, 100_000, 1_000_000]
+
+_numero = 1
+for _predicats in (_PREDICATS_PQR, _PREDICATS_PQRSTU):
+    for _profondeur in _PROFONDEURS:
+        for _taille in _TAILLES:
+            SIGNATURES_JEUX[f"jeu{_numero}"] = (_predicats, 10, _profondeur, _taille)
+            _numero += 1
+
+
+def generer_jeu(nom_jeu: str, n: int = None, graine: int = 0) -> List[str]:
+    """
+    Génère (sous forme de chaînes) un jeu de données ayant la même signature que `nom_jeu`.
+
+    On travaille sur des chaînes pour pouvoir reconstruire les littéraux dans différentes
+    configurations (internement activé ou non, etc.) à partir des mêmes données.
+
+    Args:
+        nom_jeu (str)   : Nom du jeu ("jeu1" ... "jeu24").
+        n       (int)   : Nombre de littéraux, la taille du jeu d'origine par défaut.
+        graine  (int)   : Graine d'un générateur aléatoire local (arités des fonctions comprises), pour rejouer
+                          les mêmes données sans toucher à l'état du module random.
+
+    Returns:
+        List[str]       : Les littéraux générés.
+    """
+    predicats, arite, profondeur, taille = SIGNATURES_JEUX[nom_jeu]
+    generateur = GenerateurLitteralAleatoire(predicats, arite, profondeur, alea=random.Random(graine))
+    return [str(litteral) for litteral in generateur.generer_litteraux(n if n is not None else taille)]
@@ -5,6 +5,20 @@ GREEN='\033[0;32m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+# Politique d'occurs check : toujours (défaut), differe ou jamais (ex : OCCURS=differe ./run_benchmarks.sh)
+OCCURS=${OCCURS:-toujours}
+
+# Politiques acceptées par chaque algo (cf. POLITIQUES_ALGOS dans benchmark.py).
+# robinson_uf, robinson_plat et pw n'ont pas de politique ("n/a") : ils ne sont mesurés qu'avec OCCURS=toujours,
+# pour ne pas répéter les mêmes mesures à chaque campagne.
+politiques_algo() {
+    case "$1" in
+        robinson|mm|arbre|arbre_substitution) echo "toujours differe jamais" ;;
+        mm_multi) echo "toujours differe" ;;
+        *) echo "n/a" ;;
+    esac
+}
+
 echo -e "${BLUE}========================================================${NC}"
 echo -e "${BLUE}   LANCEMENT DE LA CAMPAGNE DE BENCHMARK AUTOMATISEE   ${NC}"
 echo -e "${BLUE}========================================================${NC}"
@@ -15,13 +29,23 @@ do
     jeu="jeu$j"
     
     # Liste des algorithmes à tester
-    for algo in "robinson" "mm" "arbre"
+    for algo in "robinson" "robinson_uf" "robinson_plat" "mm" "mm_multi" "pw" "arbre" "arbre_substitution"
     do
+        politiques=$(politiques_algo "$algo")
+        if [ "$politiques" == "n/a" ] && [ "$OCCURS" != "toujours" ]; then
+            echo -e "${BLUE}--- $algo ignoré : pas de politique d'occurs check (mesuré avec OCCURS=toujours)${NC}"
+            continue
+        fi
+        if [ "$politiques" != "n/a" ] && [[ " $politiques " != *" $OCCURS "* ]]; then
+            echo -e "${BLUE}--- $algo ignoré : Occurs=$OCCURS non supporté (attendu : $politiques)${NC}"
+            continue
+        fi
+
         # Configuration des structures
-        if [ "$algo" == "arbre" ]; then
+        if [ "$algo" == "arbre" ] || [ "$algo" == "arbre_substitution" ]; then
             structures=("unique")
         else
-            structures=("liste" "dictionnaire" "ensemble")
+            structures=("liste" "dictionnaire" "ensemble" "chemins")
         fi 
 
         for struct in "${structures[@]}"
@@ -29,7 +53,7 @@ do
             # Test avec touteUnif = True puis False
             for unif in "true" "false"
             do
-                echo -e "${GREEN}>>> Test en cours : $jeu | $algo | $struct | TouteUnif=$unif${NC}"
+                echo -e "${GREEN}>>> Test en cours : $jeu | $algo | $struct | TouteUnif=$unif | Occurs=$OCCURS${NC}"
                 
                 # Répétition 10 fois
                 for i in {1..10}
@@ -38,7 +62,7 @@ do
                     ./clean_pycache.sh > /dev/null
                     
                     # Lancement du script python (on ajoute $i pour l'itération)
-                    python3 benchmark.py "$jeu" "$algo" "$struct" "$unif" "$i"
+                    python3 benchmark.py "$jeu" "$algo" "$struct" "$unif" "$i" "$OCCURS"
                 done
             done
         done
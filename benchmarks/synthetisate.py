@@ -17,7 +17,10 @@ def synthetiser_csv(fichier_entree, fichier_sortie):
         reader = csv.DictReader(f_in)
         for row in reader:
             # Notre clé unique pour grouper les 10 itérations
-            cle = (row['Jeu'], row['Algo'], row['Structure'], row['TouteUnif'])
+            # (les fichiers antérieurs à la colonne Occurs ont été mesurés avec l'occurs check à chaque liaison ;
+            # une ligne à 11 valeurs sous un ancien en-tête à 10 colonnes a sa politique sous la clé None)
+            occurs = row.get('Occurs') or (row.get(None) or ["toujours"])[0]
+            cle = (row['Jeu'], row['Algo'], row['Structure'], row['TouteUnif'], occurs)
             
             # Extraction des données numériques
             tps_pre = float(row['Temps_Pretraitement'])
@@ -41,7 +44,7 @@ def synthetiser_csv(fichier_entree, fichier_sortie):
         
         # Nouvel en-tête avec les colonnes demandées (+ les unifications)
         writer.writerow([
-            "Jeu", "Algo", "Structure", "TouteUnif",
+            "Jeu", "Algo", "Structure", "TouteUnif", "Occurs",
             "Temps_Pretraitement_Moyen(s)", "Temps_Unification_Moyen(s)", 
             "Temps_Total_Moyen(s)", "RAM_Pic_Moyen(Mo)", "CPU_Moyen(%)"
         ])
@@ -57,7 +60,7 @@ def synthetiser_csv(fichier_entree, fichier_sortie):
             moy_cpu = sum(m['cpu'] for m in mesures) / nb_mesures
             # Écriture de la ligne consolidée
             writer.writerow([
-                cle[0], cle[1], cle[2], cle[3], # Jeu, Algo, Structure, TouteUnif
+                cle[0], cle[1], cle[2], cle[3], cle[4], # Jeu, Algo, Structure, TouteUnif, Occurs
                 round(moy_tps_pre, 6),
                 round(moy_tps_unif, 6),
                 round(moy_tps_tot, 6),
@@ -69,7 +72,7 @@ def synthetiser_csv(fichier_entree, fichier_sortie):
 
 
 if __name__ == "__main__":
-    fichiers_a_traiter = ["brut_arbre.csv", "brut_robinson.csv", "brut_mm.csv"]
+    fichiers_a_traiter = ["brut_arbre.csv", "brut_arbre_substitution.csv", "brut_robinson.csv", "brut_robinson_uf.csv", "brut_robinson_plat.csv", "brut_mm.csv", "brut_mm_multi.csv", "brut_pw.csv"]
     
     for brut in fichiers_a_traiter:
         synthese = brut.replace("brut_", "synthese_")
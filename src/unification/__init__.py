@@ -1,6 +1,11 @@
-from .robinson import rechercherUnifiablesOptimise, rechercherUnifiablesSimple, unifLitteraux, unify, unifyAll, unifyMax, afficher
-from .martelli_montanari import MartelliMontanari, UnificationError, traiterLitteraux, traiterLitterauxDict, traiterLitterauxSet, indexer
+from .robinson import rechercherUnifiablesOptimise, rechercherUnifiablesSimple, rechercherUnifiablesIter, unifLitteraux, unify, unifyAll, unifyMax, afficher, unifyUF, unifyAllUF, unifLitterauxUF, unifier_lot, filtrer, filtrerLitteraux, rechercherInstances, rechercherGeneralisations
+from .robinson_plat import unifLitterauxPlat, unifier_plats
+from .compilateur import compiler
+from .martelli_montanari import MartelliMontanari, MartelliMontanariMultiEquations, UnificationError, TypeEchec, traiterLitteraux, traiterLitterauxDict, traiterLitterauxSet, indexer
+from .paterson_wegman import PatersonWegman, unifLitterauxPW
 from .discrimination_tree import ArbreDeDiscrimination, benchmark_arbre_discrimination
-from .utils.stores import DictStore, ListStore, SetStore
+from .substitution_tree import ArbreDeSubstitution, benchmark_arbre_substitution
+from .utils.stores import DictStore, ListStore, SetStore, PathIndexStore
+from .utils.logique.substitution import Substitution, SubstitutionSimultanee, OCCURS_TOUJOURS, OCCURS_DIFFERE, OCCURS_JAMAIS
 
-__all__ = ["rechercherUnifiablesSimple", "rechercherUnifiablesOptimise", "MartelliMontanari", "UnificationError", "traiterLitteraux", "traiterLitterauxSet", "traiterLitterauxDict", "ArbreDeDiscrimination", "DictStore", "ListStore", "SetStore", "unifLitteraux", "unify", "unifyAll", "unifyMax", "afficher", "indexer", "benchmark_arbre_discrimination"]
\ No newline at end of file
+__all__ = ["rechercherUnifiablesSimple", "rechercherUnifiablesOptimise", "rechercherUnifiablesIter", "MartelliMontanari", "MartelliMontanariMultiEquations", "UnificationError", "TypeEchec", "PatersonWegman", "unifLitterauxPW", "traiterLitteraux", "traiterLitterauxSet", "traiterLitterauxDict", "ArbreDeDiscrimination", "ArbreDeSubstitution", "DictStore", "ListStore", "SetStore", "PathIndexStore", "Substitution", "SubstitutionSimultanee", "OCCURS_TOUJOURS", "OCCURS_DIFFERE", "OCCURS_JAMAIS", "unifLitteraux", "unifLitterauxPlat", "unifier_plats", "unify", "unifyAll", "unifyMax", "unifyUF", "unifyAllUF", "unifLitterauxUF", "unifier_lot", "filtrer", "filtrerLitteraux", "rechercherInstances", "rechercherGeneralisations", "compiler", "afficher", "indexer", "benchmark_arbre_discrimination", "benchmark_arbre_substitution"]
\ No newline at end of file
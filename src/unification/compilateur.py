@@ -0,0 +1,185 @@
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from unification.utils.logique.terme import NoeudTerme, ETIQUETTE_VAR
+from unification.utils.logique.litteral import Litteral
+from unification.utils.logique.substitution import Substitution, contient_cycle, verifier_politique, OCCURS_TOUJOURS, OCCURS_DIFFERE
+from unification.utils.stores import Equation, ListStore
+from unification.robinson import occurs_check, _resoudre
+
+
+"""
+Compilation d'une requête en filtre spécialisé (même idée que la WAM ou les arbres de code).
+
+Pour une requête P(f(X), a, X), on génère (compile/exec) une fonction qui teste un candidat en ligne
+droite, sans parcourir la requête :
+
+    def filtre(r, vs, candidat):
+        if candidat.sign == True or candidat.symbole != 17: return None
+        e0, e1, e2 = candidat.enfants
+        subst = Substitution(); residus = []
+        if e0.etiquette == VAR: residus.append((r[0], e0))      # variable du candidat : équation résiduelle
+        elif e0.symbole != 12: return None                      # clash en tête
+        else:
+            e0_0, = e0.enfants
+            ...                                                 # première occurrence de X : liaison directe
+        ...
+        if residus: ...                                         # le reste est résolu par robinson._resoudre
+
+Le code ne dépend que de la forme de la requête (symboles, positions des variables), pas des noms
+de ses variables ni de l'intérieur de ses sous-termes clos (seul leur symbole de tête compte) : il est
+mis en cache par forme, et une requête de même forme ne coûte que le calcul de sa clé. Le cache garde
+au plus TAILLE_CACHE fonctions : au-delà, la forme utilisée le moins récemment est oubliée (LRU), et
+sera recompilée si elle revient.
+La politique d'occurs check fait partie de la clé : sans OCCURS_TOUJOURS, les liaisons directes ne sont
+pas vérifiées (et avec OCCURS_DIFFERE, un seul contient_cycle est fait sur la substitution finale).
+
+Les variables de même nom dans la requête et le candidat sont la même variable (pas de renommage),
+comme pour unifLitteraux : la substitution obtenue est un MGU de la requête et du candidat.
+"""
+
+
+Filtre = Callable[[Litteral], Optional[Substitution]]
+
+# Fonctions générées, par forme de requête (de la moins à la plus récemment utilisée), au plus TAILLE_CACHE
+TAILLE_CACHE = 1024
+_CODES: "OrderedDict[tuple, Callable]" = OrderedDict()
+
+
+def _forme(terme: NoeudTerme, variables: Dict[str, int], noeuds: List[NoeudTerme]) -> tuple:
+    """
+    Clé de forme d'un argument : ("v", k) pour la k-ième variable rencontrée (son noeud est ajouté à `noeuds`),
+    ("c", symbole) pour un terme clos, ("f", symbole, enfants) sinon.
+    """
+    if terme.etiquette == ETIQUETTE_VAR:
+        k = variables.get(terme.nom)
+        if k is None:
+            k = variables[terme.nom] = len(noeuds)
+            noeuds.append(terme)
+        return ("v", k)
+    if terme.est_clos:
+        return ("c", terme.symbole)
+    return ("f", terme.symbole, tuple(_forme(enfant, variables, noeuds) for enfant in terme.enfants))
+
+
+class _Generateur:
+    """Écrit le source de la fonction filtre pour une forme de requête."""
+
+    def __init__(self, occurs: str = OCCURS_TOUJOURS):
+        self.occurs = occurs
+        self.lignes: List[str] = []
+        self.vues: set = set() # Variables de la requête déjà rencontrées dans l'ordre du code
+
+    def emettre(self, niveau: int, texte: str) -> None:
+        self.lignes.append("    " * niveau + texte)
+
+    def argument(self, forme: tuple, requete: str, candidat: str, niveau: int) -> None:
+        """
+        Code qui unifie le sous-terme `requete` (expression sur r) avec le sous-terme `candidat` (nom local).
+        """
+        genre = forme[0]
+        if genre == "v":
+            k = forme[1]
+            premiere = k not in self.vues
+            self.vues.add(k)
+            # Variable du candidat : rien à faire si c'est X, liaison directe si les deux sont libres,
+            # sinon (variable liée, dont il faut suivre la chaîne) laissé à la résolution
+            self.emettre(niveau, f"if {candidat}.etiquette == VAR:")
+            self.emettre(niveau + 1, f"if {candidat}.nom != n{k}:")
+            lie = f"{candidat}.nom in subst" if premiere else f"n{k} in subst or {candidat}.nom in subst"
+            self.emettre(niveau + 2, f"if {lie}: residus.append(({requete}, {candidat}))")
+            self.emettre(niveau + 2, f"else: subst[n{k}] = {candidat}")
+            if not premiere:
+                # Occurrence suivante (la première a pu être sautée) : lier ou comparer
+                self.emettre(niveau, f"elif n{k} in subst: residus.append(({requete}, {candidat}))")
+            # (à la première occurrence dans l'ordre du code, X n'a pas pu être lié avant)
+            if self.occurs == OCCURS_TOUJOURS:
+                self.emettre(niveau, f"elif not {candidat}.est_clos and occurs_check(n{k}, {candidat}, subst): return None")
+            self.emettre(niveau, f"else: subst[n{k}] = {candidat}")
+            return
+
+        symbole = forme[1]
+        if genre == "c":
+            # Sous-terme clos de la requête : identité pour des termes internés, sinon décomposé à la résolution
+            self.emettre(niveau, f"if {candidat} is not {requete}:")
+            self.emettre(niveau + 1, f"if {candidat}.etiquette == VAR: residus.append(({requete}, {candidat}))")
+            self.emettre(niveau + 1, f"elif {candidat}.symbole != {symbole}: return None")
+            self.emettre(niveau + 1, f"elif {candidat}.est_clos and {candidat}.est_interne and {requete}.est_interne: return None")
+            self.emettre(niveau + 1, f"else: residus.append(({requete}, {candidat}))")
+            return
+
+        enfants = forme[2]
+        self.emettre(niveau, f"if {candidat}.etiquette == VAR: residus.append(({requete}, {candidat}))")
+        self.emettre(niveau, f"elif {candidat}.symbole != {symbole}: return None")
+        self.emettre(niveau, "else:")
+        noms = [f"{candidat}_{i}" for i in range(len(enfants))]
+        self.emettre(niveau + 1, f"{', '.join(noms)}, = {candidat}.enfants")
+        for i, (forme_enfant, nom) in enumerate(zip(enfants, noms)):
+            self.argument(forme_enfant, f"{requete}.enfants[{i}]", nom, niveau + 1)
+
+    def fonction(self, cle: tuple) -> str:
+        sign, symbole, formes, nb_variables, _ = cle
+        self.emettre(0, "def filtre(r, vs, candidat):")
+        self.emettre(1, f"if candidat.sign == {sign} or candidat.symbole != {symbole}: return None")
+        if nb_variables:
+            self.emettre(1, f"{''.join(f'V{k}, ' for k in range(nb_variables))}= vs")
+            for k in range(nb_variables):
+                self.emettre(1, f"n{k} = V{k}.nom")
+        self.emettre(1, "subst = Substitution()")
+        self.emettre(1, "residus = []")
+        if formes:
+            noms = [f"e{i}" for i in range(len(formes))]
+            self.emettre(1, f"{', '.join(noms)}, = candidat.enfants")
+            for i, (forme, nom) in enumerate(zip(formes, noms)):
+                self.argument(forme, f"r[{i}]", nom, 1)
+        self.emettre(1, "if residus:")
+        self.emettre(2, "store = ListStore()")
+        self.emettre(2, "for gauche, droite in reversed(residus): store.push(Equation(gauche, droite))")
+        self.emettre(2, f"return _resoudre(store, subst, None, {self.occurs!r})")
+        if self.occurs == OCCURS_DIFFERE:
+            self.emettre(1, "if contient_cycle(subst): return None")
+        self.emettre(1, "return subst")
+        return "\n".join(self.lignes)
+
+
+def source(requete: Litteral, occurs: str = OCCURS_TOUJOURS) -> str:
+    """Source Python du filtre de la requête (pour le débogage)."""
+    return _Generateur(occurs).fonction(_cle(requete, occurs)[0])
+
+
+def _cle(requete: Litteral, occurs: str) -> Tuple[tuple, Tuple[NoeudTerme, ...]]:
+    """Clé de forme de la requête (avec la politique d'occurs check), et ses variables dans l'ordre de leur numéro."""
+    variables: Dict[str, int] = {}
+    noeuds: List[NoeudTerme] = []
+    formes = tuple(_forme(enfant, variables, noeuds) for enfant in requete.enfants)
+    return (requete.sign, requete.symbole, formes, len(noeuds), occurs), tuple(noeuds)
+
+
+def compiler(requete: Litteral, occurs: str = OCCURS_TOUJOURS) -> Filtre:
+    """
+    Compile la requête en un filtre : candidat -> substitution (MGU triangulaire) ou None,
+    avec le même contrat que robinson.unifLitteraux(requete, candidat, occurs).
+
+    Example:
+        >>> filtre = compiler(Litteral.from_string("P(f(X), a, X)"))
+        >>> filtre(Litteral.from_string("¬P(f(b), a, b)"))
+        {'X': b}
+        >>> filtre(Litteral.from_string("¬P(f(b), a, c)")) is None
+        True
+    """
+    cle, vs = _cle(requete, occurs)
+    code = _CODES.get(cle)
+    if code is not None:
+        _CODES.move_to_end(cle)
+    else:
+        verifier_politique(occurs)
+        espace = {"Substitution": Substitution, "ListStore": ListStore, "Equation": Equation,
+                  "occurs_check": occurs_check, "contient_cycle": contient_cycle, "_resoudre": _resoudre, "VAR": ETIQUETTE_VAR}
+        exec(compile(_Generateur(occurs).fonction(cle), f"<filtre {requete}>", "exec"), espace)
+        code = espace["filtre"]
+        _CODES[cle] = code
+        while len(_CODES) > TAILLE_CACHE:
+            _CODES.popitem(last=False)
+
+    return partial(code, requete.enfants, vs)
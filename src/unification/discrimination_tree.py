@@ -1,18 +1,24 @@
 import time
 import gc
 
-from unification.utils.logique.terme import NoeudTerme, ETIQUETTE_CONS, ETIQUETTE_VAR
 from unification.utils.logique.litteral import Litteral
-from typing import List, Dict, Any, Optional, Tuple, NamedTuple
+from unification.utils.logique.signature import SIGNATURE, GENRE_SIGNE
+from unification.utils.logique.substitution import Substitution, verifier_politique, OCCURS_TOUJOURS
+from unification.compilateur import compiler
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple, Callable, Iterator
 
 
-# Normalisation différente selon si var dans l'arbre ou dans le terme recherché 
-NORM_VAR_ARBRE = "*"    # Exemple :  f(X, Y) -> ['f', '*1', '*2']
-NORM_VAR_REQUETE = "?"  # Exemple :  f(X, Y) -> ['f', '?1', '?2']
+# Les séquences (et les clés de l'arbre) sont des entiers :
+#   - symboles (prédicats, fonctions, constantes) : identifiant dans la table des symboles (>= 0),
+#   - variables normalisées : -1, -2, ... dans l'ordre de première apparition (cf. Litteral.plat).
+# Exemple :  f(X, Y) -> [f, -1, -2]
+NORM_VAR_ARBRE = "*"    # Préfixe d'affichage des variables normalisées : -1 s'affiche *1
 
 # Préfixe pour signe prédicat
 SYMBOLE_PREDICAT_POSITIF = "+"
 SYMBOLE_PREDICAT_NEGATIF = "¬"
+CODE_PREDICAT_POSITIF = SIGNATURE.identifiant(SYMBOLE_PREDICAT_POSITIF, GENRE_SIGNE)
+CODE_PREDICAT_NEGATIF = SIGNATURE.identifiant(SYMBOLE_PREDICAT_NEGATIF, GENRE_SIGNE)
 
 # Types ========================================================
 
@@ -26,12 +32,12 @@ class ResultatRecherche(NamedTuple):
     Résultat d'une recherche de termes unifiables dans l'arbre de discrimination.
 
     Attributes:
-        substitution    (Dict[str, NoeudTerme])     :   Substitution associant les noms des varibales originaux
-                                                            du terme de recherche à leur séquence de symboles en notation préfixe.
+        substitution    (Substitution)              :   Substitution (triangulaire) associant les noms des varibales originaux
+                                                            à leur terme lié. Substitution.resolve donne le terme développé.
         pointeurs       (List[Any])                 :   Pointeurs associés au terme unifiable trouvé dans l'arbre    
 
     """
-    substitution: Dict[str, NoeudTerme]
+    substitution: Substitution
     pointeurs: List[Any]
 
 class PointeurFeuille(NamedTuple):
@@ -53,14 +59,14 @@ class NoeudArbreDeDiscrimination:
     Classe d'un noeud dans l'arbre de discrimination.
 
     Attributes:
-        symbole     (Optional[str])                             :   Symbole représentant le noeud (ex : X, f, a, etc.). 
-                                                                    'None' pour le noeud racine.
-        enfants     (Dict[str, 'NoeudArbreDeDiscrimination'])   :   Noeuds enfants, indexés par leur symbole.
+        symbole     (Optional[int])                             :   Symbole représentant le noeud (identifiant de f, a, etc.
+                                                                    ou -k pour la k-ième variable). 'None' pour le noeud racine.
+        enfants     (Dict[int, 'NoeudArbreDeDiscrimination'])   :   Noeuds enfants, indexés par leur symbole.
         pointeurs   (List[PointeurFeuille])                     :   Pointeurs vers les termes associés à ce noeud.
     """
-    def __init__(self, symbole: Optional[str] = None) -> None:
+    def __init__(self, symbole: Optional[int] = None) -> None:
         self.symbole = symbole # Symbole du noeud (None pour la racine)
-        self.enfants: Dict[str, NoeudArbreDeDiscrimination] = {}
+        self.enfants: Dict[int, NoeudArbreDeDiscrimination] = {}
         self.pointeurs: List[PointeurFeuille] = []
         self._pointeurs_ids: set = set()
 
@@ -77,12 +83,19 @@ class ArbreDeDiscrimination:
     
     Attributes:
         racine ('NoeudArbreDeDiscrimination')   :   Noeud racine de l'arbre. 'None' par défaut
-        arites (Dict[str, int])                 :   Dictionnaire pour stocker l'arité de chaque symbole dans l'arbre
+        unificateur (Callable)                  :   Unification des candidats (Litteral, Litteral) -> substitution ou None.
+                                                    Par défaut, la requête compilée en filtre (cf. compilateur.py).
+        occurs (str)                            :   Politique d'occurs check du filtre compilé (cf. substitution.py).
     """
     
-    def __init__(self) -> None:
+    def __init__(self, unificateur: Optional[Callable[[Litteral, Litteral], Optional[Substitution]]] = None,
+                 occurs: str = OCCURS_TOUJOURS) -> None:
         self.racine = NoeudArbreDeDiscrimination()
-        self.arites: Dict[str, int] = {} # Stocker les arités de tous les symboles
+        # Les arités sont lues dans la table globale des symboles (SIGNATURE.arites)
+        self.unificateur = unificateur
+        self.occurs = verifier_politique(occurs)
+        self._requete_compilee: Optional[Litteral] = None # Dernière requête compilée, et son filtre
+        self._filtre: Optional[Callable[[Litteral], Optional[Substitution]]] = None
 
     # Insertion ----------------------------------------------------
 
@@ -99,9 +112,8 @@ class ArbreDeDiscrimination:
         """
 
         # Mise à plat du terme en une séquence de symboles issue d'un parcours préfixe
-        # On normalise aussi les variables  :
-        var_map: Dict[str, str] = {}
-        predicat_mis_a_plat = self._mise_a_plat_predicat(predicat, var_map, NORM_VAR_ARBRE)
+        # (variables normalisées) :
+        predicat_mis_a_plat = self._mise_a_plat_predicat(predicat)
         
         # Insertion dans l'arbre :
         noeud_courant = self.racine
@@ -130,381 +142,155 @@ class ArbreDeDiscrimination:
         Returns:
             List[ResultatRecherche] :   Liste des résultats (comprenant donc pointeur et substitution)
         """
-
-        # Mise à plat du terme recherché :
-        var_map: Dict[str, str] = {}
-        predicat_mis_a_plat = self._mise_a_plat_predicat(predicat, var_map, NORM_VAR_REQUETE)
-        
-        # Cache local
-        cache_profondeur: Dict[int, int] = {}
-        def profondeur_cached(index: int) -> int:
-            if index not in cache_profondeur:
-                cache_profondeur[index] = self._calculer_profondeur_depuis_index(
-                    index, predicat_mis_a_plat, profondeur_cached
-                )
-            return cache_profondeur[index]
-
-        # Phase de filtrage :
-        # On cherche juste les chemins valide par rapport au terme demandé
-        candidats: List[PointeurFeuille] = []
-        self._collecter_candidats(self.racine, predicat_mis_a_plat, 0, candidats, profondeur_cached)
-
-        # Phase d'unification :
-        # C'est ici qu'on valide les substitutions trouvées par la phase de filtrage
-        resultats = []
-        for pointeur in candidats:
-            substitution = self._unifier_predicats(predicat, pointeur.predicat)
-            if substitution is not None:
-                resultats.append(ResultatRecherche(
-                    substitution=substitution,
-                    pointeurs=[pointeur.pointeur]
-                ))
-        
-        return resultats
+        return list(self.rechercher_iter(predicat))
     
     def rechercher_une(self, predicat: Litteral) -> Optional[ResultatRecherche]:
         """
         Recherche le premier prédicat unifiable trouvé avec le prédicat donné dans l'arbre de discrimination.
-        
-        On retourne la substitution ainsi que le pointeur associé.
-        Ainsi on sait comment instancier les variables afin de réaliser l'unification.
-
-        TODO peut-etre modifier parce que filtre tous les candidats quand meme
-        idée : alterner pour cette fonction filtre et unif pour chaque candidat ?
+        Le filtrage et l'unification alternent (cf. rechercher_iter) : on s'arrête au premier candidat unifiable.
 
         Args:
             predicat    (Litteral)  :   Le prédicat que l'on souhaite unifier à notre arbre.
         Returns:
-            ResultatRecherche :  Résultat (comprenant donc pointeur et substitution)
+            ResultatRecherche :  Résultat (comprenant donc pointeur et substitution), None si aucun
         """
+        return next(self.rechercher_iter(predicat, 1), None)
 
-        # Mise à plat du terme recherché :
-        var_map: Dict[str, str] = {}
-        predicat_mis_a_plat = self._mise_a_plat_predicat(predicat, var_map, NORM_VAR_REQUETE)
-        
-        # Cache local
-        cache_profondeur: Dict[int, int] = {}
-        def profondeur_cached(index: int) -> int:
-            if index not in cache_profondeur:
-                cache_profondeur[index] = self._calculer_profondeur_depuis_index(
-                    index, predicat_mis_a_plat, profondeur_cached
-                )
-            return cache_profondeur[index]
-
-        
-        # Phase de filtrage :
-        # On cherche juste les chemins valide par rapport au terme demandé
-        candidats: List[PointeurFeuille] = []
-        resultat = self._filtrage_unif(predicat, self.racine, predicat_mis_a_plat, 0, candidats, profondeur_cached)
-        self._collecter_candidats(self.racine, predicat_mis_a_plat, 0, candidats, profondeur_cached)
-
-        # Phase d'unification :
-        # C'est ici qu'on valide les substitutions trouvées par la phase de filtrage
-        for pointeur in candidats:
-            substitution = self._unifier_predicats(predicat, pointeur.predicat)
-            if substitution is not None:
-                return ResultatRecherche(
-                    substitution=substitution,
-                    pointeurs=[pointeur.pointeur]
-                )
-    
-    # Filtrage ----------------------------------------------------
-    
-    def _collecter_candidats(self, noeud: NoeudArbreDeDiscrimination, sequence: List[str], index: int, candidats: List[PointeurFeuille], fn_profondeur) -> None:
+    def rechercher_iter(self, predicat: Litteral, limite: Optional[int] = None) -> Iterator[ResultatRecherche]:
         """
-        Parcours de l'arbre pour collecter les candidats potentiellement unifiable.
-        Filtre grossier en ignorant les contraintes d'unification qui seront vérifiées en phase d'unification.
+        Comme rechercher, mais les résultats sont produits au fur et à mesure : l'arbre n'est parcouru
+        que jusqu'au dernier résultat demandé.
 
         Args:
-            noeud       (NoeudArbreDeDiscrimination): Noeud courant
-            sequence    (List[str])                 : Séquence du terme mis à plat
-            index       (int)                       : Index du parcours
-            candidats   (List[PointeurFeuille])     : Listes des feuilles candidates à l'unification
+            predicat    (Litteral)      :   Le prédicat que l'on souhaite unifier à notre arbre.
+            limite      (Optional[int]) :   Nombre maximal de résultats (tous si None).
+        Yields:
+            ResultatRecherche           :   Résultats (comprenant donc pointeur et substitution), dans l'ordre de l'arbre
         """
-        # Si le parcours est fini :
-        if index >= len(sequence):
-            # On ajoute les feuilles aux candidats
-            candidats.extend(noeud.pointeurs)
+        if limite is not None and limite <= 0:
             return
-        
-        symbole_courant = sequence[index] # Récupération du symbole courant de la recherche
 
-        # Cas prédicat : on cherche signe opposé au signe courant
-        if symbole_courant in (SYMBOLE_PREDICAT_NEGATIF, SYMBOLE_PREDICAT_POSITIF):
-            oppose = SYMBOLE_PREDICAT_NEGATIF if symbole_courant == SYMBOLE_PREDICAT_POSITIF else SYMBOLE_PREDICAT_POSITIF
-            if oppose in noeud.enfants:
-                self._collecter_candidats(noeud.enfants[oppose], sequence, index + 1, candidats, fn_profondeur)
-            return
-        
-        # Cas 1 : les symboles sont identiques
-        if symbole_courant in noeud.enfants and not symbole_courant.startswith(NORM_VAR_REQUETE):
-            self._collecter_candidats(noeud.enfants[symbole_courant], sequence, index + 1, candidats, fn_profondeur)
-
-        # Cas 2 : variable dans la requête
-        if symbole_courant.startswith(NORM_VAR_REQUETE):
-            for enfant in noeud.enfants.values():
-                # On récupère les sous-terme :
-                for dernier_noeud in self._collecter_sous_termes(enfant, 1):
-                    # La variable peut s'unifier avec les sous-termes :
-                    self._collecter_candidats(dernier_noeud, sequence, index + 1, candidats, fn_profondeur)
-            return
-        
-        # Cas 3 : variable dans l'arbre
-        profondeur = fn_profondeur(index)
-        nouvel_index = index + profondeur
-        for symbole, enfant in noeud.enfants.items():
-            if symbole.startswith(NORM_VAR_ARBRE) and nouvel_index <= len(sequence):
-                self._collecter_candidats(enfant, sequence, nouvel_index, candidats, fn_profondeur)
-
-    def _filtrage_unif(self, predicat: Litteral, noeud: NoeudArbreDeDiscrimination, sequence: List[str], index: int, candidats: List[PointeurFeuille], fn_profondeur) -> Optional[ResultatRecherche]:
-        """
-        Parcours de l'arbre pour collecter les candidats potentiellement unifiable puis vérification instantanée.
+        # Mise à plat du terme recherché (avec la taille du sous-terme commençant à chaque position) :
+        tailles: List[int] = []
+        predicat_mis_a_plat = self._mise_a_plat_predicat(predicat, tailles)
 
-        Args:
-            predicat    (Litteral)                  : Le littéral à unifier
-            noeud       (NoeudArbreDeDiscrimination): Noeud courant
-            sequence    (List[str])                 : Séquence du terme mis à plat
-            index       (int)                       : Index du parcours
-            candidats   (List[PointeurFeuille])     : Listes des feuilles candidates à l'unification
-        """
-        # Si le parcours est fini :
-        if index >= len(sequence):
-            # Ici on test directement l'unification
-            for pointeur in noeud.pointeurs:
+        # Phase de filtrage (chemins valides par rapport au terme demandé), puis phase d'unification :
+        # c'est ici qu'on valide les substitutions trouvées par la phase de filtrage
+        trouves = 0
+        for pointeurs in self._feuilles_candidates(predicat_mis_a_plat, tailles.__getitem__):
+            for pointeur in pointeurs:
                 substitution = self._unifier_predicats(predicat, pointeur.predicat)
                 if substitution is not None:
-                    return ResultatRecherche(
+                    yield ResultatRecherche(
                         substitution=substitution,
                         pointeurs=[pointeur.pointeur]
                     )
-            return None
-        
-        symbole_courant = sequence[index] # Récupération du symbole courant de la recherche
-
-        # Cas prédicat : on cherche signe opposé au signe courant
-        if symbole_courant in (SYMBOLE_PREDICAT_NEGATIF, SYMBOLE_PREDICAT_POSITIF):
-            oppose = SYMBOLE_PREDICAT_NEGATIF if symbole_courant == SYMBOLE_PREDICAT_POSITIF else SYMBOLE_PREDICAT_POSITIF
-            if oppose in noeud.enfants:
-                self._filtrage_unif(predicat, noeud.enfants[oppose], sequence, index + 1, candidats, fn_profondeur)
-            return
-        
-        # Cas 1 : les symboles sont identiques
-        if symbole_courant in noeud.enfants and not symbole_courant.startswith(NORM_VAR_REQUETE):
-            self._filtrage_unif(predicat, noeud.enfants[symbole_courant], sequence, index + 1, candidats, fn_profondeur)
-
-        # Cas 2 : variable dans la requête
-        if symbole_courant.startswith(NORM_VAR_REQUETE):
-            for enfant in noeud.enfants.values():
-                # On récupère les sous-terme :
-                for dernier_noeud in self._collecter_sous_termes(enfant, 1):
-                    # La variable peut s'unifier avec les sous-termes :
-                    self._filtrage_unif(predicat, dernier_noeud, sequence, index + 1, candidats, fn_profondeur)
-            return
-        
-        # Cas 3 : variable dans l'arbre
-        profondeur = fn_profondeur(index)
-        nouvel_index = index + profondeur
-        for symbole, enfant in noeud.enfants.items():
-            if symbole.startswith(NORM_VAR_ARBRE) and nouvel_index <= len(sequence):
-                self._filtrage_unif(predicat, enfant, sequence, nouvel_index, candidats, fn_profondeur)
-
-    # Unification ----------------------------------------------------
-
-    def _unifier_predicats(self, predicat_recherche: Litteral, predicat_candidat: Litteral) -> Optional[Dict[str, NoeudTerme]]:
-        """
-        Surcouche de la fonction _unifier_termes pour les prédicats.
-        On fait maintenant partager la substitution entre les termes du même prédicat.
-
-        Args:
-            predicat_recherche, predicat_candidat (Litteral)    :   Les prédicat à unifier.
-
-        Returns:
-            Optional[Dict[str, NoeudTerme]]                     :   La substitution si l'unification réussi, None sinon.
-        """
-        substitution: Dict[str, NoeudTerme] = {}
-        
-        for terme1, terme2 in zip(predicat_recherche.enfants, predicat_candidat.enfants):
-            if not self._unifier_termes(terme1, terme2, substitution):
-                return None
-            
-        return substitution
-        
-
-    def _unifier_termes(self, terme1: NoeudTerme, terme2: NoeudTerme, substitution: Dict[str, NoeudTerme]) -> bool:
+                    trouves += 1
+                    if limite is not None and trouves >= limite:
+                        return
+    
+    # Filtrage ----------------------------------------------------
+    
+    def _feuilles_candidates(self, sequence: List[int], fn_profondeur) -> Iterator[List[PointeurFeuille]]:
         """
-        Calcule le MGU de deux termes via Robinson (peut-etre qu'il faut directement utilisé l'algo de matheo, plus préférable ?)
+        Parcours (en profondeur, avec une pile) de l'arbre pour trouver les feuilles potentiellement unifiables.
+        Filtre grossier en ignorant les contraintes d'unification qui seront vérifiées en phase d'unification.
 
         Args:
-            terme1, terme2 (NoeudTerme)         :   Les termes à unifier.
-
-        Returns:
-            Optional[Dict[str, NoeudTerme]]     :   La substitution si l'unification réussi, None sinon.
+            sequence        (List[int])     : Séquence du terme mis à plat
+            fn_profondeur   (Callable)      : Taille du sous-terme de la requête commençant à un index
+        Yields:
+            List[PointeurFeuille]           : Pointeurs de chaque feuille candidate à l'unification
         """
-        pile: List[Tuple[NoeudTerme, NoeudTerme]] = [(terme1, terme2)]
-
+        longueur = len(sequence)
+        pile = [(self.racine, 0)]
         while pile:
-            a, b = pile.pop()
+            noeud, index = pile.pop()
 
-            a = self._transitivite(a, substitution)
-            b = self._transitivite(b, substitution)
+            # Si le parcours est fini : les feuilles sont candidates
+            if index >= longueur:
+                if noeud.pointeurs:
+                    yield noeud.pointeurs
+                continue
 
-            # Cas 1 : termes égaux 
-            if self._termes_egaux(a, b):
+            symbole_courant = sequence[index] # Récupération du symbole courant de la recherche
+
+            # Cas prédicat : on cherche signe opposé au signe courant
+            if symbole_courant == CODE_PREDICAT_POSITIF or symbole_courant == CODE_PREDICAT_NEGATIF:
+                oppose = CODE_PREDICAT_NEGATIF if symbole_courant == CODE_PREDICAT_POSITIF else CODE_PREDICAT_POSITIF
+                if oppose in noeud.enfants:
+                    pile.append((noeud.enfants[oppose], index + 1))
                 continue
 
-            # Cas 2 : a est une variable
-            if a.etiquette == ETIQUETTE_VAR:
-                if self._apparait_dans(a.nom, b, substitution):
-                    # Occur check
-                    return False
-                substitution[a.nom] = b
-
-            # Cas 3 : b est une variable
-            elif b.etiquette == ETIQUETTE_VAR:
-                if self._apparait_dans(b.nom, a, substitution):
-                    # Occur check
-                    return False
-                substitution[b.nom] = a
-
-            # Cas 4 : même fonction ou constante et même arité
-            elif a.nom == b.nom and len(a.enfants) == len(b.enfants):
-                # On vérifie l'unification des arguments
-                for ca, cb in zip(a.enfants, b.enfants):
-                    pile.append((ca, cb))
-
-            # Cas 5 : echec
+            # Les successeurs sont empilés à l'envers : même ordre de parcours qu'en récursif
+            if symbole_courant >= 0:
+                # Cas 3 : variable dans l'arbre (elle s'unifie avec tout le sous-terme de la requête)
+                nouvel_index = index + fn_profondeur(index)
+                if nouvel_index <= longueur:
+                    variables = [enfant for symbole, enfant in noeud.enfants.items() if symbole < 0]
+                    for enfant in reversed(variables):
+                        pile.append((enfant, nouvel_index))
+
+                # Cas 1 : les symboles sont identiques
+                enfant = noeud.enfants.get(symbole_courant)
+                if enfant is not None:
+                    pile.append((enfant, index + 1))
             else:
-                return False
-            
-        return True
-    
-    def _transitivite(self, terme: NoeudTerme, substitution: Dict[str, NoeudTerme]) -> NoeudTerme:
-        """
-        Récupère le dernier terme substitué d'une chaine de transitivité
+                # Cas 2 : variable dans la requête, elle peut s'unifier avec les sous-termes
+                suivants = [dernier_noeud for enfant in noeud.enfants.values() for dernier_noeud in self._collecter_sous_termes(enfant, 1)]
+                for dernier_noeud in reversed(suivants):
+                    pile.append((dernier_noeud, index + 1))
 
-        Args:
-            terme           (NoeudTerme)            : Le premier terme de la chaine
-            substitution    (Dict[str, NoeudTerme]) : La substitution parcourue
+    # Unification ----------------------------------------------------
 
-        Returns:
-            NoeudTerme: Le dernier terme substitué de la chaine
-        """
-        chemin = []
-        while terme.etiquette == ETIQUETTE_VAR and terme.nom in substitution:
-            chemin.append(terme.nom)
-            terme = substitution[terme.nom]
-        for nom in chemin:
-            substitution[nom] = terme
-        return terme
-    
-    def _apparait_dans(self, nom_var: str, terme: NoeudTerme, substitution: Dict[str, NoeudTerme]) -> bool:
+    def _unifier_predicats(self, predicat_recherche: Litteral, predicat_candidat: Litteral) -> Optional[Substitution]:
         """
-        Occur check : vérifié si la variable 'nom_var' apparait dans 'terme'.
+        Vérifie un candidat trouvé par le filtrage (unification des arguments, substitution partagée).
+        Sans unificateur donné, la requête est compilée en filtre (cf. compilateur.py) : la compilation
+        est gardée pour tous les candidats de la même recherche, et le code pour toutes les requêtes de même forme.
 
         Args:
-            nom_var         (str)                   : La variable dont on vérifie la présence.
-            terme           (NoeudTerme)            : Le terme pouvant contenir la variable.
-            substitution    (Dict[str, NoeudTerme]) : La substitution.
+            predicat_recherche, predicat_candidat (Litteral)    :   Les prédicat à unifier.
 
         Returns:
-            bool: True si occur check, False sinon.
-        """
-        terme = self._transitivite(terme, substitution)
-        # Si variable :
-        if terme.etiquette == ETIQUETTE_VAR: 
-            # On vérifie le nom
-            return terme.nom == nom_var
-        
-        # On regarde pour les enfants
-        return any(self._apparait_dans(nom_var, enfant, substitution) for enfant in terme.enfants)
-    
-    def _termes_egaux(self, terme1: NoeudTerme, terme2: NoeudTerme) -> bool:
+            Optional[Substitution]                              :   La substitution si l'unification réussi, None sinon.
         """
-        Vérifie l'égalité structurelle de deux termes
-
-        Args:
-            terme1, terme2 (NoeudTerme): Les termes à vérifier
+        if self.unificateur is not None:
+            return self.unificateur(predicat_recherche, predicat_candidat)
 
-        Returns:
-            bool: True si égaux, False sinon.
-        """
-        # Si pas le meme nom ou meme type :
-        if terme1.etiquette != terme2.etiquette or terme1.nom != terme2.nom:
-            return False
-        # Vérification dans les enfants :
-        return all(self._termes_egaux(enfant1, enfant2) for enfant1, enfant2 in zip(terme1.enfants, terme2.enfants))
+        if predicat_recherche is not self._requete_compilee:
+            self._requete_compilee = predicat_recherche
+            self._filtre = compiler(predicat_recherche, self.occurs)
+        return self._filtre(predicat_candidat)
 
     # Autres fonctions internes ----------------------------------------------------
     
-    def _mise_a_plat_predicat(self, predicat: Litteral, var_map: Dict[str, str], prefixe: str) -> List[str]:
+    def _mise_a_plat_predicat(self, predicat: Litteral, tailles: Optional[List[int]] = None) -> List[int]:
         """
-        Surcouche de la fonction _mise_a_plat_terme pour les prédicats.
+        Mise à plat d'un prédicat en une séquence de symboles en ordre préfixe : le signe, puis
+        l'encodage plat du littéral (cf. Litteral.plat), où les variables sont déjà normalisées en -1, -2, etc.
+
+        Pour P(f(X, g(Y))), donne : [+, P, f, -1, g, -2]
 
         Args:
-            predicat    (Litteral)      : Le prédicat à mettre à plat.
-            var_map     (Dict[str, str]): Mapping de normalisation des variables.
-            prefixe     (str)           : Préfixe pour les variables normalisées (* pour arbre, ? pour query).
+            predicat    (Litteral)              : Le prédicat à mettre à plat.
+            tailles     (Optional[List[int]])   : Si fourni, reçoit pour chaque position de la séquence
+                                                  la taille du sous-terme qui y commence.
 
         Returns:
-            List[str]                   : La séquence correspondant au prédicat mis à plat.
+            List[int]                   : La séquence correspondant au prédicat mis à plat.
         """
-        
-        # Initialisation de la séquence vide :
-        resultat = []
-
-        # Ajout du signe et du symbole du prédicat à la séquence :
-        resultat.extend([SYMBOLE_PREDICAT_POSITIF if predicat.sign else SYMBOLE_PREDICAT_NEGATIF, predicat.predicat])
-
-        self.arites[predicat.predicat] = predicat.arity
+        plat = predicat.plat
 
-        # Mise à plat des termes du prédicat et ajout à la séquence :
-        for terme in predicat.enfants:
-            resultat.extend(self._mise_a_plat_terme(terme, var_map, prefixe))
+        # Ajout du signe, puis du prédicat et des termes (déjà en ordre préfixe) :
+        resultat = [CODE_PREDICAT_POSITIF if predicat.sign else CODE_PREDICAT_NEGATIF]
+        resultat.extend(plat.symboles)
 
-        return resultat
+        if tailles is not None:
+            fins = plat.fins
+            tailles.extend([1, 1])
+            tailles.extend(fins[i] - i for i in range(1, len(fins)))
 
-    def _mise_a_plat_terme(self, terme: NoeudTerme, var_map: Dict[str, str], prefixe: str) -> List[str]:
-        """
-        Mise à plat d'un terme en une séquence de symboles en ordre préfixe.
-        Les variables sont normalisées en *1, *2, etc.
-        
-        Pour f(X, g(Y)), retourne : ['f', '*1', 'g', '*2']
-        
-        Args:
-            terme   (NoeudTerme)        :   Le terme à aplatir.
-            var_map (Dict[str, str])    :   Mapping de normalisation des variables.
-            prefixe (str)               :   Préfixe pour les variables normalisées.
-        Returns:
-            List[str]                   :   Séquence aplatie de symboles.
-        """
-        # Initialisation de la séquence résultat vide :
-        resultat = []
-        
-        # Ajout du symbole du terme courant :
-        if terme.etiquette == ETIQUETTE_VAR:
-            # On map l'arité de la variable :
-            if terme.nom not in self.arites:
-                self.arites[terme.nom] = 0 # On met à 0
-            # On normalise :
-            if terme.nom not in var_map: # Nouvelle variable rencontrée
-                var_map[terme.nom] = f"{prefixe}{len(var_map) + 1}"
-            resultat.append(var_map[terme.nom])
-        elif terme.etiquette == ETIQUETTE_CONS:
-            # On map l'arité de la variable :
-            if terme.nom not in self.arites:
-                self.arites[terme.nom] = 0 # On met à 0
-            # Constante, on ajoute le nom tel quel
-            resultat.append(terme.nom)
-        else:        
-            # On map l'arité de la fonction
-            if terme.nom not in self.arites:
-                self.arites[terme.nom] = int(terme.etiquette) # L'arité est stockée dans l'étiquette
-            # Fonction, on ajoute le nom tel quel :
-            resultat.append(terme.nom)
-            # Ajout des enfants :
-            for enfant in terme.enfants:
-                resultat.extend(self._mise_a_plat_terme(enfant, var_map, prefixe))
-        
         return resultat
     
     
@@ -520,15 +306,9 @@ class ArbreDeDiscrimination:
         Returns:
             List[NoeudArbreDeDiscrimination]                    :   Paire
         """
-        arite = 0
-        
-        # Mise à jour du compteur :
+        # Mise à jour du compteur (l'arité est lue dans la table des symboles, 0 pour une variable) :
         if noeud.symbole is not None:
-            if noeud.symbole.startswith(NORM_VAR_ARBRE) or noeud.symbole.startswith(NORM_VAR_REQUETE):
-                arite = 0
-            else:
-                arite = self.arites.get(noeud.symbole, 0)
-
+            arite = SIGNATURE.arites[noeud.symbole] if noeud.symbole >= 0 else 0
             obligations = obligations - 1 + arite
 
         # Le sous-terme est complet :
@@ -543,46 +323,13 @@ class ArbreDeDiscrimination:
         ]
         
     
-    def _calculer_profondeur_depuis_index(self, index: int, sequence: List[str], fonction_profondeur=None) -> int:
-        """
-        Calcule la profondeur du sous-terme commençant à l'index donné.
-        
-        Args:
-            index       (int)       : L'index de départ dans la séquence.
-            sequence    (List[str]) : La séquence
+    @staticmethod
+    def _symbole_affiche(symbole: int) -> str:
+        """Nom lisible d'un symbole de l'arbre (*1, *2, ... pour les variables normalisées)."""
+        if symbole < 0:
+            return f"{NORM_VAR_ARBRE}{-symbole}"
+        return SIGNATURE.noms[symbole]
 
-        Returns:
-            int : Le nombre de symboles formant le sous-terme.
-        """
-        if index >= len(sequence):
-            return 0
-
-        symbole = sequence[index]
-
-        if symbole.startswith(NORM_VAR_ARBRE) or symbole.startswith(NORM_VAR_REQUETE):
-            return 1
-        
-        arite = self.arites.get(symbole, 0)
-        # Si arité = 0 (variable ou constante), la profondeur est 1
-        if arite == 0:
-            return 1
-        
-        fn = fonction_profondeur if fonction_profondeur is not None else \
-            lambda i: self._calculer_profondeur_depuis_index(i, sequence)
-        
-        # Si arité > 0 (fonction), on compte 1 + profondeur de chaque argument
-        profondeur = 1
-        position_courante = index + 1
-        
-        for _ in range(arite):
-            profondeur_arg = fn(position_courante)
-            profondeur += profondeur_arg
-            position_courante += profondeur_arg
-        
-        return profondeur
-        
-
-    
     def affichage_arbre(self, noeud: Optional[NoeudArbreDeDiscrimination] = None, niveau: int = 0, prefixe: str = "", est_dernier: bool = True, chemin: str = "") -> None:
         """
         ╔════════════════════════════════════════════════════════════════╗
@@ -611,7 +358,7 @@ class ArbreDeDiscrimination:
             for i, noeud_enfant in enumerate(liste_enfants):
                 est_dernier_enfant = (i == len(liste_enfants) - 1)
                 if noeud_enfant.symbole is not None:
-                    self.affichage_arbre(noeud_enfant, niveau + 1, "", est_dernier_enfant, noeud_enfant.symbole)
+                    self.affichage_arbre(noeud_enfant, niveau + 1, "", est_dernier_enfant, self._symbole_affiche(noeud_enfant.symbole))
             return
         
         # Déterminer les connecteurs pour l'affichage
@@ -619,7 +366,7 @@ class ArbreDeDiscrimination:
         extension = "    " if est_dernier else "│   "
 
         # Afficher le noeud courant
-        symbole_affiche = noeud.symbole
+        symbole_affiche = self._symbole_affiche(noeud.symbole)
         
         if noeud.pointeurs:
             # Feuille avec pointeurs
@@ -637,10 +384,11 @@ class ArbreDeDiscrimination:
         liste_enfants = list(noeud.enfants.values())
         for i, noeud_enfant in enumerate(liste_enfants):
             est_dernier_enfant = (i == len(liste_enfants) - 1)
-            chemin_enfant = f"{chemin}/{noeud_enfant.symbole}"
+            chemin_enfant = f"{chemin}/{self._symbole_affiche(noeud_enfant.symbole)}"
             self.affichage_arbre(noeud_enfant, niveau + 1, prefixe + extension, est_dernier_enfant, chemin_enfant)
  
-def benchmark_arbre_discrimination(litteraux: List[Litteral], query_litteraux: List[Litteral], toutes_unifs: bool=True) -> Tuple[float, List[Tuple[float, int]]]:
+def benchmark_arbre_discrimination(litteraux: List[Litteral], query_litteraux: List[Litteral], toutes_unifs: bool=True,
+                                   occurs: str = OCCURS_TOUJOURS) -> Tuple[float, List[Tuple[float, int]]]:
     """
     Fonction utilitaire pour bench des algos.
     Calcul le temps de pré-traitement (i.e l'ajout des littéraux dans l'arbre) et le temps d'unification.
@@ -650,6 +398,7 @@ def benchmark_arbre_discrimination(litteraux: List[Litteral], query_litteraux: L
         litteraux (List[Litteral])      : Les littéraux à ajouter dans l'arbre.
         query_litteraux (List[Litteral]): Les littéraux que l'on cherche à unifier (query).
         toutes_unifs (bool, optional)   : Choix de trouver toutes les unifications ou seulement la première. Defaults to True.
+        occurs (str, optional)          : Politique d'occurs check de l'arbre. Defaults to OCCURS_TOUJOURS.
 
     Returns:
         List[Tuple[float, float, int]]  : Le temps de pré-traitement + un couple du temps d'unification et le nombre d'unifications trouvées.
@@ -661,7 +410,7 @@ def benchmark_arbre_discrimination(litteraux: List[Litteral], query_litteraux: L
 
     # Mesure du temps de pré-traitement (ici insertion dans arbre) :
     debut_pre_traitement = time.perf_counter() 
-    arbre = ArbreDeDiscrimination() 
+    arbre = ArbreDeDiscrimination(occurs=occurs)
     for litteral, pointeur in zip(litteraux, pointeurs):
         arbre.inserer(litteral, pointeur)
     fin_pre_traitement = time.perf_counter()
@@ -1,108 +1,395 @@
-from typing import List, Union
+from enum import Enum
+from collections import Counter
+from typing import Dict, List, Set, Union, Iterable, Iterator, Optional, Tuple, NamedTuple
 from unification.utils.logique.terme import NoeudTerme, FabriqueDeTermes, ETIQUETTE_VAR, ETIQUETTE_CONS
-from unification.utils.stores import TermSystem
-from unification.utils.logique.litteral import Litteral
+from unification.utils.stores import TermSystem, Equation, TermStore, DictStore, PathIndexStore
+from unification.utils.logique.litteral import Litteral, candidats_compatibles
+from unification.utils.logique.substitution import appliquer, verifier_politique, OCCURS_TOUJOURS, OCCURS_DIFFERE
 
 
 class UnificationError(Exception):
     """Exception levée quand l'unification échoue (Clash ou Occur Check)."""
     pass
 
+
+class TypeEchec(Enum):
+    """Cause d'un échec de résolution."""
+    CLASH = "clash"     # symboles différents
+    ARITE = "arite"     # même symbole, arités différentes
+    OCCURS = "occurs"   # une variable apparaît dans son propre terme (cycle)
+
+
+class Resolution(NamedTuple):
+    """
+    Résultat de resoudre() : le système résolu, ou la cause de l'échec et les deux termes en cause
+    (pour OCCURS : la variable et son terme ; le terme est None pour un cycle entre multi-équations).
+    Le message n'est formaté qu'à la demande (message, valider) : un échec ne coûte ni exception ni repr.
+
+    Example:
+        >>> resultat = MartelliMontanari(system).resoudre()
+        >>> if resultat.succes: ... resultat.systeme ...
+        >>> elif resultat.echec is TypeEchec.OCCURS: ...
+    """
+    systeme: Optional[TermSystem]
+    echec: Optional[TypeEchec] = None
+    gauche: Optional[NoeudTerme] = None
+    droite: Optional[NoeudTerme] = None
+
+    @property
+    def succes(self) -> bool:
+        return self.echec is None
+
+    def message(self) -> str:
+        """Message de l'échec (le même que celui de UnificationError), "" en cas de succès."""
+        gauche, droite = self.gauche, self.droite
+        if self.echec is TypeEchec.OCCURS:
+            if droite is None:
+                return f"OCCUR CHECK : cycle entre les multi-équations (variable {gauche.nom})"
+            return f"OCCUR CHECK : La variable {gauche.nom} apparaît dans {droite}"
+        if self.echec is TypeEchec.ARITE:
+            return f"ARITE : '{gauche.nom}' d'arités différentes ({len(gauche.enfants)} et {len(droite.enfants)})"
+        if self.echec is TypeEchec.CLASH:
+            if gauche.etiquette == ETIQUETTE_CONS and droite.etiquette == ETIQUETTE_CONS:
+                return f"CLASH : Constantes différentes '{gauche.nom}' et '{droite.nom}'"
+            if isinstance(gauche.etiquette, int) and isinstance(droite.etiquette, int):
+                return f"CLASH : Fonctions différentes '{gauche.nom}' et '{droite.nom}'"
+            return f"CLASH : Impossible d'unifier {gauche} et {droite} (types incompatibles)"
+        return ""
+
+    def valider(self) -> TermSystem:
+        """Le système résolu, ou UnificationError en cas d'échec (API de solve)."""
+        if self.echec is not None:
+            raise UnificationError(self.message())
+        return self.systeme
+
+
+def _conflit(gauche: NoeudTerme, droite: NoeudTerme) -> Resolution:
+    """Échec sur deux termes non variables de symboles différents : arités différentes d'un même nom, ou clash."""
+    if gauche.nom == droite.nom:
+        return Resolution(None, TypeEchec.ARITE, gauche, droite)
+    return Resolution(None, TypeEchec.CLASH, gauche, droite)
+
 class MartelliMontanari:
-    def __init__(self, system: TermSystem):
+    """
+    Résolution d'un système d'équations par les règles de Martelli-Montanari.
+
+    Attributes:
+        occurs (str) : Politique d'occurs check (cf. substitution.py). Sans OCCURS_TOUJOURS, une équation
+                       X = t[X] n'est pas éliminée (son élimination ne terminerait pas) ; avec OCCURS_DIFFERE,
+                       le système est rejeté s'il en reste une à la fin.
+    """
+    def __init__(self, system: TermSystem, occurs: str = OCCURS_TOUJOURS):
         self.system = system
         self.equations = system.equations 
+        self.occurs = verifier_politique(occurs)
 
     def get_variables(self, term: NoeudTerme) -> set:
-        """Récupère toutes les variables d'un terme."""
-        if term.etiquette == ETIQUETTE_VAR:
-            return {term.nom}
-        if term.etiquette == ETIQUETTE_CONS:
-            return set()
-        variables = set()
-        for child in term.enfants:
-            variables.update(self.get_variables(child))
-        return variables
-
-    def substitution(self, term: NoeudTerme, var_name: str, replacement: NoeudTerme) -> NoeudTerme:
-        if term.etiquette == ETIQUETTE_VAR:
-            return replacement if term.nom == var_name else term
-        if term.etiquette == ETIQUETTE_CONS:
+        """Récupère toutes les variables d'un terme (calculées à la construction du terme)."""
+        return set(term.variables)
+
+    def substitution(self, term: NoeudTerme, var_name: str, replacement: NoeudTerme, memo: dict = None) -> NoeudTerme:
+        """
+        Remplace var_name par replacement dans term.
+        Un sous-terme qui ne contient pas var_name est retourné tel quel (même objet), et les
+        sous-termes répétés ne sont calculés qu'une fois par appel (memo).
+        """
+        if var_name not in term.variables:
             return term
-        new_children = [self.substitution(c, var_name, replacement) for c in term.enfants]
-        return FabriqueDeTermes.creer_fonc(term.nom, int(term.etiquette), new_children)
-
-    def solve(self) -> TermSystem:   
-        changed = True
-        #print(f"--- Début de l'unification: {self.system}")
-
-        while changed:
-            changed = False
-            for i in range(len(self.equations)):
-                eq = self.equations[i]
-                left, right = eq.left, eq.right
-
-                # Règle 1 : DELETE (x = x)
-                if left.etiquette == right.etiquette and left.nom == right.nom and left.etiquette in [ETIQUETTE_VAR, ETIQUETTE_CONS]:
-                    #print(f"[DELETE] Suppression de {eq}")
-                    self.equations.pop(i)
-                    changed = True
-                    break
-                # Règle 2 : ORIENT (t = x devient x = t)
-                elif left.etiquette != ETIQUETTE_VAR and right.etiquette == ETIQUETTE_VAR:
-                    #print(f"[ORIENT] Inversion de {eq}")
-                    self.equations[i].left, self.equations[i].right = right, left
-                    changed = True
-                    break
-
-                elif left.etiquette == ETIQUETTE_VAR:
-                    x_name = left.nom
-                    vars_right = self.get_variables(right)
-
-                    # Occur Check 
-                    if x_name in vars_right and right.etiquette != ETIQUETTE_VAR:
-                        raise UnificationError(f"OCCUR CHECK : La variable {x_name} apparaît dans {right}")
-
-                    # Substitution
-                    subst = False
-                    for j in range(len(self.equations)):
-                        if i == j: continue
-                        other = self.equations[j]
-                        
-                        if x_name in self.get_variables(other.left) or x_name in self.get_variables(other.right):
-                            #print(f"[SUBSTITUTION] {x_name} -> {right} dans {other}")
-                            other.left = self.substitution(other.left, x_name, right)
-                            other.right = self.substitution(other.right, x_name, right)
-                            subst = True
-                    
-                    if subst:
-                        changed = True
-                        break
-
-                # Règle 3 : DECOMPOSITION (f(s1..sn) = f(t1..tn))
-                elif isinstance(left.etiquette, int) and isinstance(right.etiquette, int):
-                    if left.nom == right.nom and left.etiquette == right.etiquette:
-                        #print(f"[DECOMPOSITION] {eq}")
-                        self.equations.pop(i)
-                        for s, t in zip(left.enfants, right.enfants):
-                            self.system.add(s, t)
-                        changed = True
-                        break
-                    else:
-                        raise UnificationError(f"CLASH : Fonctions différentes '{left.nom}' et '{right.nom}'")
-
-                # Règle 4 : CLASH (Types incompatibles)
-                elif left.etiquette == ETIQUETTE_CONS and right.etiquette == ETIQUETTE_CONS:
-                    if left.nom != right.nom:
-                     raise UnificationError(f"CLASH : Constantes différentes '{left.nom}' et '{right.nom}'")
-                elif (left.etiquette == ETIQUETTE_CONS and right.etiquette != ETIQUETTE_CONS and right.etiquette != ETIQUETTE_VAR) or \
-                     (isinstance(left.etiquette, int) and right.etiquette == ETIQUETTE_CONS):
-                    raise UnificationError(f"CLASH : Impossible d'unifier {left} et {right} (types incompatibles)")
-
-                
-        #print("\n--- Unification réussie ---")
-        return self.system
+        if term.etiquette == ETIQUETTE_VAR:
+            return replacement
+        if memo is None:
+            memo = {}
+        resultat = memo.get(term)
+        if resultat is None:
+            new_children = [self.substitution(c, var_name, replacement, memo) for c in term.enfants]
+            resultat = FabriqueDeTermes.creer_fonc(term.nom, int(term.etiquette), new_children)
+            memo[term] = resultat
+        return resultat
+
+    def solve(self) -> TermSystem:
+        """
+        Résout le système (modifié sur place) et le retourne sous forme résolue : X1 = t1, ..., Xn = tn,
+        aucune Xi n'apparaissant dans un tj. Lève UnificationError en cas de clash ou d'occur check.
+        """
+        return self.resoudre().valider()
+
+    def resoudre(self) -> Resolution:
+        """
+        Comme solve, sans exception : le système résolu, ou la cause de l'échec (cf. Resolution).
+
+        Les équations en attente forment une pile de travail, et les équations résolues un dictionnaire
+        variable -> terme, idempotent. Chaque équation est dépilée une seule fois, après application des
+        liaisons déjà résolues (une seule passe, la substitution étant idempotente) : la liste n'est jamais
+        reparcourue depuis le début. L'élimination d'une variable ne réécrit que les termes résolus qui la
+        contiennent, trouvés par un index variable -> variables résolues dont le terme la contient.
+
+        Sans OCCURS_TOUJOURS, une équation X = t[X] est gardée à part (au plus une par variable) : une seconde
+        équation cyclique X = u[X] donne l'équation t[X] = u[X] à décomposer, une paire n'étant décomposée
+        qu'une fois (cf. robinson._resoudre) pour que la résolution termine.
+        """
+        # Pile de travail : la première équation du système est traitée en premier
+        a_traiter = [(eq.left, eq.right) for eq in reversed(self.equations)]
+        resolues: Dict[str, NoeudTerme] = {}
+        occurrences: Dict[str, Set[str]] = {} # z -> {y | z apparaît dans resolues[y]}
+        cycliques: Dict[str, NoeudTerme] = {} # X -> t[X] (équation X = t[X], gardée sans occurs check)
+        decomposees: Set[Tuple[NoeudTerme, NoeudTerme]] = set() # Paires t[X] = u[X] déjà décomposées
+
+        while a_traiter:
+            left, right = a_traiter.pop()
+            if resolues:
+                left = appliquer(left, resolues)
+                right = appliquer(right, resolues)
+
+            # Règle 1 : DELETE (x = x)
+            if left is right or (left.symbole == right.symbole and left.etiquette in (ETIQUETTE_VAR, ETIQUETTE_CONS)):
+                continue
+
+            # Règle 2 : ORIENT (t = x devient x = t)
+            if left.etiquette != ETIQUETTE_VAR and right.etiquette == ETIQUETTE_VAR:
+                left, right = right, left
+
+            if left.etiquette == ETIQUETTE_VAR:
+                x_name = left.nom
+
+                # Occur Check
+                if x_name in right.variables:
+                    if self.occurs == OCCURS_TOUJOURS:
+                        return Resolution(None, TypeEchec.OCCURS, left, right)
+                    autre = cycliques.get(x_name)
+                    if autre is None:
+                        cycliques[x_name] = right # Équation cyclique : laissée telle quelle
+                    elif autre is not right and (autre, right) not in decomposees:
+                        # Deux équations cycliques sur x : leurs membres droits doivent s'unifier
+                        decomposees.add((autre, right))
+                        a_traiter.append((autre, right))
+                    continue
+
+                # Substitution : seules les équations résolues contiennent encore x (cf. occurrences)
+                a_reecrire = occurrences.pop(x_name, None)
+                if a_reecrire:
+                    memo = {}
+                    for y_name in a_reecrire:
+                        resolues[y_name] = self.substitution(resolues[y_name], x_name, right, memo)
+                for z_name in right.variables:
+                    contenants = occurrences.get(z_name)
+                    if contenants is None:
+                        contenants = occurrences[z_name] = set()
+                    if a_reecrire:
+                        contenants.update(a_reecrire)
+                    contenants.add(x_name)
+                resolues[x_name] = right
+
+                # Une équation cyclique sur x est reprise avec la nouvelle liaison
+                if cycliques:
+                    reprises = [nom for nom, terme in cycliques.items() if nom == x_name or x_name in terme.variables]
+                    for nom in reprises:
+                        a_traiter.append((FabriqueDeTermes.creer_var(nom), cycliques.pop(nom)))
+                continue
+
+            # Règle 3 : DECOMPOSITION (f(s1..sn) = f(t1..tn))
+            if isinstance(left.etiquette, int) and isinstance(right.etiquette, int):
+                if left.symbole != right.symbole:
+                    return _conflit(left, right)
+                # Empilées à l'envers pour traiter les arguments dans l'ordre
+                a_traiter.extend(zip(reversed(left.enfants), reversed(right.enfants)))
+                continue
+
+            # Règle 4 : CLASH
+            return _conflit(left, right)
+
+        if cycliques and self.occurs == OCCURS_DIFFERE:
+            # Occurs check différé : une seule passe sur le système résolu
+            nom, terme = next(iter(cycliques.items()))
+            return Resolution(None, TypeEchec.OCCURS, FabriqueDeTermes.creer_var(nom), terme)
+
+        # Le système est réécrit sur place sous forme résolue
+        self.equations[:] = [Equation(FabriqueDeTermes.creer_var(nom), terme) for nom, terme in resolues.items()]
+        self.equations.extend(Equation(FabriqueDeTermes.creer_var(nom), terme) for nom, terme in cycliques.items())
+        return Resolution(self.system)
     
+class _MultiEquation:
+    """
+    Multi-équation S = M : un ensemble de variables égales entre elles et le multi-ensemble des termes
+    non variables auxquels elles sont égales. `compteur` est le nombre d'occurrences des variables de S
+    dans les termes des multi-équations non résolues.
+    """
+    __slots__ = ("variables", "termes", "compteur", "active")
+
+    def __init__(self, variables: List[str], termes: List[NoeudTerme]):
+        self.variables = variables
+        self.termes = termes
+        self.compteur = 0
+        self.active = True # False une fois résolue, ou fusionnée dans une autre multi-équation
+
+
+class MartelliMontanariMultiEquations:
+    """
+    Algorithme efficace de Martelli et Montanari (1982), sur des multi-équations.
+
+    Chaque classe de variables égales forme une multi-équation S = M, avec un compteur d'occurrences de
+    ses variables dans les autres multi-équations. Une multi-équation de compteur nul (aucune autre ne
+    dépend d'elle : ordre topologique) est résolue : la partie commune de ses termes devient la valeur de
+    ses variables, et sa frontière (les positions où un terme a une variable) est fusionnée dans le système.
+    S'il ne reste que des multi-équations de compteur non nul, elles forment un cycle : l'occurs check est
+    fait par les compteurs, sans parcourir les termes.
+
+    Même contrat que MartelliMontanari : solve() réécrit le système sous forme résolue, ou lève UnificationError,
+    et resoudre() retourne une Resolution.
+    L'occurs check étant intrinsèque, seules OCCURS_TOUJOURS et OCCURS_DIFFERE (équivalentes ici) sont acceptées.
+    """
+    def __init__(self, system: TermSystem, occurs: str = OCCURS_TOUJOURS):
+        if verifier_politique(occurs) not in (OCCURS_TOUJOURS, OCCURS_DIFFERE):
+            raise ValueError(f"Politique d'occurs check non supportée par les multi-équations : {occurs!r}")
+        self.system = system
+        self.equations = system.equations
+        self.occurs = occurs
+        self.classes: Dict[str, _MultiEquation] = {} # Variable -> sa multi-équation
+        self.a_resoudre: List[_MultiEquation] = [] # Multi-équations de compteur nul (pile)
+        self.nb_actives = 0 # Multi-équations non résolues
+
+    def _classe(self, nom: str) -> _MultiEquation:
+        classe = self.classes.get(nom)
+        if classe is None:
+            classe = self.classes[nom] = _MultiEquation([nom], [])
+            self.nb_actives += 1
+        return classe
+
+    def _compter(self, termes: Iterable[NoeudTerme], delta: int) -> None:
+        """Ajoute `delta` au compteur de la multi-équation de chaque variable des termes."""
+        for terme in termes:
+            for nom in terme.variables:
+                classe = self._classe(nom)
+                classe.compteur += delta
+                if classe.compteur == 0:
+                    self.a_resoudre.append(classe)
+
+    def _fusionner(self, c1: _MultiEquation, c2: _MultiEquation) -> _MultiEquation:
+        """Fusionne deux multi-équations (la plus petite dans la plus grande)."""
+        if c1 is c2:
+            return c1
+        if len(c1.variables) + len(c1.termes) < len(c2.variables) + len(c2.termes):
+            c1, c2 = c2, c1
+        for nom in c2.variables:
+            self.classes[nom] = c1
+        c1.variables.extend(c2.variables)
+        c1.termes.extend(c2.termes)
+        c1.compteur += c2.compteur
+        c2.active = False
+        self.nb_actives -= 1
+        return c1
+
+    def _ajouter(self, variables: List[str], termes: List[NoeudTerme]) -> _MultiEquation:
+        """Ajoute la multi-équation variables = termes au système (fusionnée avec celles de ses variables)."""
+        classe = self._classe(variables[0])
+        for nom in variables[1:]:
+            classe = self._fusionner(classe, self._classe(nom))
+        classe.termes.extend(termes)
+        self._compter(termes, 1)
+        return classe
+
+    def _partie_commune(self, termes: List[NoeudTerme], frontiere: List[Tuple[List[str], List[NoeudTerme]]]) -> Union[NoeudTerme, Resolution]:
+        """
+        Partie commune de termes non variables, et sa frontière : à chaque position où l'un des termes a
+        une variable, la multi-équation des sous-termes à cette position. En cas de conflit, la Resolution d'échec.
+        """
+        premier = termes[0]
+        for terme in termes:
+            if terme.symbole != premier.symbole:
+                return _conflit(premier, terme)
+        if premier.etiquette == ETIQUETTE_CONS or len(termes) == 1:
+            return premier
+
+        enfants = []
+        for i in range(len(premier.enfants)):
+            colonne = [terme.enfants[i] for terme in termes]
+            variables = [t.nom for t in colonne if t.etiquette == ETIQUETTE_VAR]
+            if variables:
+                frontiere.append((variables, [t for t in colonne if t.etiquette != ETIQUETTE_VAR]))
+                enfants.append(FabriqueDeTermes.creer_var(variables[0]))
+            else:
+                enfant = self._partie_commune(colonne, frontiere)
+                if isinstance(enfant, Resolution):
+                    return enfant
+                enfants.append(enfant)
+        return FabriqueDeTermes.creer_fonc(premier.nom, premier.etiquette, enfants)
+
+    def solve(self) -> TermSystem:
+        return self.resoudre().valider()
+
+    def resoudre(self) -> Resolution:
+        # Système initial : une multi-équation par variable, et une multi-équation sans variable
+        # (de compteur nul) par équation entre deux termes non variables
+        racines: List[_MultiEquation] = []
+        for eq in self.equations:
+            for terme in (eq.left, eq.right):
+                for nom in terme.variables:
+                    self._classe(nom)
+        for eq in self.equations:
+            left, right = eq.left, eq.right
+            if left.etiquette != ETIQUETTE_VAR and right.etiquette == ETIQUETTE_VAR:
+                left, right = right, left
+            if left.etiquette != ETIQUETTE_VAR:
+                racines.append(_MultiEquation([], [left, right]))
+                self._compter((left, right), 1)
+            elif right.etiquette == ETIQUETTE_VAR:
+                self._ajouter([left.nom, right.nom], [])
+            else:
+                self._ajouter([left.nom], [right])
+
+        self.a_resoudre = [classe for classe in self.classes.values() if classe.active and classe.compteur == 0]
+        self.a_resoudre.extend(racines)
+        self.nb_actives += len(racines)
+
+        # Résolution dans l'ordre topologique : (variables, valeur) dans l'ordre de résolution
+        resolues: List[Tuple[List[str], Optional[NoeudTerme]]] = []
+        while self.nb_actives:
+            if not self.a_resoudre:
+                nom = next(classe for classe in self.classes.values() if classe.active).variables[0]
+                return Resolution(None, TypeEchec.OCCURS, FabriqueDeTermes.creer_var(nom))
+            classe = self.a_resoudre.pop()
+            if not classe.active or classe.compteur != 0:
+                continue # Entrée périmée (fusionnée, déjà résolue, ou compteur remonté depuis)
+            classe.active = False
+            self.nb_actives -= 1
+            if not classe.termes:
+                resolues.append((classe.variables, None))
+                continue
+
+            frontiere: List[Tuple[List[str], List[NoeudTerme]]] = []
+            valeur = self._partie_commune(classe.termes, frontiere)
+            if isinstance(valeur, Resolution):
+                return valeur
+            self._compter(classe.termes, -1)
+            for variables, termes in frontiere:
+                classe_frontiere = self._ajouter(variables, termes)
+                if classe_frontiere.compteur == 0:
+                    self.a_resoudre.append(classe_frontiere)
+            resolues.append((classe.variables, valeur))
+
+        # Substitution idempotente, en remontant l'ordre de résolution : la valeur d'une multi-équation
+        # ne contient que des variables résolues après elle, déjà développées
+        subst: Dict[str, NoeudTerme] = {}
+        for variables, valeur in reversed(resolues):
+            if valeur is None:
+                representant = FabriqueDeTermes.creer_var(variables[0])
+                for nom in variables[1:]:
+                    subst[nom] = representant
+            else:
+                valeur = appliquer(valeur, subst)
+                for nom in variables:
+                    subst[nom] = valeur
+
+        self.equations[:] = [Equation(FabriqueDeTermes.creer_var(nom), subst[nom]) for variables, _ in resolues for nom in variables if nom in subst]
+        return Resolution(self.system)
+
+
+# Moteurs de Martelli-Montanari, par nom
+MOTEURS = {
+    "regles": MartelliMontanari,                        # système de règles (DELETE, ORIENT, ...)
+    "multi_equations": MartelliMontanariMultiEquations, # multi-équations, compteurs et ordre topologique
+}
+
+
 # Exemple d'utilisation
 if __name__ == "__main__":
     from unification.utils.logique.litteral import Litteral
@@ -165,43 +452,54 @@ def traiterLitteraux(liste_litteraux):
 
                 mm = MartelliMontanari(system)
 
-                try:
-                    unificateur=mm.solve()
+                # Sans exception : un échec ne formate aucun message
+                if mm.resoudre().succes:
                     #print("Unification réussie")
                     succes += 1
-
-                    if unificateur.is_empty():
-                     #print("   (Système vide : les termes étaient identiques)")
-                     pass
-                    else:
-                        for eq in unificateur.equations:
-                            #print(f"   {eq.left} --> {eq.right}")
-                            pass
-                except UnificationError:
+                else:
                     #print("Échec") 
                     echec += 1
     print("Fin du traitement.")
     return comparaisons, succes, echec
 
 
-def lit_liste(l1: Litteral, list_litteraux: list[Litteral], touteUnif=True):
-    resultat = {}
-    for l2 in list_litteraux: # Etape 1 : On compare le littéral l1 avec tous les autres littéraux de la liste
-        if l1.predicat == l2.predicat and l1.sign != l2.sign and l1.arity == l2.arity: #Etape 2 : On vérifie si les deux prédicats ont les mêmes symboles, les signes opposés et les arités égales
-            system = TermSystem() 
+def unifier_lot(requete: Litteral, candidats: Iterable[Litteral], limite: Optional[int] = None,
+                occurs: str = OCCURS_TOUJOURS, moteur: str = "regles") -> Iterator[Tuple[Litteral, TermSystem]]:
+    """
+    Résout avec Martelli-Montanari le système requete = candidat pour chacun des candidats.
+    La requête n'est préparée qu'une fois (cf. candidats_compatibles) : un candidat de même signe, d'un
+    autre prédicat, d'une autre arité ou avec un clash sur un symbole de tête est écarté avant de
+    construire le TermSystem et le MartelliMontanari.
+
+    Args:
+        requete: Littéral de référence.
+        candidats: Littéraux à tester (parcourus une seule fois, au fur et à mesure).
+        limite: Nombre maximal de résultats (tous si None).
+        occurs: Politique d'occurs check (cf. MartelliMontanari).
+        moteur: Nom du moteur de résolution (cf. MOTEURS).
+
+    Yields:
+        (candidat, unificateur) pour chaque candidat unifiable, l'unificateur étant le système résolu.
+    """
+    if limite is not None and limite <= 0:
+        return
+    classe = MOTEURS[moteur]
+    trouves = 0
+    for candidat in candidats_compatibles(requete, candidats):
+        system = TermSystem([Equation(t1, t2) for t1, t2 in zip(requete.enfants, candidat.enfants)])
+        resultat = classe(system, occurs).resoudre()
+        if resultat.echec is not None:
+            continue
+        yield candidat, resultat.systeme
+        trouves += 1
+        if limite is not None and trouves >= limite:
+            return
 
-            for t1, t2 in zip(l1.enfants, l2.enfants):
-                system.add(t1, t2) # Etape 3 : Si les conditions sont remplies, on crée un système d'équations à partir des enfants des deux littéraux
 
-            mm = MartelliMontanari(system) # Etape 4 : On utilise l'algorithme de Martelli-Montanari pour tenter de résoudre le système d'équations
-            try:
-                unificateur=mm.solve()                  
-                resultat[l2] = unificateur
-                if not touteUnif:
-                    return resultat # Ici on retourne dès la première unification réussie
-            except UnificationError:
-                pass
-    return resultat
+def lit_liste(l1: Litteral, list_litteraux: list[Litteral], touteUnif=True):
+    # On compare le littéral l1 avec tous les autres littéraux de la liste (signes opposés, même symbole),
+    # avec Martelli-Montanari, en s'arrêtant à la première unification réussie si touteUnif est faux
+    return dict(unifier_lot(l1, list_litteraux, None if touteUnif else 1))
 
 def traiterLitterauxSet(liste_litteraux):
 
@@ -227,56 +525,28 @@ def traiterLitterauxSet(liste_litteraux):
 
                 mm = MartelliMontanari(system)
 
-                try:
-                    unificateur=mm.solve()
+                if mm.resoudre().succes:
                     #print("Unification réussie")
                     succes += 1
-
-                    if unificateur.is_empty():
-                     #print("   (Système vide : les termes étaient identiques)")
-                     pass
-                    else:
-                        for eq in unificateur.equations:
-                            pass
-                except UnificationError:
+                else:
                     echec += 1
     print("Fin du traitement.")
     return comparaisons, succes, echec
 
 
 def lit_Set(l1,list_litteraux, touteUnif=True):
-    resultat = {}
     ensemble = set(list_litteraux)
-    for l2 in ensemble:
-        if l1.predicat == l2.predicat and l1.sign != l2.sign and l1.arity == l2.arity:
-            system = TermSystem()
-
-            for t1, t2 in zip(l1.enfants, l2.enfants):
-                system.add(t1, t2)
-
-            mm = MartelliMontanari(system)
-            try:
-                unificateur=mm.solve()
-                resultat[l2] = unificateur
-                if not touteUnif:
-                    return resultat # Ici on retourne dès la première unification réussie
-            except UnificationError:
-                pass
-    return resultat
-
-def indexer(liste_litteraux):
-
-    index = {}
-
+    return dict(unifier_lot(l1, ensemble, None if touteUnif else 1))
+
+def indexer(liste_litteraux: Iterable[Litteral]) -> DictStore:
+    """
+    Index de résolution des littéraux : un DictStore, par (prédicat, arité) puis par signe.
+    L'index est incrémental : push / remove pour ajouter ou retirer des clauses sans le reconstruire,
+    et get_candidats_resolution pour les candidats d'une requête (cf. lit_dict).
+    """
+    index = DictStore()
     for lit in liste_litteraux:
-        if lit.predicat not in index:
-            index[lit.predicat] = {"positif": [], "negatif": []}
-
-        if lit.sign:
-            index[lit.predicat]["positif"].append(lit)
-        else:
-            index[lit.predicat]["negatif"].append(lit)
-
+        index.push(lit)
     return index
 
 def traiterLitterauxDict(liste_litteraux):
@@ -287,66 +557,67 @@ def traiterLitterauxDict(liste_litteraux):
 
     index = indexer(liste_litteraux)
 
-    for predicat, groupe in index.items():
-        positifs = groupe["positif"]
-        negatifs = groupe["negatif"]
+    # Les compteurs gardent leur sens d'origine (cf. traiterLitterauxSet) : un couple (positif, négatif)
+    # de même prédicat est une comparaison, même d'une autre arité ou écarté par l'index (échec)
+    negatifs = Counter(l.predicat for l in index if not l.sign)
 
-        for i in range(len(positifs)):
-            for j in range(len(negatifs)):
+    # Chaque littéral positif avec les négatifs de même prédicat et de même arité
+    for l1 in index:
+        if not l1.sign:
+            continue
+        unifies = 0
+        for l2 in index.get_candidats_resolution(l1):
 
-                l1 = positifs[i]
-                l2 = negatifs[j]
-
-                comparaisons += 1
-
-                if l1.arity != l2.arity:
-                    echec += 1
-                    continue
+            system = TermSystem()
 
-                system = TermSystem()
+            for t1, t2 in zip(l1.enfants, l2.enfants):
+                system.add(t1, t2)
 
-                for t1, t2 in zip(l1.enfants, l2.enfants):
-                    system.add(t1, t2)
+            mm = MartelliMontanari(system)
 
-                mm = MartelliMontanari(system)
+            if mm.resoudre().succes:
+                unifies += 1
 
-                try:
-                    unificateur = mm.solve()
-                    succes += 1
-                except UnificationError:
-                        echec += 1
+        comparaisons += negatifs[l1.predicat]
+        succes += unifies
+        echec += negatifs[l1.predicat] - unifies
 
     print("Fin du traitement.")
     return comparaisons, succes, echec
 
 
-def lit_dict(l1, index: dict, touteUnif: bool = True):
-
-    resultat = {}
- 
-    if l1.predicat not in index:
-        return resultat # Ici on retourne un ensmble vide
- 
-   
-    if l1.sign:
-        candidats = index[l1.predicat]["negatifs"]
+def lit_dict(l1: Litteral, index: TermStore[Litteral], touteUnif: bool = True, unificateur=None):
+    """
+    Recherche dans l'index (cf. indexer, ou tout TermStore) les littéraux unifiables avec l1.
+    Si `unificateur` est donné (par ex. robinson_plat.unifLitterauxPlat), il remplace la résolution
+    par Martelli-Montanari ; sa substitution est convertie en TermSystem sous forme résolue.
+    """
+    return dict(lit_dict_iter(l1, index, None if touteUnif else 1, unificateur))
+
+
+def lit_dict_iter(l1: Litteral, index: TermStore[Litteral], limite: Optional[int] = None, unificateur=None) -> Iterator[Tuple[Litteral, TermSystem]]:
+    """
+    Version paresseuse de lit_dict : les couples (littéral, unificateur) sont produits au fur et à mesure,
+    au plus `limite` (tous si None). Pour une liste ou un ensemble de littéraux, voir unifier_lot.
+    """
+    # Avec un DictStore ou un PathIndexStore, seuls les littéraux de même prédicat, même arité, signe opposé
+    # (et compatibles sur les arguments indexés) sont parcourus
+    if isinstance(index, (DictStore, PathIndexStore)):
+        candidats = index.get_candidats_resolution(l1)
     else:
-        candidats = index[l1.predicat]["positifs"]
- 
+        candidats = index
+
+    if unificateur is None:
+        yield from unifier_lot(l1, candidats, limite)
+        return
+
+    if limite is not None and limite <= 0:
+        return
+    trouves = 0
     for l2 in candidats:
-        if l1.arity == l2.arity:
- 
-            system = TermSystem()
-            for t1, t2 in zip(l1.enfants, l2.enfants):
-                system.add(t1, t2)
-    
-            mm = MartelliMontanari(system)
-            try:
-                unificateur = mm.solve()
-                resultat[l2] = unificateur
-                if not touteUnif:
-                    return resultat  # Ici on retourne dès la première unification réussie
-            except UnificationError:
-                pass
- 
-    return resultat
\ No newline at end of file
+        substitution = unificateur(l1, l2)
+        if substitution is not None:
+            yield l2, TermSystem([Equation(FabriqueDeTermes.creer_var(nom), terme) for nom, terme in substitution.items()])
+            trouves += 1
+            if limite is not None and trouves >= limite:
+                return
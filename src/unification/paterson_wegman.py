@@ -0,0 +1,218 @@
+"""
+Unification en temps linéaire de Paterson et Wegman (1978).
+
+Les deux membres de chaque équation sont convertis en un seul DAG : un noeud par terme distinct
+(les termes étant internés, deux sous-termes égaux donnent le même noeud, et une variable n'a
+qu'un noeud). Chaque équation devient un lien non orienté entre deux noeuds.
+
+La procédure FINISH(r) construit la classe d'équivalence de r en suivant les liens. Avant de
+terminer un noeud, elle termine tous ses parents : une classe n'est donc terminée qu'après
+toutes les classes des termes qui la contiennent. Retomber sur une classe en cours de construction
+signifie qu'un terme se contient lui-même (occurs check). Les noeuds fonction d'une même classe
+doivent avoir le même symbole (sinon clash), et leurs enfants sont liés deux à deux.
+
+La construction du DAG et FINISH utilisent des piles explicites : la profondeur des termes n'est
+pas limitée par celle de la pile d'appels de Python.
+
+Le MGU retourné n'est jamais développé : chaque variable est liée au noeud fonction de sa classe
+(le NoeudTerme d'origine, partagé), ou au représentant de sa classe s'il n'y en a pas.
+"""
+
+from typing import Dict, List, Optional, Iterator
+
+from unification.utils.logique.terme import NoeudTerme, ETIQUETTE_VAR
+from unification.utils.logique.litteral import Litteral
+from unification.utils.logique.substitution import Substitution
+from unification.utils.stores import TermSystem
+from unification.martelli_montanari import UnificationError
+
+
+class _NoeudDAG:
+    """
+    Noeud du DAG de Paterson-Wegman.
+
+    Attributes:
+        terme       (NoeudTerme)        : Terme représenté par le noeud.
+        enfants     (List[_NoeudDAG])   : Noeuds des arguments (vide pour une variable ou une constante).
+        parents     (List[_NoeudDAG])   : Noeuds dont celui-ci est un argument.
+        liens       (List[_NoeudDAG])   : Noeuds qui doivent être unifiés avec celui-ci.
+        pointeur    (_NoeudDAG)         : Racine de la classe en cours de construction (None si pas encore visité).
+        complet     (bool)              : True quand la classe du noeud est entièrement terminée.
+    """
+    __slots__ = ("terme", "enfants", "parents", "liens", "pointeur", "complet")
+
+    def __init__(self, terme: NoeudTerme):
+        self.terme = terme
+        self.enfants: List[_NoeudDAG] = []
+        self.parents: List[_NoeudDAG] = []
+        self.liens: List[_NoeudDAG] = []
+        self.pointeur: Optional[_NoeudDAG] = None
+        self.complet = False
+
+
+class _Cadre:
+    """
+    Appel de FINISH(r) en cours (pile explicite de _finir).
+
+    Attributes:
+        racine      (_NoeudDAG)             : Noeud r dont la classe est en construction.
+        fonction    (_NoeudDAG)             : Premier noeud non variable de la classe (None s'il n'y en a pas encore).
+        variables   (List[_NoeudDAG])       : Noeuds variables de la classe.
+        classe      (List[_NoeudDAG])       : Noeuds de la classe déjà visités.
+        pile        (List[_NoeudDAG])       : Noeuds de la classe restant à visiter.
+        courant     (_NoeudDAG)             : Noeud en cours de visite, dont les parents sont en train d'être terminés.
+        parents     (Iterator[_NoeudDAG])   : Parents de `courant` restant à terminer (None hors visite).
+    """
+    __slots__ = ("racine", "fonction", "variables", "classe", "pile", "courant", "parents")
+
+    def __init__(self, racine: _NoeudDAG):
+        self.racine = racine
+        self.fonction: Optional[_NoeudDAG] = None
+        self.variables: List[_NoeudDAG] = []
+        self.classe: List[_NoeudDAG] = []
+        self.pile = [racine]
+        self.courant: Optional[_NoeudDAG] = None
+        self.parents: Optional[Iterator[_NoeudDAG]] = None
+
+
+class PatersonWegman:
+    def __init__(self, system: TermSystem):
+        self.system = system
+        self.noeuds: Dict[NoeudTerme, _NoeudDAG] = {}
+        self.substitution = Substitution()
+
+    def _noeud(self, terme: NoeudTerme) -> _NoeudDAG:
+        """Noeud du DAG associé à `terme`, créé (avec ses sous-termes, enfants d'abord) s'il n'existe pas encore."""
+        noeuds = self.noeuds
+        noeud = noeuds.get(terme)
+        if noeud is not None:
+            return noeud
+        pile = [terme]
+        while pile:
+            t = pile[-1]
+            if t in noeuds:
+                pile.pop()
+                continue
+            manquants = [enfant for enfant in t.enfants if enfant not in noeuds]
+            if manquants:
+                pile.extend(manquants)
+                continue
+            pile.pop()
+            noeud = _NoeudDAG(t)
+            noeuds[t] = noeud
+            for enfant in t.enfants:
+                noeud_enfant = noeuds[enfant]
+                noeud_enfant.parents.append(noeud)
+                noeud.enfants.append(noeud_enfant)
+        return noeuds[terme]
+
+    def _ouvrir(self, r: _NoeudDAG, cadres: List[_Cadre]) -> None:
+        """Début de FINISH(r) : r ne doit pas être en cours de construction."""
+        if r.pointeur is not None:
+            raise UnificationError(f"OCCUR CHECK : {r.terme} apparaît dans un terme de sa propre classe")
+        r.pointeur = r
+        cadres.append(_Cadre(r))
+
+    def _finir(self, depart: _NoeudDAG) -> None:
+        """Procédure FINISH : construit et termine la classe de `depart` (et d'abord celles de ses parents)."""
+        if depart.complet:
+            return
+        cadres: List[_Cadre] = []
+        self._ouvrir(depart, cadres)
+        while cadres:
+            cadre = cadres[-1]
+            r = cadre.racine
+
+            if cadre.parents is not None:
+                # Les classes des termes qui contiennent le noeud courant doivent être terminées avant
+                for t in cadre.parents:
+                    if not t.complet:
+                        self._ouvrir(t, cadres)
+                        break
+                else:
+                    cadre.parents = None
+                    s = cadre.courant
+                    for t in s.liens:
+                        if t.pointeur is None:
+                            t.pointeur = r
+                            cadre.pile.append(t)
+                        elif t.pointeur is not r:
+                            raise UnificationError(f"OCCUR CHECK : {t.terme} apparaît dans un terme de sa propre classe")
+                    s.liens = []
+                continue
+
+            if cadre.pile:
+                s = cadre.pile.pop()
+                cadre.classe.append(s)
+                fonction = cadre.fonction
+                if s.terme.etiquette == ETIQUETTE_VAR:
+                    cadre.variables.append(s)
+                elif fonction is None:
+                    cadre.fonction = s
+                else:
+                    if s.terme.symbole != fonction.terme.symbole:
+                        raise UnificationError(f"CLASH : Impossible d'unifier {s.terme} et {fonction.terme}")
+                    # Les arguments correspondants doivent être dans la même classe
+                    for a, b in zip(s.enfants, fonction.enfants):
+                        if a is not b:
+                            a.liens.append(b)
+                            b.liens.append(a)
+                cadre.courant = s
+                cadre.parents = iter(s.parents)
+                continue
+
+            # La classe n'est marquée terminée qu'une fois entière : un parent de la classe qui en fait
+            # lui-même partie sera vu comme en cours de construction (cycle)
+            cadres.pop()
+            for s in cadre.classe:
+                s.complet = True
+
+            # Liaisons de la classe (sans développer le terme)
+            fonction = cadre.fonction
+            representant = fonction.terme if fonction is not None else r.terme
+            for v in cadre.variables:
+                if v.terme is not representant:
+                    self.substitution[v.terme.nom] = representant
+
+    def solve(self) -> Substitution:
+        """
+        Résout le système.
+
+        Returns:
+            Substitution            : Le MGU sous forme triangulaire (les termes liés sont les noeuds partagés du DAG).
+
+        Raises:
+            UnificationError        : En cas de clash ou d'occurs check.
+        """
+        for eq in self.system.equations:
+            gauche, droite = self._noeud(eq.left), self._noeud(eq.right)
+            if gauche is not droite:
+                gauche.liens.append(droite)
+                droite.liens.append(gauche)
+
+        # Noeuds fonction d'abord, puis les variables restantes
+        noeuds = list(self.noeuds.values())
+        for noeud in noeuds:
+            if noeud.terme.etiquette != ETIQUETTE_VAR:
+                self._finir(noeud)
+        for noeud in noeuds:
+            self._finir(noeud)
+        return self.substitution
+
+
+def unifLitterauxPW(p1: Litteral, p2: Litteral) -> Optional[Substitution]:
+    """
+    Même contrat que robinson.unifLitteraux, avec l'algorithme de Paterson-Wegman.
+
+    Returns:
+        Substitution commune entre p1 et p2 si possible, None sinon.
+    """
+    if p1.sign == p2.sign or p1.symbole != p2.symbole:
+        return None
+    system = TermSystem()
+    for t1, t2 in zip(p1.enfants, p2.enfants):
+        system.add(t1, t2)
+    try:
+        return PatersonWegman(system).solve()
+    except UnificationError:
+        return None
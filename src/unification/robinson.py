@@ -1,8 +1,9 @@
-from typing import Optional, Dict, Tuple, List
+from typing import Optional, Dict, Tuple, List, Callable, Iterable, Iterator
 
-from unification.utils.logique.terme import NoeudTerme, ETIQUETTE_VAR
-from unification.utils.stores import Equation, ListStore, SetStore, TermStore, DictStore
-from unification.utils.logique.litteral import Litteral
+from unification.utils.logique.terme import NoeudTerme, FabriqueDeTermes, ETIQUETTE_VAR
+from unification.utils.stores import Equation, ListStore, SetStore, TermStore, DictStore, PathIndexStore
+from unification.utils.logique.litteral import Litteral, candidats_compatibles
+from unification.utils.logique.substitution import Substitution, SubstitutionSimultanee, Trace, appliquer, contient_cycle, OCCURS_TOUJOURS, OCCURS_DIFFERE, OCCURS_JAMAIS
 
 
 from typing import Optional, Dict, Iterable
@@ -10,7 +11,8 @@ from typing import Optional, Dict, Iterable
 
 # La substitution est un dictionnaire avec comme clé le nom, et valeur le terme
 # Exemple : {"X" : a}
-Substitution = Dict[str, NoeudTerme]
+# Elle est triangulaire : un terme lié n'est pas réécrit et peut contenir des variables liées
+# (voir Substitution.resolve / Substitution.normaliser pour obtenir les termes développés).
 
 """
 Docstrings prégénérés par IA, puis modifiés ensuite pour être plus exactes.
@@ -23,7 +25,7 @@ def afficher(t1: NoeudTerme, t2: NoeudTerme, store: TermStore):
     print(f"Terme 1 : {t1}")
     print(f"Terme 2 : {t2}")
     print()
-    result = unify(t1, t2, SetStore(), {})
+    result = unify(t1, t2, SetStore(), Substitution())
     print(result)
 
     if result is None:
@@ -77,27 +79,35 @@ def occurs_check(var_name: str, term: NoeudTerme, subst: Substitution) -> bool:
     Returns:
         True si la variable apparaît dans le terme, False sinon.
     """
-    if term.etiquette == ETIQUETTE_VAR:
-        if term.nom == var_name:
-            return True
-        # Si la variable est dans la substitution, vérifier récursivement
-        if term.nom in subst:
-            return occurs_check(var_name, subst[term.nom], subst)
-        return False
-    elif term.etiquette == "const":
+    # L'ensemble des variables du terme est calculé à la construction : pas besoin de le parcourir
+    if var_name in term.variables:
+        return True
+    if term.est_clos:
         return False
-    else:
-        # C'est une fonction, vérifier tous les enfants
-        return any(occurs_check(var_name, child, subst) for child in term.enfants)
+    # Vérifier les variables déjà substituées (chaque variable liée n'est visitée qu'une fois,
+    # les termes liés pouvant partager des variables)
+    vues = set()
+    a_voir = [nom for nom in term.variables if nom in subst]
+    while a_voir:
+        nom = a_voir.pop()
+        if nom in vues:
+            continue
+        vues.add(nom)
+        lie = subst[nom]
+        if var_name in lie.variables:
+            return True
+        a_voir.extend(autre for autre in lie.variables if autre in subst and autre not in vues)
+    return False
 
 
-def apply_subst(term: NoeudTerme, subst: Substitution) -> NoeudTerme:
+def apply_subst(term: NoeudTerme, subst: Substitution, memo: Optional[Dict[NoeudTerme, NoeudTerme]] = None) -> NoeudTerme:
     """
     Applique une substitution à un terme. Peux faire une substitution chainée.
     
     Args:
         term: Le terme auquel appliquer la substitution.
         subst: La substitution à appliquer.
+        memo: Résultats déjà calculés pendant cet appel (créé par l'appel de plus haut niveau).
 
     Example:
         >>> terme = f(X, Y)
@@ -120,21 +130,20 @@ def apply_subst(term: NoeudTerme, subst: Substitution) -> NoeudTerme:
     Returns:
         Le terme avec les variables substituées.
     """
-    if term.etiquette == ETIQUETTE_VAR:
+    # Sous-terme qu'aucune liaison ne touche : l'objet d'origine est retourné, sans rien reconstruire,
+    # et les sous-termes répétés ne sont calculés qu'une fois par appel (voir substitution.appliquer).
+    return appliquer(term, subst, memo)
 
-        if term.nom in subst:
-            # Appliquer récursivement pour les substitutions chaînées
-            return apply_subst(subst[term.nom], subst)
-        return term
-    elif term.etiquette == "const":
-        return term
-    else:
-        # C'est une fonction, appliquer aux enfants
-        new_children = [apply_subst(child, subst) for child in term.enfants]
-        return NoeudTerme(term.nom, term.etiquette, new_children)
+
+def _dereferencer(term: NoeudTerme, subst: Substitution) -> NoeudTerme:
+    """Suit la chaîne de liaisons d'une variable jusqu'à un terme non variable ou une variable libre."""
+    while term.etiquette == ETIQUETTE_VAR and term.nom in subst:
+        term = subst[term.nom]
+    return term
 
 
-def unify(t1: NoeudTerme, t2: NoeudTerme, store: TermStore, subst: Substitution) -> Optional[Substitution]:
+def unify(t1: NoeudTerme, t2: NoeudTerme, store: TermStore, subst: Substitution, trace: Optional[Trace] = None,
+          occurs: str = OCCURS_TOUJOURS) -> Optional[Substitution]:
     """
     Algorithme d'unification de Robinson. Unifie uniquement deux termes ensemble. (si possible)
     
@@ -143,46 +152,77 @@ def unify(t1: NoeudTerme, t2: NoeudTerme, store: TermStore, subst: Substitution)
         t2: Second terme à unifier.
         store: Structure de données pour stocker les équations
         subst: Ensemble de substitutions de départ
+        trace: Si fournie, reçoit le nom de chaque variable liée (en cas d'échec, `subst` garde les
+               liaisons partielles : trace.annuler permet de les défaire).
+        occurs: Politique d'occurs check (OCCURS_TOUJOURS, OCCURS_DIFFERE ou OCCURS_JAMAIS, cf. substitution.py).
     
     Returns:
-        Le MGU s'il existe, None sinon.
+        Le MGU s'il existe (triangulaire : les termes liés ne sont pas développés), None sinon.
     """
     store.push(Equation(t1, t2))
-    
+    return _resoudre(store, subst, trace, occurs)
+
+def _resoudre(store: TermStore, subst: Substitution, trace: Optional[Trace] = None, occurs: str = OCCURS_TOUJOURS) -> Optional[Substitution]:
+    """
+    Boucle de Robinson : résout toutes les équations du store (consommées) en complétant `subst`.
+    Mêmes arguments et même retour que unify.
+
+    Sans occurs check à chaque liaison, des liaisons cycliques (X -> f(X)) peuvent apparaître pendant
+    la résolution, et une même paire de termes revenir indéfiniment par déréférencement (X = f(X),
+    Y = f(Y), X = Y). Les paires obtenues par déréférencement sont donc retenues, et une paire déjà
+    décomposée n'est pas décomposée de nouveau : la résolution termine toujours.
+    """
+    verifier = occurs == OCCURS_TOUJOURS
+    decomposees = None # (id gauche, id droite) des paires déréférencées déjà décomposées (sans occurs check)
     while not store.is_empty():
         eq = store.pop()
-        left = apply_subst(eq.left, subst)
-        right = apply_subst(eq.right, subst)
+        # Seule la racine est déréférencée : les sous-termes le seront quand leur équation sera dépilée
+        left = _dereferencer(eq.left, subst)
+        right = _dereferencer(eq.right, subst)
+        if left is right:
+            continue # Termes internés identiques
         
-        # Cas 1: Les termes sont identiques (même nom et même tag)
-        if left.nom == right.nom and left.etiquette == right.etiquette:
-            if left.etiquette not in [ETIQUETTE_VAR, "const"]:
-                # C'est une fonction, ajouter les équations pour les enfants
-                for child_left, child_right in zip(left.enfants, right.enfants):
-                    store.push(Equation(child_left, child_right))
-            # Sinon (const ou var identiques), rien à faire
+        # Cas 1: Même symbole (même nom, même genre, même arité : comparaison d'entiers)
+        if left.symbole == right.symbole:
+            if not verifier and (left is not eq.left or right is not eq.right):
+                paire = (id(left), id(right))
+                if decomposees is None:
+                    decomposees = set()
+                elif paire in decomposees:
+                    continue
+                decomposees.add(paire)
+            # Ajouter les équations pour les enfants (aucune pour une constante ou une variable)
+            for child_left, child_right in zip(left.enfants, right.enfants):
+                store.push(Equation(child_left, child_right))
             continue
         
         # Cas 2: Le terme gauche est une variable
         if left.etiquette == ETIQUETTE_VAR:
-            if occurs_check(left.nom, right, subst):
+            if verifier and occurs_check(left.nom, right, subst):
                 return None  # Échec: cycle détecté
             subst[left.nom] = right
+            if trace is not None:
+                trace.append(left.nom)
             continue
         
         # Cas 3: Le terme droit est une variable
         if right.etiquette == ETIQUETTE_VAR:
-            if occurs_check(right.nom, left, subst):
+            if verifier and occurs_check(right.nom, left, subst):
                 return None  # Échec: cycle détecté
             subst[right.nom] = left
+            if trace is not None:
+                trace.append(right.nom)
             continue
         
         # Cas 4: Symboles différents ou arités différentes (a remplacer par une vérification de clash)
         return None
     
+    if occurs == OCCURS_DIFFERE and contient_cycle(subst):
+        return None  # Échec: cycle dans les liaisons finales
     return subst
 
-def unifyAll(t1: NoeudTerme, tn: TermStore, store: TermStore, subst_init: Substitution = None) -> Optional[Substitution]:
+def unifyAll(t1: NoeudTerme, tn: TermStore, store: TermStore, subst_init: Substitution = None,
+             occurs: str = OCCURS_TOUJOURS) -> Optional[Substitution]:
     """
     Essaie d'unifier un terme avec un ensemble d'autres termes.
     
@@ -192,26 +232,32 @@ def unifyAll(t1: NoeudTerme, tn: TermStore, store: TermStore, subst_init: Substi
         tn: Groupe de termes qui doivent être unifiés avec t1.
         store: Structure de données à utiliser pour stocker les équations.
         subst_init: Substitution initiale à partir de laquelle commencer (optionnel).
+        occurs: Politique d'occurs check. Avec OCCURS_DIFFERE, la recherche de cycle n'est faite
+                qu'une fois, sur la substitution accumulée à la fin.
     
     Returns:
         Le MGU s'il existe, None sinon.
     """
-    subst_final: Substitution = subst_init if subst_init is not None else {}
+    subst_final: Substitution = subst_init if subst_init is not None else Substitution()
+    # Le cycle éventuel est cherché une seule fois, après toutes les unifications
+    occurs_unif = OCCURS_JAMAIS if occurs == OCCURS_DIFFERE else occurs
     
     while not tn.is_empty():
         t = tn.pop()
         
-        # Crée un nouveau store vide pour cette unification
-        new_store = type(store)()
+        # Le store est vidé et réutilisé pour cette unification
+        store.clear()
         
         # Passe les substitutions accumulées à unify
-        subst = unify(t1, t, new_store, subst_final)
+        subst = unify(t1, t, store, subst_final, occurs=occurs_unif)
         
         if subst is None:
             return None  # Échec de l'unification
         
         subst_final = subst  # unify retourne déjà la substitution complète
     
+    if occurs == OCCURS_DIFFERE and contient_cycle(subst_final):
+        return None
     return subst_final
 
 
@@ -238,48 +284,52 @@ def unifyMax(t1: NoeudTerme, tn: TermStore, store: TermStore) -> Tuple[Substitut
         - termes_compatibles: Liste des termes uniques qui ont pu être unifiés avec t1
     """
     # Extraire tous les termes de tn (en évitant les doublons)
-    termes_vus: Dict[str, NoeudTerme] = {}
+    # Les termes étant internés, le hash est mis en cache et l'égalité est une comparaison d'identité
+    termes_vus: Dict[NoeudTerme, NoeudTerme] = {}
     while not tn.is_empty():
         t = tn.pop()
-        key = repr(t)
-        if key not in termes_vus:
-            termes_vus[key] = t
+        if t not in termes_vus:
+            termes_vus[t] = t
     
     # Premier passage : accumulation gloutonne
-    subst_courant: Substitution = {}
-    termes_compatibles: Dict[str, NoeudTerme] = {}
-    termes_echoues: Dict[str, NoeudTerme] = {}
+    # Un essai qui échoue est défait avec la trace des liaisons, sans copier la substitution
+    subst_courant = Substitution()
+    trace = Trace()
+    termes_compatibles: Dict[NoeudTerme, NoeudTerme] = {}
+    termes_echoues: Dict[NoeudTerme, NoeudTerme] = {}
     
     for key, t in termes_vus.items():
-        new_store = type(store)()
-        subst = unify(t1, t, new_store, subst_courant.copy())
+        marque = trace.marquer()
+        store.clear()
         
-        if subst is not None:
-            subst_courant = subst
+        if unify(t1, t, store, subst_courant, trace) is not None:
             termes_compatibles[key] = t
         else:
+            trace.annuler(subst_courant, marque)
             termes_echoues[key] = t
     
     # Second passage : réessayer les termes échoués avec la substitution finale
     # (certains auraient pu échouer à cause de l'ordre)
     for key, t in termes_echoues.items():
-        new_store = type(store)()
-        subst = unify(t1, t, new_store, subst_courant.copy())
+        marque = trace.marquer()
+        store.clear()
         
-        if subst is not None:
-            subst_courant = subst
+        if unify(t1, t, store, subst_courant, trace) is not None:
             termes_compatibles[key] = t
+        else:
+            trace.annuler(subst_courant, marque)
     
     return subst_courant, list(termes_compatibles.values())
 
         
-def unifLitteraux(p1: Litteral, p2: Litteral):
+def unifLitteraux(p1: Litteral, p2: Litteral, occurs: str = OCCURS_TOUJOURS):
     """
     Essaie d'unifier deux littéraux ensemble avec Robinson.
     
     Args:
         p1: Littéral 1.
         p2: Littéral 2.     
+        occurs: Politique d'occurs check (cf. unify).
     
     Returns:
         Substitution commune entre p1 et p2 si possible, None sinon.
@@ -288,33 +338,314 @@ def unifLitteraux(p1: Litteral, p2: Litteral):
     if p1.sign == p2.sign:
         return None
     
-    # vérification du nom
-    if p1.predicat != p2.predicat:
-        return None
-    
-    # vérification de l'arité
-    if p1.arity != p2.arity:
+    # vérification du nom et de l'arité (identifiant de (prédicat, arité))
+    if p1.symbole != p2.symbole:
         return None
     
 
-    subst = {}
-        
-    # Pour chaque paire de termes (t1, t2), unifier en accumulant les substitutions
-    for t1, t2 in zip(p1.enfants, p2.enfants):
-        # Créer un TermStore avec un seul terme (t2)
-        termes = SetStore()
-        termes.push(t2)
-            
-        # Utiliser unifyAll avec la substitution accumulée
-        subst = unifyAll(t1, termes, SetStore(), subst)
-            
+    # Les arguments forment un seul terme virtuel P(t1, ..., tn) = P(u1, ..., un) : une seule passe
+    # sur un seul store. Empilés à l'envers pour traiter les arguments dans l'ordre.
+    store = ListStore()
+    for t1, t2 in zip(reversed(p1.enfants), reversed(p2.enfants)):
+        store.push(Equation(t1, t2))
+    return _resoudre(store, Substitution(), None, occurs)
+
+
+def unifier_lot(requete: Litteral, candidats: Iterable[Litteral], limite: Optional[int] = None,
+                occurs: str = OCCURS_TOUJOURS) -> Iterator[Tuple[Litteral, Substitution]]:
+    """
+    Unifie un littéral avec chacun des candidats (même contrat que unifLitteraux pour chaque paire),
+    en ne préparant la requête qu'une fois : symboles de tête de ses arguments (cf. candidats_compatibles),
+    et si elle est close, comparaison directe avec les candidats clos. Un seul store sert pour tous les candidats.
+
+    Args:
+        requete: Littéral de référence.
+        candidats: Littéraux à tester (parcourus une seule fois, au fur et à mesure).
+        limite: Nombre maximal de résultats (tous si None).
+        occurs: Politique d'occurs check (cf. unify).
+
+    Yields:
+        (candidat, substitution) pour chaque candidat unifiable, dans l'ordre des candidats.
+
+    Example:
+        >>> dict(unifier_lot(p1, preds))          # tous les unifiables
+        >>> next(unifier_lot(p1, preds), None)    # le premier, sans tester les suivants
+    """
+    if limite is not None and limite <= 0:
+        return
+    from unification.compilateur import compiler
+    filtre = compiler(requete, occurs)
+    trouves = 0
+    for candidat in candidats_compatibles(requete, candidats):
+        subst = filtre(candidat)
         if subst is None:
+            continue
+        yield candidat, subst
+        trouves += 1
+        if limite is not None and trouves >= limite:
+            return
+
+
+# Filtrage (matching) =========================================================
+#
+# Seules les variables du motif sont liées, celles de l'instance sont traitées comme des constantes :
+# pas d'occurs check, et aucune substitution n'est appliquée côté instance. La substitution obtenue
+# s'applique une seule fois au motif (motif.σ == instance), elle n'est pas à résoudre en chaîne :
+# c'est une SubstitutionSimultanee, car motif et instance peuvent partager des noms de variables
+# (filtrer(p(X, Y), p(Y, a)) = {X -> Y, Y -> a}, qui appliquée à p(X, Y) donne p(Y, a) et non p(a, a)).
+
+def filtrer(pattern: NoeudTerme, instance: NoeudTerme, subst: Optional[SubstitutionSimultanee] = None) -> Optional[SubstitutionSimultanee]:
+    """
+    Filtrage (unification à sens unique) : cherche σ, ne liant que des variables de `pattern`, telle que pattern.σ = instance.
+
+    Args:
+        pattern: Le motif (ses variables peuvent être liées).
+        instance: Le terme filtré (ses variables sont des constantes).
+        subst: Liaisons déjà faites (complétée et retournée), par exemple pour les autres arguments d'un littéral.
+
+    Returns:
+        La substitution si `instance` est une instance de `pattern`, None sinon.
+
+    Example:
+        >>> filtrer(f(X, g(Y)), f(a, g(X)))
+        {'X': a, 'Y': X}
+        >>> filtrer(f(X, X), f(a, b)) is None
+        True
+        >>> filtrer(f(a), f(X)) is None     # X n'est pas lié par le filtrage
+        True
+    """
+    if subst is None:
+        subst = SubstitutionSimultanee()
+    pile = [(pattern, instance)]
+    while pile:
+        motif, terme = pile.pop()
+        if motif.etiquette == ETIQUETTE_VAR:
+            lie = subst.get(motif.nom)
+            if lie is None:
+                subst[motif.nom] = terme
+            elif lie is not terme and lie != terme:
+                return None
+        elif motif.est_clos:
+            # Sous-motif clos : l'instance doit être le même terme
+            if motif is not terme and motif != terme:
+                return None
+        elif motif.symbole != terme.symbole:
             return None
-        
+        else:
+            pile.extend(zip(motif.enfants, terme.enfants))
     return subst
-    
 
-def rechercherUnifiablesSimple(p1: Litteral, preds: TermStore[Litteral], touteUnif: bool = True) -> Dict[Litteral, Dict]:
+
+def filtrerLitteraux(motif: Litteral, instance: Litteral) -> Optional[SubstitutionSimultanee]:
+    """
+    Filtrage d'un littéral par un autre (même signe, même prédicat et même arité) : substitution σ,
+    ne liant que des variables de `motif`, telle que motif.σ = instance, ou None.
+    """
+    if motif.sign != instance.sign or motif.symbole != instance.symbole:
+        return None
+    subst = SubstitutionSimultanee()
+    for t1, t2 in zip(motif.enfants, instance.enfants):
+        if filtrer(t1, t2, subst) is None:
+            return None
+    return subst
+
+
+# Variante union-find (Huet) ==================================================
+#
+# unify réapplique toute la substitution aux deux membres de chaque équation dépilée, et fait un
+# occurs check à chaque liaison : c'est quadratique (ou pire) sur des chaînes X1 = f(X2), X2 = f(X3)...
+# Ici les variables sont regroupées en classes (union-find avec compression de chemin), chaque classe
+# pointe au plus vers un terme non variable (liaison triangulaire, le terme n'est jamais réécrit),
+# et l'occurs check est remplacé par une seule détection de cycle à la fin.
+
+class _ClassesDeVariables:
+    """
+    Classes d'équivalence de variables.
+
+    Attributes:
+        parent  (Dict[str, str])        : Parent de chaque variable déjà fusionnée (une variable absente est son propre représentant).
+        taille  (Dict[str, int])        : Taille de la classe de chaque représentant (1 si absent), pour l'union par taille.
+        valeur  (Dict[str, NoeudTerme]) : Terme non variable auquel est lié un représentant.
+    """
+    __slots__ = ("parent", "taille", "valeur")
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.taille: Dict[str, int] = {}
+        self.valeur: Dict[str, NoeudTerme] = {}
+
+    def trouver(self, nom: str) -> str:
+        """Représentant de la classe de `nom`, avec compression de chemin."""
+        parent = self.parent
+        racine = nom
+        while racine in parent:
+            racine = parent[racine]
+        while nom != racine:
+            parent[nom], nom = racine, parent[nom]
+        return racine
+
+    def unir(self, r1: str, r2: str) -> Optional[Tuple[NoeudTerme, NoeudTerme]]:
+        """
+        Fusionne les classes de deux représentants distincts (union par taille). La classe fusionnée
+        garde la valeur de l'une ou l'autre ; si les deux étaient liées, retourne le couple de valeurs,
+        qu'il reste à unifier.
+        """
+        taille1, taille2 = self.taille.get(r1, 1), self.taille.get(r2, 1)
+        if taille1 < taille2:
+            r1, r2 = r2, r1
+        self.parent[r2] = r1
+        self.taille[r1] = taille1 + taille2
+        valeur2 = self.valeur.pop(r2, None)
+        if valeur2 is None:
+            return None
+        valeur1 = self.valeur.setdefault(r1, valeur2)
+        return None if valeur1 is valeur2 else (valeur1, valeur2)
+
+    def contient_cycle(self) -> bool:
+        """
+        Occurs check global : cherche un cycle dans le graphe « représentant -> représentants des
+        variables de sa valeur » (parcours en profondeur itératif).
+        """
+        valeur = self.valeur
+        etat: Dict[str, bool] = {} # False : en cours de visite, True : terminé
+        for depart in valeur:
+            if depart in etat:
+                continue
+            etat[depart] = False
+            pile = [(depart, iter(valeur[depart].variables))]
+            while pile:
+                noeud, suivants = pile[-1]
+                for nom in suivants:
+                    successeur = self.trouver(nom)
+                    if successeur not in valeur:
+                        continue # Variable libre : pas de successeur
+                    vu = etat.get(successeur)
+                    if vu is False:
+                        return True
+                    if vu is None:
+                        etat[successeur] = False
+                        pile.append((successeur, iter(valeur[successeur].variables)))
+                        break
+                else:
+                    etat[noeud] = True
+                    pile.pop()
+        return False
+
+    def substitution(self) -> Substitution:
+        """Substitution triangulaire : chaque variable vers son représentant, chaque représentant lié vers sa valeur."""
+        subst = Substitution()
+        for nom in self.parent:
+            racine = self.trouver(nom)
+            if racine != nom:
+                subst[nom] = FabriqueDeTermes.creer_var(racine)
+        subst.update(self.valeur)
+        return subst
+
+
+def _resoudre_uf(store: TermStore, subst_init: Optional[Substitution] = None) -> Optional[Substitution]:
+    """
+    Résout les équations du store avec les classes de variables.
+
+    Args:
+        store: Équations à résoudre (consommées).
+        subst_init: Substitution de départ, ajoutée au système sous forme d'équations.
+
+    Returns:
+        La substitution triangulaire, ou None en cas de clash ou de cycle.
+    """
+    if subst_init:
+        for nom, terme in subst_init.items():
+            store.push(Equation(FabriqueDeTermes.creer_var(nom), terme))
+
+    classes = _ClassesDeVariables()
+    valeur = classes.valeur
+    decomposes = set() # Couples (valeur, terme) déjà décomposés
+
+    while not store.is_empty():
+        eq = store.pop()
+        gauche, droite = eq.left, eq.right
+        if gauche is droite:
+            continue # Termes internés identiques
+
+        if gauche.etiquette == ETIQUETTE_VAR and droite.etiquette == ETIQUETTE_VAR:
+            # Les classes sont fusionnées avant de comparer leurs valeurs : une seule équation
+            # valeur = valeur, et chaque fusion fait baisser le nombre de classes (terminaison)
+            r_gauche, r_droite = classes.trouver(gauche.nom), classes.trouver(droite.nom)
+            if r_gauche != r_droite:
+                valeurs = classes.unir(r_gauche, r_droite)
+                if valeurs is not None:
+                    store.push(Equation(*valeurs))
+            continue
+
+        if droite.etiquette == ETIQUETTE_VAR:
+            gauche, droite = droite, gauche
+        if gauche.etiquette == ETIQUETTE_VAR:
+            # Variable = terme non variable : on lie la classe, ou on compare à sa valeur
+            r_gauche = classes.trouver(gauche.nom)
+            gauche = valeur.get(r_gauche)
+            if gauche is None:
+                valeur[r_gauche] = droite
+                continue
+            if gauche is droite:
+                continue
+            # Sans classes de termes, valeur = terme peut revenir indéfiniment (X lié à f(f(X)), puis
+            # X = f(X)) : chaque couple n'est décomposé qu'une fois, et les couples de sous-termes
+            # des équations de départ sont en nombre fini
+            couple = (id(gauche), id(droite))
+            if couple in decomposes:
+                continue
+            decomposes.add(couple)
+
+        # Deux termes non variables : même symbole puis décomposition
+        if gauche.symbole != droite.symbole:
+            return None
+        for enfant_gauche, enfant_droite in zip(gauche.enfants, droite.enfants):
+            store.push(Equation(enfant_gauche, enfant_droite))
+
+    if classes.contient_cycle():
+        return None
+    return classes.substitution()
+
+
+def unifyUF(t1: NoeudTerme, t2: NoeudTerme, store: TermStore, subst: Substitution) -> Optional[Substitution]:
+    """
+    Même contrat que unify (le MGU est écrit dans `subst` et retourné), avec le moteur union-find.
+    La substitution retournée est triangulaire : voir Substitution.resolve pour obtenir les termes résolus.
+    """
+    store.push(Equation(t1, t2))
+    resultat = _resoudre_uf(store, subst)
+    if resultat is None:
+        return None
+    subst.clear()
+    subst.update(resultat)
+    return subst
+
+
+def unifyAllUF(t1: NoeudTerme, tn: TermStore, store: TermStore, subst_init: Substitution = None) -> Optional[Substitution]:
+    """
+    Même contrat que unifyAll, avec le moteur union-find : toutes les équations t1 = t (t de tn)
+    sont résolues en une seule passe.
+    """
+    while not tn.is_empty():
+        store.push(Equation(t1, tn.pop()))
+    return _resoudre_uf(store, subst_init)
+
+
+def unifLitterauxUF(p1: Litteral, p2: Litteral) -> Optional[Substitution]:
+    """
+    Même contrat que unifLitteraux, avec le moteur union-find : les équations de tous les
+    arguments sont résolues ensemble.
+    """
+    if p1.sign == p2.sign or p1.symbole != p2.symbole:
+        return None
+    store = ListStore()
+    for t1, t2 in zip(p1.enfants, p2.enfants):
+        store.push(Equation(t1, t2))
+    return _resoudre_uf(store)
+
+
+def rechercherUnifiablesSimple(p1: Litteral, preds: TermStore[Litteral], touteUnif: bool = True, unificateur: Callable[[Litteral, Litteral], Optional[Substitution]] = None,
+                               occurs: str = OCCURS_TOUJOURS) -> Dict[Litteral, Dict]:
     """
     Recherche "bêtement" tous les littéraux unifiables avec p1 dans un ensemble de littéraux.
     
@@ -324,6 +655,9 @@ def rechercherUnifiablesSimple(p1: Litteral, preds: TermStore[Litteral], touteUn
     Args:
         p1 (Litteral): Le littéral de référence à unifier.
         preds (TermStore[Litteral]): Ensemble de littéraux candidats.
+        unificateur: Fonction d'unification de deux littéraux (par défaut, Robinson via unifier_lot,
+                     ou robinson_plat.unifLitterauxPlat pour unifier sur l'encodage plat).
+        occurs: Politique d'occurs check de l'unification par défaut (cf. unify).
     
     Returns:
         Dict[Litteral, Dict]: Dictionnaire associant chaque littéral unifiable à sa substitution.
@@ -336,37 +670,97 @@ def rechercherUnifiablesSimple(p1: Litteral, preds: TermStore[Litteral], touteUn
         >>> result = rechercherUnifiablesSimple(p1, preds)
         >>> # result = {¬P(a, b): {X/a, Y/b}}
     """
+    # Si on ne veut qu'une seule unification, on s'arrête à la première
+    return dict(_unifiables(p1, preds, None if touteUnif else 1, unificateur, occurs))
+
+def rechercherUnifiablesOptimise(p1: Litteral, preds: TermStore[Litteral], touteUnif: bool = True, unificateur: Callable[[Litteral, Litteral], Optional[Substitution]] = None,
+                                 occurs: str = OCCURS_TOUJOURS) -> Dict[Litteral, Dict]:
+    """
+    Recherche optimisée qui exploite l'indexation de DictStore ou PathIndexStore si disponible.
+    Si un autre store est passé, se rabat sur la méthode simple.
+    `unificateur`, `occurs` : voir rechercherUnifiablesSimple.
+    """
+    return dict(rechercherUnifiablesIter(p1, preds, None if touteUnif else 1, unificateur, occurs))
+
+def rechercherUnifiablesIter(p1: Litteral, preds: TermStore[Litteral], limite: Optional[int] = None, unificateur: Callable[[Litteral, Litteral], Optional[Substitution]] = None,
+                             occurs: str = OCCURS_TOUJOURS) -> Iterator[Tuple[Litteral, Substitution]]:
+    """
+    Version paresseuse de rechercherUnifiablesOptimise : les couples (littéral, substitution) sont produits
+    au fur et à mesure, et la recherche s'arrête après `limite` résultats (tous si None).
+    L'appelant peut aussi s'arrêter à tout moment : les candidats suivants ne sont pas testés.
+
+    Example:
+        >>> for p, subst in rechercherUnifiablesIter(p1, preds, limite=10):
+        ...     traiter(p, subst)
+    """
+    # Si c'est un store indexé (DictStore, PathIndexStore), on ne parcourt QUE les candidats valides
+    if isinstance(preds, (DictStore, PathIndexStore)):
+        candidats = preds.get_candidats_resolution(p1)
+    else:
+        # Fallback pour ListStore et SetStore : on parcourt tout le monde
+        candidats = preds
+    return _unifiables(p1, candidats, limite, unificateur, occurs)
+
+def _unifiables(p1: Litteral, candidats: Iterable[Litteral], limite: Optional[int], unificateur: Optional[Callable],
+                occurs: str = OCCURS_TOUJOURS) -> Iterator[Tuple[Litteral, Substitution]]:
+    """Couples (candidat, substitution) unifiables avec p1, au plus `limite` (Robinson compilé par défaut, cf. unifier_lot)."""
+    if unificateur is None:
+        yield from unifier_lot(p1, candidats, limite, occurs)
+        return
+    if limite is not None and limite <= 0:
+        return
+    trouves = 0
+    for p in candidats:
+        subst = unificateur(p1, p)
+        if subst is not None:
+            yield p, subst
+            trouves += 1
+            if limite is not None and trouves >= limite:
+                return
+
+
+def _candidats_filtrage(p1: Litteral, preds: TermStore[Litteral]) -> Iterable[Litteral]:
+    """Littéraux de même signe que p1 (DictStore, PathIndexStore : seulement ceux de même prédicat), candidats au filtrage."""
+    if isinstance(preds, (DictStore, PathIndexStore)):
+        return preds.get_candidats(p1, p1.sign)
+    return preds
+
+def rechercherInstances(p1: Litteral, preds: TermStore[Litteral], touteUnif: bool = True) -> Dict[Litteral, Substitution]:
+    """
+    Recherche les littéraux de l'ensemble qui sont des instances de p1 (p1 les subsume) : p tel que p1.σ = p.
+    Exploite l'indexation de DictStore si disponible.
+
+    Returns:
+        Dict[Litteral, Substitution]: Chaque instance trouvée, avec la substitution σ (sur les variables de p1).
+
+    Example:
+        >>> rechercherInstances(P(X, Y), preds)     # preds contient P(a, b), P(a, X), ¬P(a, b)
+        >>> # {P(a, b): {X/a, Y/b}, P(a, X): {X/a, Y/X}}
+    """
     result = {}
-    for p in preds:
-        subst = unifLitteraux(p1, p)
+    for p in _candidats_filtrage(p1, preds):
+        subst = filtrerLitteraux(p1, p)
         if subst is not None:
             result[p] = subst
-            # Si on ne veut qu'une seule unification, on coupe la boucle !
             if not touteUnif:
                 break
     return result
 
-def rechercherUnifiablesOptimise(p1: Litteral, preds: TermStore[Litteral], touteUnif: bool = True) -> Dict[Litteral, Dict]:
+def rechercherGeneralisations(p1: Litteral, preds: TermStore[Litteral], touteUnif: bool = True) -> Dict[Litteral, Substitution]:
     """
-    Recherche optimisée qui exploite l'indexation de DictStore si disponible.
-    Si un autre store est passé, se rabat sur la méthode simple.
+    Recherche les littéraux de l'ensemble dont p1 est une instance (qui subsument p1) : p tel que p.σ = p1.
+    Exploite l'indexation de DictStore si disponible.
+
+    Returns:
+        Dict[Litteral, Substitution]: Chaque généralisation trouvée, avec la substitution σ (sur les variables de p).
     """
     result = {}
-    
-    # Si c'est notre dictionnaire optimisé, on ne parcourt QUE les candidats valides
-    if isinstance(preds, DictStore):
-        candidats = preds.get_candidats_resolution(p1)
-    else:
-        # Fallback pour ListStore et SetStore : on parcourt tout le monde
-        candidats = preds
-        
-    for p in candidats:
-        subst = unifLitteraux(p1, p)
+    for p in _candidats_filtrage(p1, preds):
+        subst = filtrerLitteraux(p, p1)
         if subst is not None:
             result[p] = subst
             if not touteUnif:
                 break
-            
     return result
 
 
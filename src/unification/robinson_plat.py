@@ -0,0 +1,184 @@
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from unification.utils.logique.terme import NoeudTerme
+from unification.utils.logique.terme_plat import TermePlat
+from unification.utils.logique.litteral import Litteral
+from unification.utils.logique.substitution import Substitution
+
+
+"""
+Unification de Robinson directement sur la représentation plate (cf. utils/logique/terme_plat.py).
+
+Aucun NoeudTerme ni Equation n'est construit pendant l'unification : un sous-terme est désigné
+par un entier `position * 2 + cote` (cote 0 pour le premier terme, 1 pour le second), la pile de
+travail est une liste d'entiers et les liaisons sont un array('i') indexé par variable.
+
+Comme pour robinson.unify, deux variables de même nom dans les deux termes sont la même variable.
+"""
+
+NON_LIE = -1
+
+
+class ResultatPlat:
+    """
+    MGU calculé par `unifier_plats`, sous forme triangulaire.
+
+    Attributes:
+        liaisons    (array)             : liaisons[v] = position * 2 + cote du terme lié à la variable v, ou -1.
+        noms        (List[str])         : Nom de chaque variable v.
+        plats       (Tuple[TermePlat])  : Les deux termes unifiés (cote 0 et cote 1).
+    """
+    __slots__ = ("liaisons", "noms", "plats")
+
+    def __init__(self, liaisons: array, noms: List[str], plats: Tuple[TermePlat, TermePlat]):
+        self.liaisons = liaisons
+        self.noms = noms
+        self.plats = plats
+
+    def vers_substitution(self) -> Substitution:
+        """
+        Convertit les liaisons en substitution (nom de variable -> terme), au même format que robinson.unify.
+        Les termes ne sont reconstruits qu'ici.
+        """
+        substitution = Substitution()
+        for v, ref in enumerate(self.liaisons):
+            if ref != NON_LIE:
+                substitution[self.noms[v]] = self.plats[ref & 1].vers_terme(ref >> 1)
+        return substitution
+
+    def __repr__(self) -> str:
+        return repr(self.vers_substitution())
+
+
+def _correspondance_variables(plat1: TermePlat, plat2: TermePlat) -> Tuple[List[int], List[str]]:
+    """
+    Numérote les variables des deux termes dans un espace commun : celles de plat1 gardent
+    leur indice, celles de plat2 qui ont le même nom qu'une variable de plat1 la rejoignent,
+    les autres sont numérotées à la suite.
+
+    Returns:
+        (indices de plat2 dans l'espace commun, noms de toutes les variables)
+    """
+    noms = list(plat1.variables)
+    if not plat2.variables:
+        return [], noms
+    index = {nom: k for k, nom in enumerate(noms)}
+    correspondance = []
+    for nom in plat2.variables:
+        k = index.get(nom)
+        if k is None:
+            k = len(noms)
+            noms.append(nom)
+        correspondance.append(k)
+    return correspondance, noms
+
+
+def unifier_plats(plat1: TermePlat, plat2: TermePlat) -> Optional[ResultatPlat]:
+    """
+    Algorithme de Robinson sur deux termes (ou littéraux) plats.
+
+    Args:
+        plat1, plat2 (TermePlat)    : Les termes à unifier (position 0 = racine).
+
+    Returns:
+        Optional[ResultatPlat]      : Le MGU sous forme de liaisons, None si les termes ne sont pas unifiables.
+    """
+    symboles = (plat1.symboles, plat2.symboles)
+    fins = (plat1.fins, plat2.fins)
+
+    # Test de la racine avant toute allocation (prédicat + arité pour un littéral)
+    if symboles[0][0] >= 0 and symboles[1][0] >= 0 and symboles[0][0] != symboles[1][0]:
+        return None
+
+    correspondance, noms = _correspondance_variables(plat1, plat2)
+    liaisons = array('i', [NON_LIE]) * len(noms)
+
+    def variable(cote: int, code: int) -> int:
+        # Indice commun de la variable encodée par `code` (< 0) du côté `cote`
+        return -code - 1 if cote == 0 else correspondance[-code - 1]
+
+    def dereferencer(ref: int) -> Tuple[int, int]:
+        # Suit les liaisons ; retourne (ref, v) où v est la variable libre atteinte, ou -1 si ref est un terme
+        while True:
+            code = symboles[ref & 1][ref >> 1]
+            if code >= 0:
+                return ref, -1
+            v = variable(ref & 1, code)
+            lien = liaisons[v]
+            if lien == NON_LIE:
+                return ref, v
+            ref = lien
+
+    def apparait(v: int, ref: int) -> bool:
+        # Occur check : la variable libre v apparaît-elle dans le terme ref (après application des liaisons) ?
+        # Chaque variable liée n'est suivie qu'une fois : les termes liés peuvent partager des variables (DAG)
+        vues = set()
+        a_visiter = [ref]
+        while a_visiter:
+            ref = a_visiter.pop()
+            cote = ref & 1
+            syms = symboles[cote]
+            i = ref >> 1
+            fin = fins[cote][i]
+            while i < fin:
+                code = syms[i]
+                if code < 0:
+                    w = variable(cote, code)
+                    if w == v:
+                        return True
+                    if liaisons[w] != NON_LIE and w not in vues:
+                        vues.add(w)
+                        a_visiter.append(liaisons[w])
+                i += 1
+        return False
+
+    pile = [0, 1]  # paires (ref gauche, ref droite) à plat
+    while pile:
+        droite, v_droite = dereferencer(pile.pop())
+        gauche, v_gauche = dereferencer(pile.pop())
+
+        if v_gauche >= 0:
+            if v_gauche == v_droite:
+                continue
+            if v_droite < 0 and apparait(v_gauche, droite):
+                return None
+            liaisons[v_gauche] = droite
+            continue
+
+        if v_droite >= 0:
+            if apparait(v_droite, gauche):
+                return None
+            liaisons[v_droite] = gauche
+            continue
+
+        # Deux termes : même symbole (donc même arité), puis on empile les enfants deux à deux
+        cote_g, i = gauche & 1, gauche >> 1
+        cote_d, j = droite & 1, droite >> 1
+        if symboles[cote_g][i] != symboles[cote_d][j]:
+            return None
+        fins_g, fins_d = fins[cote_g], fins[cote_d]
+        fin = fins_g[i]
+        i += 1
+        j += 1
+        while i < fin:
+            pile.append(i * 2 + cote_g)
+            pile.append(j * 2 + cote_d)
+            i = fins_g[i]
+            j = fins_d[j]
+
+    return ResultatPlat(liaisons, noms, (plat1, plat2))
+
+
+def unifLitterauxPlat(p1: Litteral, p2: Litteral) -> Optional[Substitution]:
+    """
+    Même contrat que robinson.unifLitteraux (signes opposés, même prédicat, même arité),
+    mais l'unification se fait sur l'encodage plat des littéraux (mis en cache dans Litteral.plat).
+
+    Returns:
+        Substitution commune entre p1 et p2 si possible, None sinon.
+    """
+    if p1.sign == p2.sign or p1.symbole != p2.symbole:
+        return None
+    resultat = unifier_plats(p1.plat, p2.plat)
+    return resultat.vers_substitution() if resultat is not None else None
@@ -0,0 +1,506 @@
+import time
+import gc
+from itertools import count
+
+from unification.utils.logique.litteral import Litteral
+from unification.utils.logique.terme import NoeudTerme, FabriqueDeTermes, ETIQUETTE_VAR
+from unification.utils.logique.signature import SIGNATURE
+from unification.utils.logique.substitution import Substitution, verifier_politique, OCCURS_TOUJOURS
+from unification.compilateur import compiler
+from unification.robinson import filtrerLitteraux
+from unification.discrimination_tree import ResultatRecherche, PointeurFeuille
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterator
+
+
+# Deux sortes de variables dans les substitutions de l'arbre :
+#   - les variables d'indicateur (□a1, □a2, ... pour les arguments du littéral, puis □1, □2, ...) :
+#     les "trous" que les noeuds suivants remplissent,
+#   - les variables des littéraux insérés, normalisées en *1, *2, ... dans l'ordre de première apparition.
+# Exemple : P(f(a), X) et P(f(b), X) donnent   {□a1 ↦ f(□1), □a2 ↦ *1}
+#                                               ├── {□1 ↦ a}  -> P(f(a), X)
+#                                               └── {□1 ↦ b}  -> P(f(b), X)
+PREFIXE_INDICATEUR = "□"
+PREFIXE_VARIABLE = "*"
+
+# Nature de la recherche
+UNIFIABLES = "unifiables"           # Littéraux de signe opposé unifiables avec la requête
+INSTANCES = "instances"             # Littéraux de même signe instances de la requête (la requête les subsume)
+GENERALISATIONS = "generalisations" # Littéraux de même signe dont la requête est une instance
+
+# Liaisons d'un noeud : nom de variable d'indicateur -> terme
+Liaisons = Dict[str, NoeudTerme]
+
+# Types ========================================================
+
+def _est_indicateur(terme: NoeudTerme) -> bool:
+    return terme.etiquette == ETIQUETTE_VAR and terme.nom[0] == PREFIXE_INDICATEUR
+
+
+def _appliquer(liaisons: Liaisons, terme: NoeudTerme) -> NoeudTerme:
+    """Remplace dans `terme` les variables d'indicateur liées par `liaisons`."""
+    if terme.variables.isdisjoint(liaisons):
+        return terme
+    if terme.etiquette == ETIQUETTE_VAR:
+        return liaisons[terme.nom]
+    return FabriqueDeTermes.creer_fonc(terme.nom, terme.etiquette, [_appliquer(liaisons, enfant) for enfant in terme.enfants])
+
+
+def _filtrer(motif: NoeudTerme, terme: NoeudTerme, liaisons: Liaisons) -> bool:
+    """
+    Filtrage de `terme` par `motif`, dont les seules variables sont les indicateurs (chacun n'apparaît
+    qu'une fois dans l'arbre : pas de cohérence à vérifier). Complète `liaisons`.
+    """
+    if motif is terme or motif == terme:
+        return True
+    if motif.etiquette == ETIQUETTE_VAR:
+        if motif.nom[0] != PREFIXE_INDICATEUR:
+            return False
+        liaisons[motif.nom] = terme
+        return True
+    if terme.etiquette == ETIQUETTE_VAR or motif.symbole != terme.symbole:
+        return False
+    return all(_filtrer(m, t, liaisons) for m, t in zip(motif.enfants, terme.enfants))
+
+# Structure Arbre ========================================================
+
+class NoeudArbreDeSubstitution:
+    """
+    Classe d'un noeud dans l'arbre de substitution.
+
+    Attributes:
+        substitution    (Liaisons)                          :   Liaisons de variables d'indicateur faites par ce noeud.
+        enfants         (List['NoeudArbreDeSubstitution'])  :   Noeuds enfants (vide pour une feuille).
+        pointeurs       (List[PointeurFeuille])             :   Littéraux (à renommage près identiques) d'une feuille.
+    """
+    __slots__ = ("substitution", "enfants", "pointeurs", "_pointeurs_ids")
+
+    def __init__(self, substitution: Liaisons) -> None:
+        self.substitution = substitution
+        self.enfants: List[NoeudArbreDeSubstitution] = []
+        self.pointeurs: List[PointeurFeuille] = []
+        self._pointeurs_ids: set = set()
+
+# Arbre de Substitution ========================================================
+
+class ArbreDeSubstitution:
+    """
+    Arbre de substitution (Graf) pour stocker des littéraux.
+    Permet la recherche des littéraux unifiables, des instances et des généralisations.
+
+    Chaque noeud porte une substitution sur des variables d'indicateur ; la composition des substitutions
+    d'un chemin racine -> feuille redonne le littéral de la feuille (variables normalisées). Contrairement
+    à l'arbre de discrimination, où chaque variable fait une branche *k, les littéraux partagent tout ce
+    qu'ils ont en commun (le plus spécifique généralisant commun, calculé à l'insertion), variables comprises.
+
+    Il y a un arbre par (prédicat, arité) et par signe ; sa racine (substitution vide) a pour variables
+    d'indicateur □a1 ... □an les arguments du littéral.
+
+    La recherche est un filtrage grossier (chaque variable peut prendre une valeur différente à chacune
+    de ses occurrences) suivi de la vérification exacte des littéraux des feuilles atteintes.
+
+    Attributes:
+        racines (Dict)          :   (symbole du prédicat, signe) -> racine de l'arbre correspondant.
+        unificateur (Callable)  :   Unification des candidats (Litteral, Litteral) -> substitution ou None.
+                                    Par défaut, la requête compilée en filtre (cf. compilateur.py).
+        occurs (str)            :   Politique d'occurs check du filtre compilé (cf. substitution.py).
+    """
+
+    def __init__(self, unificateur: Optional[Callable[[Litteral, Litteral], Optional[Substitution]]] = None,
+                 occurs: str = OCCURS_TOUJOURS) -> None:
+        self.racines: Dict[Tuple[int, bool], NoeudArbreDeSubstitution] = {}
+        self.unificateur = unificateur
+        self.occurs = verifier_politique(occurs)
+        self._indicateurs = count(1) # Numéros des variables d'indicateur créées
+        self._taille = 0
+        self._requete_compilee: Optional[Litteral] = None # Dernière requête compilée, et son filtre
+        self._filtre: Optional[Callable[[Litteral], Optional[Substitution]]] = None
+
+    def __len__(self) -> int:
+        return self._taille
+
+    # Insertion ----------------------------------------------------
+
+    def inserer(self, predicat: Litteral, pointeur: Any) -> None:
+        """
+        Insère un prédicat dans l'arbre de substitution avec un pointeur associé.
+
+        On descend tant qu'un enfant généralise ce qui reste à insérer. Sinon, le premier enfant qui partage
+        quelque chose avec le prédicat est remplacé par un noeud portant leur généralisation commune la plus
+        spécifique, avec pour enfants l'ancien noeud et une nouvelle feuille ; à défaut, on ajoute une feuille.
+
+        Args:
+            prédicat    (Litteral)      :   Le prédicat à insérer dans l'arbre
+            pointeur    (Any)           :   Un pointeur à associer avec ce prédicat.
+        """
+        cle = (predicat.symbole, predicat.sign)
+        noeud = self.racines.get(cle)
+        if noeud is None:
+            noeud = self.racines[cle] = NoeudArbreDeSubstitution({})
+        reste = self._liaisons_insertion(predicat)
+
+        while reste:
+            partage = None
+            for i, enfant in enumerate(noeud.enfants):
+                suite, commun = self._comparer(enfant.substitution, reste)
+                if suite is not None:
+                    noeud, reste = enfant, suite
+                    break
+                if partage is None and commun:
+                    partage = i
+            else:
+                feuille = self._ajouter_feuille(noeud, partage, reste)
+                noeud, reste = feuille, {}
+
+        # Ajout du pointeur à la feuille
+        pointeur_id = id(pointeur) if not isinstance(pointeur, str) else pointeur
+        if pointeur_id not in noeud._pointeurs_ids:
+            noeud._pointeurs_ids.add(pointeur_id)
+            noeud.pointeurs.append(PointeurFeuille(predicat=predicat, pointeur=pointeur))
+            self._taille += 1
+
+    def _ajouter_feuille(self, noeud: NoeudArbreDeSubstitution, partage: Optional[int], reste: Liaisons) -> NoeudArbreDeSubstitution:
+        """Ajoute une feuille pour `reste` sous `noeud`, en séparant l'enfant n° `partage` s'il est donné."""
+        if partage is None:
+            feuille = NoeudArbreDeSubstitution(reste)
+            noeud.enfants.append(feuille)
+            return feuille
+
+        enfant = noeud.enfants[partage]
+        commun, propre_enfant, propre_feuille = self._generaliser(enfant.substitution, reste)
+        milieu = NoeudArbreDeSubstitution(commun)
+        enfant.substitution = propre_enfant
+        feuille = NoeudArbreDeSubstitution(propre_feuille)
+        milieu.enfants = [enfant, feuille]
+        noeud.enfants[partage] = milieu
+        return feuille
+
+    def _generaliser(self, sigma: Liaisons, tau: Liaisons) -> Tuple[Liaisons, Liaisons, Liaisons]:
+        """
+        Généralisation commune la plus spécifique (anti-unification) de `sigma` et `tau` sur le domaine de sigma.
+        Retourne (commun, propre_sigma, propre_tau) : commun suivi de propre_sigma redonne sigma, commun suivi
+        de propre_tau redonne tau (propre_tau contient aussi les liaisons de tau hors du domaine de sigma).
+        """
+        propre_sigma: Liaisons = {}
+        propre_tau: Liaisons = {x: t for x, t in tau.items() if x not in sigma}
+
+        def anti_unifier(s: NoeudTerme, t: NoeudTerme) -> NoeudTerme:
+            if s is t or s == t:
+                return s
+            if _est_indicateur(s):
+                # Trou de sigma rempli plus bas : c'est aussi un trou du commun
+                propre_tau[s.nom] = t
+                return s
+            if s.enfants and t.etiquette != ETIQUETTE_VAR and s.symbole == t.symbole:
+                return FabriqueDeTermes.creer_fonc(s.nom, s.etiquette, [anti_unifier(a, b) for a, b in zip(s.enfants, t.enfants)])
+            indicateur = FabriqueDeTermes.creer_var(f"{PREFIXE_INDICATEUR}{next(self._indicateurs)}")
+            propre_sigma[indicateur.nom] = s
+            propre_tau[indicateur.nom] = t
+            return indicateur
+
+        commun = {x: anti_unifier(s, tau[x]) for x, s in sigma.items()}
+        return commun, propre_sigma, propre_tau
+
+    @staticmethod
+    def _comparer(sigma: Liaisons, reste: Liaisons) -> Tuple[Optional[Liaisons], bool]:
+        """
+        Compare la substitution d'un enfant à ce qui reste à insérer. Retourne :
+          - ce qui reste à lier sous l'enfant si sigma généralise `reste` (None sinon),
+          - s'ils ont un symbole de tête en commun sur l'une des variables liées par sigma (partage possible).
+        Les symboles de tête sont comparés d'abord : la plupart des enfants sont écartés sans rien construire.
+        """
+        commun = False
+        generalise = True
+        for x, s in sigma.items():
+            t = reste[x]
+            if s is t:
+                commun = True
+            elif s.etiquette == ETIQUETTE_VAR:
+                if s.nom[0] != PREFIXE_INDICATEUR:
+                    generalise = False
+            elif t.etiquette != ETIQUETTE_VAR and s.symbole == t.symbole:
+                commun = True
+            else:
+                generalise = False
+        if not generalise:
+            return None, commun
+        return ArbreDeSubstitution._descendre(sigma, reste), commun
+
+    @staticmethod
+    def _descendre(sigma: Liaisons, reste: Liaisons) -> Optional[Liaisons]:
+        """Si `sigma` généralise `reste`, ce qui reste à lier sous le noeud de sigma ; None sinon."""
+        suite = {x: t for x, t in reste.items() if x not in sigma}
+        for x, s in sigma.items():
+            if not _filtrer(s, reste[x], suite):
+                return None
+        return suite
+
+    def _liaisons_insertion(self, predicat: Litteral) -> Liaisons:
+        """Liaisons des arguments □a1 ... □an aux arguments du prédicat, variables normalisées en *1, *2, ..."""
+        renommage: Dict[str, NoeudTerme] = {}
+
+        def normaliser(terme: NoeudTerme) -> NoeudTerme:
+            if terme.est_clos:
+                return terme
+            if terme.etiquette == ETIQUETTE_VAR:
+                nouveau = renommage.get(terme.nom)
+                if nouveau is None:
+                    nouveau = renommage[terme.nom] = FabriqueDeTermes.creer_var(f"{PREFIXE_VARIABLE}{len(renommage) + 1}")
+                return nouveau
+            return FabriqueDeTermes.creer_fonc(terme.nom, terme.etiquette, [normaliser(enfant) for enfant in terme.enfants])
+
+        return {self._argument(i): normaliser(enfant) for i, enfant in enumerate(predicat.enfants)}
+
+    @staticmethod
+    def _argument(i: int) -> str:
+        """Variable d'indicateur du i-ème argument (à partir de 0)."""
+        return f"{PREFIXE_INDICATEUR}a{i + 1}"
+
+    # Suppression ----------------------------------------------------
+
+    def supprimer(self, predicat: Litteral, pointeur: Any = None) -> bool:
+        """
+        Retire le prédicat de l'arbre (seulement l'entrée de ce pointeur s'il est donné).
+        La feuille vidée est retirée, et un noeud resté avec un seul enfant est fusionné avec lui.
+
+        Returns:
+            bool    :   True si une entrée a été retirée.
+        """
+        cle = (predicat.symbole, predicat.sign)
+        racine = self.racines.get(cle)
+        if racine is None:
+            return False
+
+        # Recherche en profondeur de la feuille, en gardant le chemin
+        pile: List[Tuple[List[NoeudArbreDeSubstitution], Liaisons]] = [([racine], self._liaisons_insertion(predicat))]
+        while pile:
+            chemin, reste = pile.pop()
+            noeud = chemin[-1]
+            if not reste:
+                for i, p in enumerate(noeud.pointeurs):
+                    if p.predicat == predicat and (pointeur is None or p.pointeur == pointeur):
+                        del noeud.pointeurs[i]
+                        noeud._pointeurs_ids.discard(id(p.pointeur) if not isinstance(p.pointeur, str) else p.pointeur)
+                        self._taille -= 1
+                        if not noeud.pointeurs:
+                            self._retirer_feuille(cle, chemin)
+                        return True
+                continue
+            for enfant in reversed(noeud.enfants):
+                suite = self._descendre(enfant.substitution, reste)
+                if suite is not None:
+                    pile.append((chemin + [enfant], suite))
+        return False
+
+    def _retirer_feuille(self, cle: Tuple[int, bool], chemin: List[NoeudArbreDeSubstitution]) -> None:
+        feuille = chemin.pop()
+        parent = chemin[-1]
+        parent.enfants.remove(feuille)
+        if len(chemin) == 1:
+            if not parent.enfants:
+                del self.racines[cle] # Plus aucun littéral pour ce prédicat et ce signe
+            return
+        if len(parent.enfants) == 1:
+            # Le noeud n'a plus de raison d'être : fusion avec son unique enfant
+            enfant = parent.enfants[0]
+            sigma = enfant.substitution
+            fusion = {x: _appliquer(sigma, t) for x, t in parent.substitution.items()}
+            introduites = set().union(*(t.variables for t in parent.substitution.values()))
+            fusion.update((x, t) for x, t in sigma.items() if x not in introduites)
+            parent.substitution = fusion
+            parent.enfants = enfant.enfants
+            parent.pointeurs = enfant.pointeurs
+            parent._pointeurs_ids = enfant._pointeurs_ids
+
+    # Recherche ----------------------------------------------------
+
+    def rechercher(self, predicat: Litteral) -> List[ResultatRecherche]:
+        """
+        Recherche les prédicats (de signe opposé) unifiables avec le prédicat donné.
+
+        Args:
+            predicat    (Litteral)  :   Le prédicat que l'on souhaite unifier à notre arbre.
+        Returns:
+            List[ResultatRecherche] :   Liste des résultats (comprenant donc pointeur et substitution)
+        """
+        return list(self.rechercher_iter(predicat))
+
+    def rechercher_une(self, predicat: Litteral) -> Optional[ResultatRecherche]:
+        """Premier prédicat unifiable trouvé, None si aucun (cf. rechercher_iter)."""
+        return next(self.rechercher_iter(predicat, 1), None)
+
+    def rechercher_instances(self, predicat: Litteral) -> List[ResultatRecherche]:
+        """Prédicats de même signe instances du prédicat donné (substitution : sur les variables de la requête)."""
+        return list(self.rechercher_iter(predicat, nature=INSTANCES))
+
+    def rechercher_generalisations(self, predicat: Litteral) -> List[ResultatRecherche]:
+        """Prédicats de même signe dont le prédicat donné est une instance (substitution : sur leurs variables)."""
+        return list(self.rechercher_iter(predicat, nature=GENERALISATIONS))
+
+    def rechercher_iter(self, predicat: Litteral, limite: Optional[int] = None, nature: str = UNIFIABLES) -> Iterator[ResultatRecherche]:
+        """
+        Résultats produits au fur et à mesure : l'arbre n'est parcouru que jusqu'au dernier résultat demandé.
+
+        Args:
+            predicat    (Litteral)      :   La requête.
+            limite      (Optional[int]) :   Nombre maximal de résultats (tous si None).
+            nature      (str)           :   UNIFIABLES, INSTANCES ou GENERALISATIONS.
+        Yields:
+            ResultatRecherche           :   Résultats (comprenant donc pointeur et substitution), dans l'ordre de l'arbre
+        """
+        if limite is not None and limite <= 0:
+            return
+        signe = not predicat.sign if nature == UNIFIABLES else predicat.sign
+        racine = self.racines.get((predicat.symbole, signe))
+        if racine is None:
+            return
+
+        trouves = 0
+        for pointeurs in self._feuilles_candidates(racine, predicat, nature):
+            for pointeur in pointeurs:
+                substitution = self._verifier(predicat, pointeur.predicat, nature)
+                if substitution is not None:
+                    yield ResultatRecherche(substitution=substitution, pointeurs=[pointeur.pointeur])
+                    trouves += 1
+                    if limite is not None and trouves >= limite:
+                        return
+
+    # Filtrage ----------------------------------------------------
+
+    def _feuilles_candidates(self, racine: NoeudArbreDeSubstitution, predicat: Litteral, nature: str) -> Iterator[List[PointeurFeuille]]:
+        """
+        Parcours en profondeur (avec une pile) des noeuds dont la substitution est compatible avec la requête.
+        Chaque variable d'indicateur est associée au sous-terme de la requête qu'elle doit recouvrir
+        (None : sous une variable de la requête, tout convient).
+        """
+        compatible = self._compatible
+        environnement = {self._argument(i): enfant for i, enfant in enumerate(predicat.enfants)}
+        pile = [(racine, environnement)]
+        while pile:
+            noeud, environnement = pile.pop()
+            if not noeud.enfants:
+                if noeud.pointeurs:
+                    yield noeud.pointeurs
+                continue
+            for enfant in reversed(noeud.enfants):
+                sigma = enfant.substitution
+                ajouts: Dict[str, Optional[NoeudTerme]] = {}
+                for x, s in sigma.items():
+                    if not compatible(s, environnement[x], ajouts, nature):
+                        break
+                else:
+                    # Chaque indicateur n'est lié qu'une fois sur un chemin : ceux de sigma ne servent plus
+                    suite = {x: q for x, q in environnement.items() if x not in sigma}
+                    suite.update(ajouts)
+                    pile.append((enfant, suite))
+
+    @staticmethod
+    def _compatible(motif: NoeudTerme, requete: Optional[NoeudTerme], environnement: Dict[str, Optional[NoeudTerme]], nature: str) -> bool:
+        """
+        Filtre grossier d'un terme de l'arbre (motif) contre le sous-terme de la requête qu'il recouvre.
+        Les variables d'indicateur du motif reçoivent leur sous-terme de requête dans `environnement`.
+        """
+        if motif.etiquette == ETIQUETTE_VAR:
+            if motif.nom[0] == PREFIXE_INDICATEUR:
+                environnement[motif.nom] = requete
+                return True
+            # Variable d'un littéral stocké : elle ne peut pas être instanciée pour une recherche d'instances
+            return nature != INSTANCES or requete is None or requete.etiquette == ETIQUETTE_VAR
+        if requete is None or requete.etiquette == ETIQUETTE_VAR:
+            if nature == GENERALISATIONS:
+                return False # Symbole de l'arbre face à une variable de la requête
+            for nom in motif.variables:
+                if nom[0] == PREFIXE_INDICATEUR:
+                    environnement[nom] = None
+            return True
+        if motif.symbole != requete.symbole:
+            return False
+        return all(ArbreDeSubstitution._compatible(m, r, environnement, nature) for m, r in zip(motif.enfants, requete.enfants))
+
+    # Vérification ----------------------------------------------------
+
+    def _verifier(self, requete: Litteral, candidat: Litteral, nature: str) -> Optional[Substitution]:
+        """
+        Vérifie exactement un candidat trouvé par le filtrage.
+        Pour l'unification sans unificateur donné, la requête est compilée en filtre (cf. compilateur.py).
+        """
+        if nature == INSTANCES:
+            return filtrerLitteraux(requete, candidat)
+        if nature == GENERALISATIONS:
+            return filtrerLitteraux(candidat, requete)
+        if self.unificateur is not None:
+            return self.unificateur(requete, candidat)
+        if requete is not self._requete_compilee:
+            self._requete_compilee = requete
+            self._filtre = compiler(requete, self.occurs)
+        return self._filtre(candidat)
+
+    # Affichage ----------------------------------------------------
+
+    def affichage_arbre(self) -> None:
+        """Affiche chaque arbre (un par prédicat et signe) : substitution de chaque noeud, littéraux des feuilles."""
+        def afficher(noeud: NoeudArbreDeSubstitution, prefixe: str, est_dernier: bool) -> None:
+            connecteur = "└── " if est_dernier else "├── "
+            liaisons = ", ".join(f"{x} ↦ {t}" for x, t in noeud.substitution.items())
+            feuille = f"  -> {', '.join(str(p.pointeur) for p in noeud.pointeurs)}" if noeud.pointeurs else ""
+            print(f"{prefixe}{connecteur}{{{liaisons}}}{feuille}")
+            extension = "    " if est_dernier else "│   "
+            for i, enfant in enumerate(noeud.enfants):
+                afficher(enfant, prefixe + extension, i == len(noeud.enfants) - 1)
+
+        for (symbole, signe), racine in self.racines.items():
+            print(f"{'' if signe else '¬'}{SIGNATURE.nom(symbole)}/{SIGNATURE.arite(symbole)}")
+            for i, enfant in enumerate(racine.enfants):
+                afficher(enfant, "", i == len(racine.enfants) - 1)
+            if racine.pointeurs:
+                print(f"  -> {', '.join(str(p.pointeur) for p in racine.pointeurs)}")
+
+
+def benchmark_arbre_substitution(litteraux: List[Litteral], query_litteraux: List[Litteral], toutes_unifs: bool=True,
+                                 occurs: str = OCCURS_TOUJOURS) -> Tuple[float, List[Tuple[float, int]]]:
+    """
+    Fonction utilitaire pour bench des algos, même protocole que benchmark_arbre_discrimination.
+    Calcul le temps de pré-traitement (i.e l'ajout des littéraux dans l'arbre) et le temps d'unification.
+
+    Args:
+        litteraux (List[Litteral])      : Les littéraux à ajouter dans l'arbre.
+        query_litteraux (List[Litteral]): Les littéraux que l'on cherche à unifier (query).
+        toutes_unifs (bool, optional)   : Choix de trouver toutes les unifications ou seulement la première. Defaults to True.
+        occurs (str, optional)          : Politique d'occurs check de l'arbre. Defaults to OCCURS_TOUJOURS.
+
+    Returns:
+        Tuple[float, List[Tuple[float, int]]]  : Le temps de pré-traitement + un couple du temps d'unification et le nombre d'unifications trouvées.
+    """
+    pointeurs = [str(litteral) for litteral in litteraux] # On convertit les pointeurs avant car pas important pour bench
+    gc.disable()
+
+    # Mesure du temps de pré-traitement (ici insertion dans arbre) :
+    debut_pre_traitement = time.perf_counter()
+    arbre = ArbreDeSubstitution(occurs=occurs)
+    for litteral, pointeur in zip(litteraux, pointeurs):
+        arbre.inserer(litteral, pointeur)
+    temps_pre_traitement = time.perf_counter() - debut_pre_traitement
+
+    resultats = []
+    for query_litteral in query_litteraux:
+        debut_unif = time.perf_counter()
+        if toutes_unifs:
+            nb_unifs = len(arbre.rechercher(query_litteral))
+        else:
+            nb_unifs = 0 if arbre.rechercher_une(query_litteral) is None else 1
+        resultats.append((time.perf_counter() - debut_unif, nb_unifs))
+
+    gc.enable()
+
+    return (temps_pre_traitement, resultats)
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    arbre = ArbreDeSubstitution()
+    for chaine in ["P(X, X)", "P(X, Y)", "P(g(a, X), Y)", "P(g(X, b), X)", "P(f(a), Z)", "P(a, b)", "P(b, b)", "P(X, f(b))"]:
+        arbre.inserer(Litteral.from_string(chaine), chaine)
+    arbre.affichage_arbre()
+
+    requete = Litteral.from_string("¬P(g(a, b), Y)")
+    print(f"\nUnifiables avec {requete} :")
+    for resultat in arbre.rechercher(requete):
+        print(f"  {resultat.pointeurs[0]} : {resultat.substitution}")
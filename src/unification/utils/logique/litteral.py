@@ -1,7 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Iterable, Iterator, Tuple
 import random
 
-from .terme import NoeudTerme, GenerateurDeTermesAleatoires, FabriqueDeTermes
+from .terme import NoeudTerme, GenerateurDeTermesAleatoires, FabriqueDeTermes, ETIQUETTE_VAR
+from .signature import SIGNATURE, GENRE_PREDICAT
 
 
 """
@@ -32,6 +33,30 @@ class Litteral:
         self.enfants = enfants  # les termes sont les enfants du nœud
         self.sign = sign
         self.arity = len(enfants)
+        self.symbole = SIGNATURE.identifiant(predicat, GENRE_PREDICAT, self.arity) # Identifiant de (prédicat, arité)
+        self.est_clos = all(enfant.est_clos for enfant in enfants) # True si aucun argument ne contient de variable
+        self._plat = None # Encodage préfixe, calculé à la demande (cf. propriété plat)
+        self._racines = None # Symboles de tête des arguments, calculés à la demande (cf. propriété racines)
+
+    @property
+    def plat(self):
+        """
+        Encodage préfixe du littéral (LitteralPlat), calculé une seule fois puis gardé en cache.
+        """
+        if self._plat is None:
+            from .terme_plat import aplatir_litteral
+            self._plat = aplatir_litteral(self)
+        return self._plat
+
+    @property
+    def racines(self) -> Tuple[Optional[int], ...]:
+        """
+        Symbole de tête de chaque argument (None pour une variable), calculé une seule fois.
+        Deux arguments dont les symboles de tête sont différents (et non None) ne peuvent pas s'unifier.
+        """
+        if self._racines is None:
+            self._racines = tuple(None if enfant.etiquette == ETIQUETTE_VAR else enfant.symbole for enfant in self.enfants)
+        return self._racines
 
     @staticmethod
     def _split_args(args_str: str) -> List[str]:
@@ -206,7 +231,29 @@ class Litteral:
                 sous_indent = "    " if est_dernier else "│   "
                 lines.append(self._afficher_terme(enfant, indent + branche, indent + sous_indent))
             return "\n".join(lines)
-        
+
+
+def candidats_compatibles(requete: Litteral, candidats: Iterable[Litteral]) -> Iterator[Litteral]:
+    """
+    Filtre (sans rien allouer par candidat) les littéraux qui peuvent s'unifier avec `requete` pour la résolution :
+    signe opposé, même prédicat et même arité, et aucun argument dont le symbole de tête diffère de celui de la requête.
+    La requête n'est préparée qu'une fois pour tous les candidats.
+    """
+    sign, symbole = requete.sign, requete.symbole
+    # Seuls les arguments non variables de la requête peuvent provoquer un clash en tête
+    positions = [(i, racine) for i, racine in enumerate(requete.racines) if racine is not None]
+    for candidat in candidats:
+        if candidat.sign == sign or candidat.symbole != symbole:
+            continue
+        racines = candidat.racines
+        for i, racine in positions:
+            autre = racines[i]
+            if autre is not None and autre != racine:
+                break
+        else:
+            yield candidat
+
+
 class GenerateurLitteralAleatoire:
     """
     Génère des littéraux aléatoires avec des arités cohérentes.
@@ -222,9 +269,10 @@ class GenerateurLitteralAleatoire:
         profondeurMax (int): Profondeur maximale des termes générés.
         dict_arites (dict[str, int]): Dictionnaire associant chaque prédicat à son arité fixe.
         generateur_termes (GenerateurDeTermesAleatoires): Générateur de termes aléatoires avec profondeur fixe.
+        alea (random.Random): Générateur aléatoire utilisé (le module random par défaut).
     """
     
-    def __init__(self, nom_predicats: list[str], ariteMax: int, profondeurMax: int):
+    def __init__(self, nom_predicats: list[str], ariteMax: int, profondeurMax: int, alea: Optional[random.Random] = None):
         """
         Initialise le générateur de littéraux avec des arités fixes pour chaque prédicat.
         
@@ -232,6 +280,8 @@ class GenerateurLitteralAleatoire:
             nom_predicats (list[str]): Liste des noms de prédicats (ex: ['P', 'Q', 'R']).
             ariteMax (int): Arité maximale pour les prédicats (arité choisie entre 1 et ariteMax).
             profondeurMax (int): Profondeur maximale des termes dans les littéraux.
+            alea (random.Random, optional): Générateur aléatoire local, pour rejouer les mêmes littéraux
+                sans toucher à l'état du module random.
         
         Example:
             >>> gen = GenerateurLitteral(['P', 'Q', 'R'], ariteMax=3, profondeurMax=2)
@@ -240,8 +290,9 @@ class GenerateurLitteralAleatoire:
         self.nom_predicats = nom_predicats
         self.ariteMax = ariteMax
         self.profondeurMax = profondeurMax
+        self.alea = alea if alea is not None else random
         self.dict_arites = self._creer_dict_arites()
-        self.generateur_termes = GenerateurDeTermesAleatoires(profondeur_max=self.profondeurMax)
+        self.generateur_termes = GenerateurDeTermesAleatoires(profondeur_max=self.profondeurMax, alea=alea)
         
     def _creer_dict_arites(self) -> dict[str, int]:
         """
@@ -252,7 +303,7 @@ class GenerateurLitteralAleatoire:
         Returns:
             dict[str, int]: Dictionnaire {nom_predicat: arite}
         """
-        return {predicat: random.randint(1, self.ariteMax) for predicat in self.nom_predicats}
+        return {predicat: self.alea.randint(1, self.ariteMax) for predicat in self.nom_predicats}
 
     def _generer_litteral_aleatoire(self, predicat: str) -> Litteral:
         """
@@ -272,7 +323,7 @@ class GenerateurLitteralAleatoire:
         arite = self.dict_arites[predicat]
         for i in range(arite):
             termes.append(self.generateur_termes.generer_terme_aleatoire())
-        sign = random.choice([True, False])
+        sign = self.alea.choice([True, False])
         return Litteral(predicat, termes, sign)
     
     def generer_litteraux(self, n: int) -> List[Litteral]:
@@ -298,7 +349,7 @@ class GenerateurLitteralAleatoire:
         """
         litteraux = []
         for i in range(n):
-            predicat = random.choice(self.nom_predicats)
+            predicat = self.alea.choice(self.nom_predicats)
             litteral = self._generer_litteral_aleatoire(predicat)
             litteraux.append(litteral)
         return litteraux
@@ -0,0 +1,73 @@
+from array import array
+from typing import Dict, List, Tuple
+
+
+"""
+Table globale des symboles (signature).
+
+Chaque symbole (prédicat, fonction, constante, variable) reçoit un petit entier, une fois pour toutes.
+La clé est (genre, nom, arité) : un même nom utilisé avec deux arités différentes donne deux symboles
+différents. Comparer deux symboles revient donc à comparer deux entiers, et l'arité d'un symbole
+se lit directement dans un array.
+
+Exemple :
+    >>> f = SIGNATURE.identifiant("f", GENRE_FONCTION, 2)
+    >>> SIGNATURE.arite(f), SIGNATURE.nom(f)
+    (2, 'f')
+"""
+
+GENRE_PREDICAT = "predicat"
+GENRE_FONCTION = "fonction"
+GENRE_CONSTANTE = "constante"
+GENRE_VARIABLE = "variable"
+GENRE_SIGNE = "signe"   # Symboles réservés (signe d'un littéral dans l'arbre de discrimination)
+
+
+class TableDesSymboles:
+    """
+    Associe chaque symbole (genre, nom, arité) à un identifiant entier >= 0.
+
+    Attributes:
+        noms    (List[str]) : noms[i] est le nom du symbole i.
+        genres  (List[str]) : genres[i] est le genre du symbole i (GENRE_*).
+        arites  (array)     : arites[i] est l'arité du symbole i.
+    """
+    def __init__(self):
+        self._identifiants: Dict[Tuple[str, str, int], int] = {}
+        self.noms: List[str] = []
+        self.genres: List[str] = []
+        self.arites = array('i')
+
+    def identifiant(self, nom: str, genre: str, arite: int = 0) -> int:
+        """Retourne l'identifiant du symbole, en l'enregistrant s'il est nouveau."""
+        cle = (genre, nom, arite)
+        identifiant = self._identifiants.get(cle)
+        if identifiant is None:
+            identifiant = len(self.noms)
+            self._identifiants[cle] = identifiant
+            self.noms.append(nom)
+            self.genres.append(genre)
+            self.arites.append(arite)
+        return identifiant
+
+    def nom(self, identifiant: int) -> str:
+        return self.noms[identifiant]
+
+    def genre(self, identifiant: int) -> str:
+        return self.genres[identifiant]
+
+    def arite(self, identifiant: int) -> int:
+        return self.arites[identifiant]
+
+    def est_variable(self, identifiant: int) -> bool:
+        return self.genres[identifiant] == GENRE_VARIABLE
+
+    def __len__(self) -> int:
+        return len(self.noms)
+
+    def __repr__(self) -> str:
+        return f"TableDesSymboles(symboles={len(self)})"
+
+
+# Table partagée par tous les termes et littéraux
+SIGNATURE = TableDesSymboles()
@@ -0,0 +1,213 @@
+from typing import Dict, Mapping, Optional
+
+from .terme import NoeudTerme, FabriqueDeTermes, ETIQUETTE_VAR
+
+
+"""
+Substitution triangulaire : nom de variable -> terme.
+
+Les termes liés ne sont jamais réécrits : une variable peut être liée à un terme qui contient
+d'autres variables liées (ex : {X -> f(Y), Y -> g(Z, Z)}). Les liaisons restent donc partagées
+(DAG) et de taille linéaire, même quand le terme développé est exponentiel, comme pour
+f(X1, ..., Xn) = f(g(X0, X0), ..., g(Xn-1, Xn-1)).
+
+Le terme développé d'une variable n'est calculé qu'à la demande (resolve), et `normaliser`
+donne la substitution idempotente équivalente.
+
+Le filtrage (cf. robinson.filtrer) donne au contraire une substitution simultanée
+(SubstitutionSimultanee) : les variables du motif et celles de l'instance peuvent avoir les mêmes
+noms, et les termes liés s'appliquent en une fois, sans suivre de chaîne de liaisons.
+
+Politiques d'occurs check des algorithmes d'unification (paramètre `occurs`) :
+    - OCCURS_TOUJOURS : vérifié à chaque liaison (comportement par défaut) ;
+    - OCCURS_DIFFERE  : aucune vérification pendant la résolution, une seule recherche de cycle
+                        sur les liaisons finales (contient_cycle) ;
+    - OCCURS_JAMAIS   : aucune vérification, comme Prolog (non correct : X = f(X) réussit),
+                        réservé aux entrées dont on sait qu'elles ne créent pas de cycle.
+"""
+
+
+OCCURS_TOUJOURS = "toujours"
+OCCURS_DIFFERE = "differe"
+OCCURS_JAMAIS = "jamais"
+POLITIQUES_OCCURS = (OCCURS_TOUJOURS, OCCURS_DIFFERE, OCCURS_JAMAIS)
+
+
+def verifier_politique(occurs: str) -> str:
+    """Retourne `occurs` si c'est une politique d'occurs check connue, lève ValueError sinon."""
+    if occurs not in POLITIQUES_OCCURS:
+        raise ValueError(f"Politique d'occurs check inconnue : {occurs!r} (attendu : {', '.join(POLITIQUES_OCCURS)})")
+    return occurs
+
+
+def appliquer(terme: NoeudTerme, subst: Mapping[str, NoeudTerme], memo: Optional[Dict[NoeudTerme, NoeudTerme]] = None) -> NoeudTerme:
+    """
+    Applique (en suivant les chaînes de liaisons, sauf pour une SubstitutionSimultanee) une substitution à un terme.
+    Les sous-termes non touchés sont retournés tels quels, et les sous-termes répétés ne sont
+    calculés qu'une fois par appel (memo) : le coût est linéaire en la taille du DAG, pas du terme développé.
+    """
+    # (dict_keys.isdisjoint parcourt le plus petit des deux ensembles)
+    if terme.est_clos or subst.keys().isdisjoint(terme.variables):
+        return terme
+    if terme.etiquette == ETIQUETTE_VAR:
+        lie = subst[terme.nom]
+        if lie is terme or isinstance(subst, SubstitutionSimultanee):
+            return lie # Liaison triviale X -> X, ou terme lié à ne pas réécrire
+        return appliquer(lie, subst, memo)
+
+    if memo is None:
+        memo = {}
+    resultat = memo.get(terme)
+    if resultat is None:
+        enfants = [appliquer(enfant, subst, memo) for enfant in terme.enfants]
+        if all(nouveau is ancien for nouveau, ancien in zip(enfants, terme.enfants)):
+            resultat = terme
+        else:
+            resultat = FabriqueDeTermes.creer_fonc(terme.nom, terme.etiquette, enfants)
+        memo[terme] = resultat
+    return resultat
+
+
+def contient_cycle(subst: Mapping[str, NoeudTerme]) -> bool:
+    """
+    Occurs check global d'une substitution triangulaire : cherche un cycle dans le graphe
+    « variable liée -> variables liées du terme auquel elle est liée » (parcours en profondeur itératif).
+    Une liaison triviale X -> X n'est pas un cycle, X -> f(X) en est un.
+    """
+    def successeurs(nom: str):
+        lie = subst[nom]
+        if lie.etiquette == ETIQUETTE_VAR and lie.nom == nom:
+            return iter(())
+        return (autre for autre in lie.variables if autre in subst)
+
+    cles = subst.keys()
+    for terme in subst.values():
+        if not terme.est_clos and not cles.isdisjoint(terme.variables):
+            break
+    else:
+        return False # Cas le plus fréquent : aucune liaison ne mène à une autre
+    etat: Dict[str, bool] = {} # False : en cours de visite, True : terminé
+    for depart in subst:
+        if depart in etat:
+            continue
+        etat[depart] = False
+        pile = [(depart, successeurs(depart))]
+        while pile:
+            noeud, suivants = pile[-1]
+            for successeur in suivants:
+                vu = etat.get(successeur)
+                if vu is False:
+                    return True
+                if vu is None:
+                    etat[successeur] = False
+                    pile.append((successeur, successeurs(successeur)))
+                    break
+            else:
+                etat[noeud] = True
+                pile.pop()
+    return False
+
+
+class Substitution(dict):
+    """
+    Substitution triangulaire (dictionnaire nom de variable -> terme lié).
+
+    Example:
+        >>> s = Substitution({"X": f(Y), "Y": a})
+        >>> s["X"]
+        f(Y)
+        >>> s.resolve("X")
+        f(a)
+        >>> s.normaliser()
+        {'X': f(a), 'Y': a}
+    """
+
+    def resolve(self, nom: str) -> NoeudTerme:
+        """Terme développé auquel est liée la variable `nom` (la variable elle-même si elle est libre)."""
+        terme = self.get(nom)
+        if terme is None:
+            return FabriqueDeTermes.creer_var(nom)
+        return appliquer(terme, self)
+
+    def appliquer(self, terme: NoeudTerme) -> NoeudTerme:
+        """Applique la substitution à un terme."""
+        return appliquer(terme, self)
+
+    def est_idempotente(self) -> bool:
+        """True si aucun terme lié ne contient de variable liée."""
+        return all(self.keys().isdisjoint(terme.variables) for terme in self.values())
+
+    def contient_cycle(self) -> bool:
+        """True si une variable liée apparaît dans son propre terme développé (cf. contient_cycle)."""
+        return contient_cycle(self)
+
+    def normaliser(self) -> "Substitution":
+        """
+        Substitution idempotente équivalente : chaque variable est liée à son terme développé
+        (les liaisons triviales X -> X sont retirées).
+        """
+        memo: Dict[NoeudTerme, NoeudTerme] = {}
+        normalisee = Substitution()
+        for nom, terme in self.items():
+            resolu = appliquer(terme, self, memo)
+            if resolu.etiquette != ETIQUETTE_VAR or resolu.nom != nom:
+                normalisee[nom] = resolu
+        return normalisee
+
+    def copy(self) -> "Substitution":
+        return Substitution(self)
+
+
+class SubstitutionSimultanee(Substitution):
+    """
+    Substitution appliquée en une seule fois : les variables des termes liés ne sont pas substituées
+    (pas de chaîne de liaisons), comme pour le résultat d'un filtrage où motif et instance partagent des variables.
+
+    Example:
+        >>> s = SubstitutionSimultanee({"X": Y, "Y": a})
+        >>> s.appliquer(p(X, Y))
+        p(Y, a)
+    """
+
+    def resolve(self, nom: str) -> NoeudTerme:
+        terme = self.get(nom)
+        if terme is None:
+            return FabriqueDeTermes.creer_var(nom)
+        return terme
+
+    def est_idempotente(self) -> bool:
+        return True
+
+    def contient_cycle(self) -> bool:
+        return False
+
+    def normaliser(self) -> "SubstitutionSimultanee":
+        """Même substitution, sans les liaisons triviales X -> X."""
+        return SubstitutionSimultanee((nom, terme) for nom, terme in self.items()
+                                      if terme.etiquette != ETIQUETTE_VAR or terme.nom != nom)
+
+    def copy(self) -> "SubstitutionSimultanee":
+        return SubstitutionSimultanee(self)
+
+
+class Trace(list):
+    """
+    Trace des liaisons (noms des variables liées, dans l'ordre), pour revenir en arrière sans copier
+    la substitution : annuler un essai coûte le nombre de liaisons qu'il a faites.
+
+    Example:
+        >>> trace = Trace()
+        >>> marque = trace.marquer()
+        >>> unify(t1, t2, store, subst, trace)   # échec, avec des liaisons partielles
+        >>> trace.annuler(subst, marque)         # subst revient à son état au moment de la marque
+    """
+
+    def marquer(self) -> int:
+        """Point de retour : la longueur actuelle de la trace."""
+        return len(self)
+
+    def annuler(self, subst: Dict[str, NoeudTerme], marque: int) -> None:
+        """Retire de `subst` les liaisons faites depuis `marque`."""
+        for nom in self[marque:]:
+            del subst[nom]
+        del self[marque:]
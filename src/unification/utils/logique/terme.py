@@ -1,5 +1,8 @@
 import random
-from typing import Union, List, Optional
+import weakref
+from typing import Union, List, Optional, Sequence, Tuple, FrozenSet
+
+from .signature import SIGNATURE, GENRE_VARIABLE, GENRE_CONSTANTE, GENRE_FONCTION
 
 PROFONDEUR_MAX_PAR_DEFAUT = 3
 ARITE_MAX_PAR_DEFAUT = 3
@@ -18,20 +21,74 @@ ARITES = {
     'l': random.randint(1, ARITE_MAX_PAR_DEFAUT),
 }
 
+_AUCUNE_VARIABLE: FrozenSet[str] = frozenset()
+
+
+def _union_variables(enfants: Tuple['NoeudTerme', ...]) -> FrozenSet[str]:
+    """
+    Union des ensembles de variables des enfants.
+    On réutilise l'ensemble d'un enfant quand il contient déjà tous les autres (cas le plus
+    fréquent : un seul enfant non clos), pour ne pas dupliquer les frozenset.
+    """
+    plus_grand = max((enfant.variables for enfant in enfants), key=len)
+    for enfant in enfants:
+        if not enfant.variables <= plus_grand:
+            return frozenset().union(*(enfant.variables for enfant in enfants))
+    return plus_grand
+
+
 class NoeudTerme:
     """
     Classe représentant un noeud de terme.
     Peut représenter une constante, une variable ou une fonction.
 
+    Les noeuds ne sont jamais modifiés après construction : les métadonnées (hash, taille,
+    profondeur, variables) sont donc calculées une seule fois, à partir de celles des enfants.
+
     Attributes:
         nom (str) : Le nom du terme (ex : "a", "X" ou "f").
         etiquette (Union[str, int]) : Etiquette pour identifier le type du terme, ou l'arité dans le cas d'une fonction ("cons", "var", ou 3 pour une fonction à 3 arguments).
-        enfants (Optional[List['NoeudTerme']]) : Liste des NoeudTerme enfants pour les fonctions.
+        enfants (Tuple['NoeudTerme', ...]) : Tuple des NoeudTerme enfants pour les fonctions.
+        symbole (int) : Identifiant du symbole dans la table globale (cf. signature.py). Deux noeuds ont
+                        le même symbole ssi ils ont même nom, même genre et même arité.
+        est_interne (bool) : True si le noeud (et tous ses sous-termes) vient de la table d'internement
+                             de FabriqueDeTermes. Deux noeuds internés sont égaux ssi ils sont le même objet.
+        taille (int) : Nombre de noeuds du terme.
+        profondeur (int) : Profondeur du terme (1 pour une constante ou une variable).
+        est_clos (bool) : True si le terme ne contient aucune variable.
+        variables (FrozenSet[str]) : Noms des variables apparaissant dans le terme.
     """
-    def __init__(self, nom: str, etiquette: Union[str, int], enfants: Optional[List['NoeudTerme']] = None):
+    __slots__ = ("nom", "etiquette", "enfants", "symbole", "est_interne", "_hash", "taille", "profondeur", "est_clos", "variables", "__weakref__")
+
+    def __init__(self, nom: str, etiquette: Union[str, int], enfants: Optional[Sequence['NoeudTerme']] = None):
         self.nom = nom # Nom du terme (du symbole)
         self.etiquette = etiquette # Etiquette du noeud ('cons', 'var' ou arité pour fonction)
-        self.enfants = enfants if enfants is not None else [] # Enfants du noeud (vide pour constantes et variables)
+        self.enfants = tuple(enfants) if enfants else () # Enfants du noeud (vide pour constantes et variables)
+        self.est_interne = False # Positionné par FabriqueDeTermes
+        # Hash calculé une seule fois, les hash des enfants sont déjà en cache
+        self._hash = hash((nom, etiquette, self.enfants))
+
+        if etiquette == ETIQUETTE_VAR:
+            self.symbole = SIGNATURE.identifiant(nom, GENRE_VARIABLE)
+            self.taille = 1
+            self.profondeur = 1
+            self.variables = frozenset((nom,))
+        elif etiquette == ETIQUETTE_CONS:
+            self.symbole = SIGNATURE.identifiant(nom, GENRE_CONSTANTE)
+            self.taille = 1
+            self.profondeur = 1
+            self.variables = _AUCUNE_VARIABLE
+        elif not self.enfants:
+            self.symbole = SIGNATURE.identifiant(nom, GENRE_FONCTION, int(etiquette))
+            self.taille = 1
+            self.profondeur = 1
+            self.variables = _AUCUNE_VARIABLE
+        else:
+            self.symbole = SIGNATURE.identifiant(nom, GENRE_FONCTION, int(etiquette))
+            self.taille = 1 + sum(enfant.taille for enfant in self.enfants)
+            self.profondeur = 1 + max(enfant.profondeur for enfant in self.enfants)
+            self.variables = _union_variables(self.enfants)
+        self.est_clos = not self.variables
 
     def __repr__(self) -> str:
         if self.etiquette in [ETIQUETTE_CONS, ETIQUETTE_VAR]:
@@ -44,8 +101,13 @@ class NoeudTerme:
             return f"{self.nom}({representation_enfants})"
 
     def __eq__(self, obj: object) -> bool:
+        if self is obj:
+            return True
         if not isinstance(obj, NoeudTerme):
             return False
+        if self.est_interne and obj.est_interne:
+            # Deux termes internés structurellement égaux sont forcément le même objet
+            return False
         return (
             self.nom == obj.nom
             and self.etiquette == obj.etiquette
@@ -53,24 +115,68 @@ class NoeudTerme:
         )
 
     def __hash__(self) -> int:
-        return hash((self.nom, self.etiquette, tuple(self.enfants)))
+        return self._hash
+
+    def __reduce__(self):
+        # pickle et copy reconstruisent le noeud (symbole et hash recalculés) : un noeud interné repasse
+        # par la fabrique, pour que sa copie soit le noeud de la table et non un second objet marqué interné
+        if self.est_interne:
+            return FabriqueDeTermes._interner, (self.nom, self.etiquette, list(self.enfants))
+        return NoeudTerme, (self.nom, self.etiquette, self.enfants)
         
         
 class FabriqueDeTermes:
     """
     Classe utilitaire pour créer des termes.
+
+    Les termes sont internés (hash-consing) : deux termes structurellement égaux créés
+    par la fabrique sont le même objet. La table est à valeurs faibles, un terme en sort
+    dès qu'il n'est plus référencé ailleurs.
+
+    Attributes:
+        internement (bool) : Active l'internement (True par défaut). Mettre à False pour
+                             retrouver un nouvel objet à chaque appel (comparaisons de benchmark).
     """
+    internement = True
+    _table: "weakref.WeakValueDictionary[tuple, NoeudTerme]" = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def _interner(nom: str, etiquette: Union[str, int], enfants: Optional[list] = None) -> NoeudTerme:
+        """
+        Retourne le noeud partagé (nom, etiquette, enfants), en le créant si besoin.
+
+        Les enfants étant eux-mêmes internés, on les identifie par leur id : pas besoin
+        de parcourir les sous-termes pour calculer la clé. Un enfant construit hors de la
+        fabrique donne simplement un noeud non partagé.
+        """
+        if not FabriqueDeTermes.internement:
+            return NoeudTerme(nom=nom, etiquette=etiquette, enfants=enfants)
+
+        enfants = enfants if enfants is not None else ()
+        cle = (nom, etiquette, tuple(id(enfant) for enfant in enfants))
+        noeud = FabriqueDeTermes._table.get(cle)
+        if noeud is None:
+            noeud = NoeudTerme(nom=nom, etiquette=etiquette, enfants=enfants)
+            noeud.est_interne = all(enfant.est_interne for enfant in enfants)
+            FabriqueDeTermes._table[cle] = noeud
+        return noeud
+
+    @staticmethod
+    def taille_table() -> int:
+        """Nombre de termes distincts actuellement internés."""
+        return len(FabriqueDeTermes._table)
+
     @staticmethod
     def creer_cons(nom: str) -> NoeudTerme:
-        return NoeudTerme(nom=nom, etiquette=ETIQUETTE_CONS)
+        return FabriqueDeTermes._interner(nom, ETIQUETTE_CONS)
      
     @staticmethod
     def creer_var(nom: str) -> NoeudTerme:
-        return NoeudTerme(nom=nom, etiquette=ETIQUETTE_VAR)
+        return FabriqueDeTermes._interner(nom, ETIQUETTE_VAR)
     
     @staticmethod
     def creer_fonc(nom: str, arite: int, enfants: list) -> NoeudTerme:
-        return NoeudTerme(nom=nom, etiquette=arite, enfants=enfants)
+        return FabriqueDeTermes._interner(nom, arite, enfants)
     
 class GenerateurDeTermesAleatoires:
     """
@@ -79,13 +185,23 @@ class GenerateurDeTermesAleatoires:
     Attributes:
         profondeur_max (int) : Profondeur maximale du terme généré (par défaut 3).
         arite_max (int) : Arité maximale des fonctions générées (par défaut 3).
+        alea (random.Random) : Générateur aléatoire utilisé (le module random par défaut).
+        arites (dict[str, int]) : Arité de chaque symbole de fonction (ARITES par défaut, tirées de `alea` sinon).
     """
-    def __init__(self, profondeur_max: int = PROFONDEUR_MAX_PAR_DEFAUT, arite_max: int = ARITE_MAX_PAR_DEFAUT):
+    def __init__(self, profondeur_max: int = PROFONDEUR_MAX_PAR_DEFAUT, arite_max: int = ARITE_MAX_PAR_DEFAUT,
+                 alea: Optional[random.Random] = None):
         self.profondeur_max = profondeur_max
         self.arite_max = arite_max
         self.consts = DOMAINE_CONS
         self.vars = DOMAINE_VAR
         self.foncs = DOMAINE_FONC
+        if alea is None:
+            self.alea = random
+            self.arites = ARITES
+        else:
+            # Générateur local (ex : random.Random(graine)) : les arités en sont tirées aussi, pour rejouer le même jeu
+            self.alea = alea
+            self.arites = {nom: alea.randint(1, ARITE_MAX_PAR_DEFAUT) for nom in DOMAINE_FONC}
 
     def generer_terme_aleatoire(self, profondeur_courante: int = 0) -> NoeudTerme:
         """
@@ -99,7 +215,7 @@ class GenerateurDeTermesAleatoires:
         """
         if profondeur_courante >= self.profondeur_max:
             # Si on est à la profondeur max, on ne peut générer qu'une constante ou une variable
-            return random.choice([
+            return self.alea.choice([
                 self._generer_cons(profondeur_courante),
                 self._generer_var(profondeur_courante)
             ])
@@ -111,18 +227,18 @@ class GenerateurDeTermesAleatoires:
                 self._generer_fonc
             ]
             poids = [0.3, 0.3, 0.4] # Poids pour favoriser légérement la génération de fonction   
-            generateur_choisi = random.choices(choices, weights=poids)[0]
+            generateur_choisi = self.alea.choices(choices, weights=poids)[0]
             return generateur_choisi(profondeur_courante)
         
     def _generer_cons(self, _:int) -> NoeudTerme:
-        return FabriqueDeTermes.creer_cons(random.choice(self.consts))
+        return FabriqueDeTermes.creer_cons(self.alea.choice(self.consts))
 
     def _generer_var(self, _:int) -> NoeudTerme:
-        return FabriqueDeTermes.creer_var(random.choice(self.vars))
+        return FabriqueDeTermes.creer_var(self.alea.choice(self.vars))
 
     def _generer_fonc(self, profondeur_courante: int) -> NoeudTerme:
-        nom = random.choice(self.foncs)
-        arite = ARITES.get(nom)
+        nom = self.alea.choice(self.foncs)
+        arite = self.arites.get(nom)
         if arite is None:
             arite = 1
         enfants = [self.generer_terme_aleatoire(profondeur_courante + 1) for _ in range(arite)]
@@ -0,0 +1,151 @@
+from array import array
+from typing import Dict, List, Tuple
+
+from .terme import NoeudTerme, FabriqueDeTermes, ETIQUETTE_VAR
+from .signature import SIGNATURE, GENRE_CONSTANTE
+
+
+"""
+Représentation "plate" des termes (flatterm).
+
+Un terme est encodé en ordre préfixe dans un array('i') :
+    - un symbole de fonction ou de constante est encodé par son identifiant dans la table
+      globale des symboles (cf. signature.py), donc >= 0,
+    - une variable est encodée par -(k + 1), où k est l'indice de la variable dans l'ordre
+      de première apparition (la variable k a pour nom `variables[k]`).
+
+Un second array('i') "fins" donne, pour chaque position i, l'indice qui suit le sous-terme
+commençant en i. On saute donc un sous-terme en O(1), et les enfants d'un noeud en i
+se trouvent en i + 1, fins[i + 1], fins[fins[i + 1]], ...
+
+Exemple : f(X, g(a, X)) -> symboles = [f, -1, g, a, -1]
+                           fins     = [5,  2, 5, 4,  5]
+                           variables = ("X",)
+
+Un littéral est encodé comme un terme dont la racine est le prédicat (Litteral.symbole).
+"""
+
+class TermePlat:
+    """
+    Terme encodé en ordre préfixe.
+
+    Attributes:
+        symboles    (array)             : Symboles en ordre préfixe (identifiant, ou -(k + 1) pour la variable k).
+        fins        (array)             : fins[i] est l'indice qui suit le sous-terme commençant en i.
+        variables   (Tuple[str, ...])   : Noms des variables, dans l'ordre de première apparition.
+    """
+    __slots__ = ("symboles", "fins", "variables")
+
+    def __init__(self, symboles: array, fins: array, variables: Tuple[str, ...]):
+        self.symboles = symboles
+        self.fins = fins
+        self.variables = variables
+
+    def __len__(self) -> int:
+        return len(self.symboles)
+
+    def enfants(self, i: int) -> List[int]:
+        """Positions des enfants du sous-terme commençant en i."""
+        positions = []
+        j = i + 1
+        fin = self.fins[i]
+        while j < fin:
+            positions.append(j)
+            j = self.fins[j]
+        return positions
+
+    def vers_terme(self, i: int = 0) -> NoeudTerme:
+        """Reconstruit (via la fabrique, donc internés) le NoeudTerme commençant à la position i."""
+        code = self.symboles[i]
+        if code < 0:
+            return FabriqueDeTermes.creer_var(self.variables[-code - 1])
+        nom = SIGNATURE.noms[code]
+        if SIGNATURE.genres[code] == GENRE_CONSTANTE:
+            return FabriqueDeTermes.creer_cons(nom)
+        return FabriqueDeTermes.creer_fonc(nom, SIGNATURE.arites[code], [self.vers_terme(j) for j in self.enfants(i)])
+
+    def __repr__(self) -> str:
+        return repr(self.vers_terme())
+
+    def __eq__(self, obj: object) -> bool:
+        if not isinstance(obj, TermePlat):
+            return False
+        return self.symboles == obj.symboles and self.variables == obj.variables
+
+    def __hash__(self) -> int:
+        return hash((self.symboles.tobytes(), self.variables))
+
+
+class LitteralPlat(TermePlat):
+    """
+    Littéral encodé en ordre préfixe : la position 0 est le prédicat (identifiant du couple
+    (prédicat, arité) dans la table des symboles), les arguments suivent.
+
+    Attributes:
+        signe (bool) : Signe du littéral.
+    """
+    __slots__ = ("signe",)
+
+    def __init__(self, symboles: array, fins: array, variables: Tuple[str, ...], signe: bool):
+        super().__init__(symboles, fins, variables)
+        self.signe = signe
+
+    def vers_litteral(self):
+        """Reconstruit le Litteral correspondant."""
+        from .litteral import Litteral
+        return Litteral(SIGNATURE.noms[self.symboles[0]], [self.vers_terme(j) for j in self.enfants(0)], self.signe)
+
+    def __repr__(self) -> str:
+        return repr(self.vers_litteral())
+
+    def __eq__(self, obj: object) -> bool:
+        return isinstance(obj, LitteralPlat) and self.signe == obj.signe and super().__eq__(obj)
+
+    def __hash__(self) -> int:
+        return hash((self.signe, super().__hash__()))
+
+
+def _aplatir(racines: List[NoeudTerme], symboles: array, fins: array, index_variables: Dict[str, int]) -> None:
+    """
+    Ajoute les termes `racines` (l'un après l'autre) en ordre préfixe à `symboles` et `fins`.
+    La taille de chaque sous-terme est en cache dans le noeud, la fin se calcule donc directement.
+    """
+    pile = list(reversed(racines))
+    while pile:
+        terme = pile.pop()
+        fins.append(len(symboles) + terme.taille)
+        if terme.etiquette == ETIQUETTE_VAR:
+            k = index_variables.get(terme.nom)
+            if k is None:
+                k = len(index_variables)
+                index_variables[terme.nom] = k
+            symboles.append(-k - 1)
+        else:
+            symboles.append(terme.symbole)
+            pile.extend(reversed(terme.enfants))
+
+
+def aplatir_terme(terme: NoeudTerme) -> TermePlat:
+    """
+    Encode un NoeudTerme en TermePlat.
+
+    Example:
+        >>> t = aplatir_terme(f(X, g(a, X)))
+        >>> list(t.fins)
+        [5, 2, 5, 4, 5]
+    """
+    symboles, fins = array('i'), array('i')
+    index_variables: Dict[str, int] = {}
+    _aplatir([terme], symboles, fins, index_variables)
+    return TermePlat(symboles, fins, tuple(index_variables))
+
+
+def aplatir_litteral(litteral) -> LitteralPlat:
+    """
+    Encode un Litteral en LitteralPlat (prédicat en position 0, puis les arguments).
+    """
+    symboles = array('i', [litteral.symbole])
+    fins = array('i', [1 + sum(terme.taille for terme in litteral.enfants)])
+    index_variables: Dict[str, int] = {}
+    _aplatir(litteral.enfants, symboles, fins, index_variables)
+    return LitteralPlat(symboles, fins, tuple(index_variables), litteral.sign)
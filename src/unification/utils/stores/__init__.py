@@ -2,7 +2,8 @@ from .term_store import TermStore
 from .dict_store import DictStore
 from .list_store import ListStore
 from .set_store import SetStore
+from .path_index_store import PathIndexStore
 from .term_list import TermSystem
 from .term_list import Equation
 
-__all__ = ["TermStore", "DictStore", "ListStore", "SetStore", "TermSystem", "Equation"]
\ No newline at end of file
+__all__ = ["TermStore", "DictStore", "ListStore", "SetStore", "PathIndexStore", "TermSystem", "Equation"]
\ No newline at end of file
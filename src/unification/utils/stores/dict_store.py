@@ -1,38 +1,125 @@
-from typing import TypeVar, Iterator, Dict, Tuple, List
+from typing import TypeVar, Iterator, Iterable, Dict, Tuple, List, Optional
 from .term_store import TermStore
 from ..logique.litteral import Litteral
+from ..logique.signature import SIGNATURE
+
+# Seau des littéraux dont l'argument indexé est une variable (ou qui n'ont pas cet argument)
+SEAU_VARIABLE = None
+
+# Seaux d'un (prédicat, arité, signe) : symbole de tête de l'argument indexé -> littéraux
+Seaux = Dict[Optional[int], List[Litteral]]
+
 
 class DictStore(TermStore[Litteral]):
-    def __init__(self):
-        # Structure : { "Predicat": ( [Littéraux Positifs], [Littéraux Négatifs] ) }
-        self._data: Dict[str, Tuple[List[Litteral], List[Litteral]]] = {}
+    """
+    Index à plusieurs niveaux, comme l'indexation sur le premier argument de Prolog :
+    (prédicat, arité) -> signe -> symbole de tête (fonction ou constante) de l'argument indexé.
+    Les littéraux dont cet argument est une variable sont dans un seau à part (SEAU_VARIABLE),
+    compatible avec toutes les requêtes.
+
+    Chaque insertion est un emplacement [littéral, seau, indice dans le seau, indice dans l'ordre],
+    retrouvé par une table littéral -> emplacements. remove remplace le littéral par une tombe (None)
+    dans son seau et dans l'ordre d'insertion, sans décaler les autres ; les tombes sont retirées
+    en bloc quand elles deviennent plus nombreuses que les littéraux (compactage, O(1) amorti).
+    pop retire le dernier littéral ajouté encore présent.
+
+    Args:
+        argument: Position de l'argument indexé (le premier par défaut).
+    """
+    def __init__(self, argument: int = 0):
+        # Structure : { symbole de (Predicat, arité): ( {tête: [Littéraux Positifs]}, {tête: [Littéraux Négatifs]} ) }
+        # La clé est l'identifiant entier de la table des symboles (cf. signature.py)
+        self.argument = argument
+        self._data: Dict[int, Tuple[Seaux, Seaux]] = {}
+        self._ordre: List[Optional[list]] = [] # Emplacements dans l'ordre d'insertion (None : retiré)
+        self._emplacements: Dict[Litteral, List[list]] = {}
         self._size = 0
+        self._tombes = 0
+        self._compactages = 0 # Pour les vues en cours de parcours (cf. _parcourir)
+
+    def _tete(self, item: Litteral) -> Optional[int]:
+        """Clé du seau de `item` : le symbole de tête de l'argument indexé (SEAU_VARIABLE pour une variable)."""
+        racines = item.racines
+        return racines[self.argument] if self.argument < len(racines) else SEAU_VARIABLE
 
     def push(self, item: Litteral) -> None:
-        # Initialiser le tuple de listes si le prédicat n'existe pas encore
-        if item.predicat not in self._data:
-            self._data[item.predicat] = ([], [])
-        
+        # Initialiser le tuple de seaux si le prédicat n'existe pas encore
+        if item.symbole not in self._data:
+            self._data[item.symbole] = ({}, {})
+
         # item.sign == True (Positif), False (Négatif)
-        if item.sign:
-            self._data[item.predicat][0].append(item)
-        else:
-            self._data[item.predicat][1].append(item)
-            
+        seaux = self._data[item.symbole][0 if item.sign else 1]
+        tete = self._tete(item)
+        seau = seaux.get(tete)
+        if seau is None:
+            seau = seaux[tete] = []
+        emplacement = [item, seau, len(seau), len(self._ordre)]
+        seau.append(item)
+        self._ordre.append(emplacement)
+        self._emplacements.setdefault(item, []).append(emplacement)
+
         self._size += 1
 
     def pop(self) -> Litteral:
         if self.is_empty():
             raise IndexError("pop from empty DictStore")
-        
-        # On cherche le premier élément disponible et on le retire
-        for key, (pos_list, neg_list) in self._data.items():
-            if pos_list:
-                self._size -= 1
-                return pos_list.pop()
-            if neg_list:
-                self._size -= 1
-                return neg_list.pop()
+
+        # Les tombes en fin d'ordre sont dépilées au passage : chacune ne l'est qu'une fois
+        ordre = self._ordre
+        while ordre[-1] is None:
+            ordre.pop()
+            self._tombes -= 1
+        item = ordre[-1][0]
+        self._retirer(self._emplacements[item][-1])
+        return item
+
+    def remove(self, item: Litteral) -> None:
+        """Retire une occurrence de `item` (ValueError s'il n'est pas dans le store)."""
+        emplacements = self._emplacements.get(item)
+        if emplacements is None:
+            raise ValueError(f"{item} n'est pas dans le DictStore")
+        self._retirer(emplacements[-1])
+
+    def _retirer(self, emplacement: list) -> None:
+        """Remplace le littéral de `emplacement` par une tombe, et compacte si besoin."""
+        item, seau, indice, rang = emplacement
+        emplacements = self._emplacements[item]
+        emplacements.remove(emplacement) # Liste des doublons de item : en pratique un seul élement
+        if not emplacements:
+            del self._emplacements[item]
+        seau[indice] = None
+        self._ordre[rang] = None
+        self._size -= 1
+        self._tombes += 1
+        if self._tombes > max(self._size, 32):
+            self._compacter()
+
+    def _compacter(self) -> None:
+        """Reconstruit seaux et ordre d'insertion sans les tombes, et renumérote les emplacements."""
+        ordre = [e for e in self._ordre if e is not None]
+        self._data = {}
+        for rang, emplacement in enumerate(ordre):
+            item = emplacement[0]
+            if item.symbole not in self._data:
+                self._data[item.symbole] = ({}, {})
+            seaux = self._data[item.symbole][0 if item.sign else 1]
+            tete = self._tete(item)
+            seau = seaux.get(tete)
+            if seau is None:
+                seau = seaux[tete] = []
+            emplacement[1:] = (seau, len(seau), rang)
+            seau.append(item)
+        self._ordre = ordre
+        self._tombes = 0
+        self._compactages += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._ordre.clear()
+        self._emplacements.clear()
+        self._size = 0
+        self._tombes = 0
+        self._compactages += 1 # Les vues en cours ne voient plus aucun littéral
 
     def is_empty(self) -> bool:
         return self._size == 0
@@ -42,33 +129,68 @@ class DictStore(TermStore[Litteral]):
 
     def __iter__(self) -> Iterator[Litteral]:
         # Permet à "for p in store:" de fonctionner comme avec SetStore/ListStore
-        for pos_list, neg_list in self._data.values():
-            for item in pos_list:
-                yield item
-            for item in neg_list:
-                yield item
+        # Instantané dans l'ordre d'insertion
+        return iter([e[0] for e in self._ordre if e is not None])
 
     def __str__(self) -> str:
         return str(self._data)
-        
+
     def __repr__(self) -> str:
-        return f"DictStore(size={self._size}, keys={list(self._data.keys())})"
+        cles = [f"{SIGNATURE.nom(symbole)}/{SIGNATURE.arite(symbole)}" for symbole in self._data]
+        return f"DictStore(size={self._size}, argument={self.argument}, keys={cles})"
+
+    def _parcourir(self, seaux: Iterable[List[Optional[Litteral]]]) -> Iterator[Litteral]:
+        """
+        Enchaîne les seaux en sautant les tombes, testées à chaque élément : un remove pendant le parcours
+        pose une tombe qu'il faut sauter. Après un compactage, la vue continue sur les anciens seaux, qui
+        ne reçoivent plus les tombes : les littéraux sont alors vérifiés dans la table des emplacements.
+        """
+        # Liste des seaux figée : un push qui crée un seau ne modifie pas le dict en cours de parcours
+        compactages = self._compactages
+        emplacements = self._emplacements
+        for seau in list(seaux):
+            for item in seau:
+                if item is None:
+                    continue
+                if self._compactages != compactages and item not in emplacements:
+                    continue
+                yield item
 
     # --- METHODE D'OPTIMISATION ---
+    def get_candidats(self, pred: Litteral, sign: bool) -> Iterator[Litteral]:
+        """
+        Retourne en O(1) les littéraux de même prédicat et même arité que pred, et de signe `sign`
+        (tous les seaux). Contrairement à __iter__, c'est une vue : un littéral retiré pendant le parcours
+        n'est plus produit s'il n'a pas encore été atteint, un littéral ajouté peut l'être ou non.
+        """
+        if pred.symbole not in self._data:
+            return iter([]) # Aucun candidat
+
+        # L'arité fait partie de la clé : pas besoin de filtrer
+        seaux = self._data[pred.symbole][0 if sign else 1]
+        return self._parcourir(seaux.values())
+
+    def get_candidats_compatibles(self, pred: Litteral, sign: bool) -> Iterator[Litteral]:
+        """
+        Comme get_candidats, mais si l'argument indexé de pred n'est pas une variable, seuls le seau de
+        même symbole de tête et le seau des variables sont parcourus (les autres ne peuvent pas s'unifier).
+        """
+        if pred.symbole not in self._data:
+            return iter([]) # Aucun candidat
+
+        seaux = self._data[pred.symbole][0 if sign else 1]
+        tete = self._tete(pred)
+        if tete is SEAU_VARIABLE:
+            return self._parcourir(seaux.values())
+        return self._parcourir((seaux.get(tete, ()), seaux.get(SEAU_VARIABLE, ())))
+
     def get_candidats_resolution(self, pred: Litteral) -> Iterator[Litteral]:
         """
         Retourne en O(1) uniquement les littéraux pertinents pour la résolution :
         - Même prédicat
         - Signe opposé
         - Même arité
+        - Argument indexé de même symbole de tête que celui de pred, ou variable
         """
-        if pred.predicat not in self._data:
-            return iter([]) # Aucun candidat
-        
-        pos_list, neg_list = self._data[pred.predicat]
-        
         # Si pred est positif, on veut unifier avec les négatifs (et inversement)
-        candidats = neg_list if pred.sign else pos_list
-        
-        # On retourne un générateur qui filtre aussi sur l'arité
-        return (c for c in candidats if c.arity == pred.arity)
+        return self.get_candidats_compatibles(pred, not pred.sign)
@@ -1,19 +1,76 @@
 from .term_store import TermStore
-from typing import TypeVar, Generic, Iterator
+from typing import TypeVar, Generic, Iterator, Dict, Set, Optional
 
 T = TypeVar('T')
 
 class ListStore(TermStore[T]):
-    """Implémentation avec une liste"""
+    """
+    Implémentation avec une liste (pile : pop retire le dernier élement ajouté).
+
+    remove échange l'élement retiré avec le dernier de la liste, grâce à une table élement -> positions.
+    Cette table n'est construite qu'au premier remove : utilisé comme simple pile (pile d'équations
+    de l'unification), le store ne paie pas sa mise à jour.
+
+    L'itération parcourt directement la liste, sans la copier ; la première modification qui suit un
+    parcours remplace la liste par une copie (copie sur écriture), le parcours gardant l'ancienne.
+    """
     
     def __init__(self):
         self._data: list[T] = []
+        self._positions: Optional[Dict[T, Set[int]]] = None
+        self._partage = False # True si un parcours a pu garder une référence à self._data
+
+    def _detacher(self) -> None:
+        """Copie sur écriture : la liste éventuellement en cours de parcours n'est plus modifiée."""
+        self._data = self._data.copy()
+        self._partage = False
     
     def pop(self) -> T:
-        return self._data.pop()
+        if self._partage:
+            self._detacher()
+        item = self._data.pop()
+        if self._positions is not None:
+            self._oublier(item, len(self._data))
+        return item
     
     def push(self, item: T) -> None:
+        if self._partage:
+            self._detacher()
+        if self._positions is not None:
+            self._positions.setdefault(item, set()).add(len(self._data))
         self._data.append(item)
+
+    def remove(self, item: T) -> None:
+        if self._partage:
+            self._detacher()
+        if self._positions is None:
+            self._positions = {}
+            for i, x in enumerate(self._data):
+                self._positions.setdefault(x, set()).add(i)
+        positions = self._positions.get(item)
+        if not positions:
+            raise ValueError(f"{item} n'est pas dans le ListStore")
+        i = positions.pop()
+        if not positions:
+            del self._positions[item]
+        dernier = self._data.pop()
+        if i < len(self._data):
+            # Le dernier élement prend la place de l'élement retiré
+            self._data[i] = dernier
+            self._oublier(dernier, len(self._data))
+            self._positions.setdefault(dernier, set()).add(i)
+
+    def _oublier(self, item: T, i: int) -> None:
+        """Retire la position i de item dans la table des positions."""
+        positions = self._positions[item]
+        positions.discard(i)
+        if not positions:
+            del self._positions[item]
+    
+    def clear(self) -> None:
+        self._data = [] # Pas de clear en place : la liste peut être en cours de parcours
+        self._positions = None
+        self._partage = False
     
     def is_empty(self) -> bool:
         return len(self._data) == 0
@@ -28,6 +85,8 @@ class ListStore(TermStore[T]):
         return f"ListStore(data={self._data!r}, len={len(self._data)})"
     
     def __iter__(self) -> Iterator[T]:
+        # Instantané sans copie : la liste parcourue ne sera plus modifiée (cf. _detacher)
+        self._partage = True
         return iter(self._data)
     
 # Exemple d'utilisation 
@@ -0,0 +1,242 @@
+from array import array
+from typing import Iterator, Dict, Tuple, List, Optional
+from .term_store import TermStore
+from ..logique.litteral import Litteral
+from ..logique.terme import NoeudTerme, ETIQUETTE_VAR
+from ..logique.signature import SIGNATURE
+
+# Chemin d'un sous-terme : positions des arguments depuis le littéral, ex. (0, 1) pour b dans P(f(a, b))
+Chemin = Tuple[int, ...]
+
+
+def _identifiants(bits: int) -> Iterator[int]:
+    """Positions des bits à 1 de `bits`, dans l'ordre croissant."""
+    chiffres = bin(bits)[:1:-1] # Bit de poids faible en premier
+    i = chiffres.find("1")
+    while i >= 0:
+        yield i
+        i = chiffres.find("1", i + 1)
+
+
+class _Posting:
+    """
+    Ensemble d'identifiants de littéraux, sous forme d'entier (bit i à 1 : littéral i présent).
+    Les identifiants ajoutés sont mis en attente dans un array('I') (trié, les identifiants étant croissants)
+    et versés dans l'entier à la première lecture : un ajout ne recopie pas l'entier.
+    """
+    __slots__ = ("_bits", "_attente")
+
+    def __init__(self):
+        self._bits = 0
+        self._attente = array("I")
+
+    def ajouter(self, identifiant: int) -> None:
+        self._attente.append(identifiant)
+
+    def bits(self) -> int:
+        if self._attente:
+            octets = bytearray((self._attente[-1] >> 3) + 1)
+            for i in self._attente:
+                octets[i >> 3] |= 1 << (i & 7)
+            self._bits |= int.from_bytes(octets, "little")
+            self._attente = array("I")
+        return self._bits
+
+
+class _Partition:
+    """Postings des littéraux d'un même (prédicat, arité) et d'un même signe."""
+    __slots__ = ("tous", "postings")
+
+    def __init__(self):
+        self.tous = _Posting()
+        # (chemin, symbole) -> littéraux ayant ce symbole à ce chemin ; (chemin, None) : une variable à ce chemin
+        self.postings: Dict[Tuple[Chemin, Optional[int]], _Posting] = {}
+
+    def bits(self, chemin: Chemin, symbole: Optional[int]) -> int:
+        posting = self.postings.get((chemin, symbole))
+        return 0 if posting is None else posting.bits()
+
+
+class PathIndexStore(TermStore[Litteral]):
+    """
+    Indexation par chemins (path indexing) : pour chaque (prédicat, arité) et signe, et pour chaque
+    chemin d'argument, l'ensemble des littéraux ayant tel symbole à ce chemin, et celui des littéraux
+    ayant une variable à ce chemin.
+
+    Un littéral l peut s'unifier avec la requête q seulement si, pour chaque chemin où q a un symbole f,
+    l a f à ce chemin ou une variable à ce chemin ou à l'un de ses préfixes. Les candidats sont
+    l'intersection de ces ensembles (des entiers, cf. _Posting) ; c'est un sur-ensemble des unifiables
+    (les variables répétées ne sont pas prises en compte), l'unification fait le reste.
+
+    Les littéraux sont numérotés dans l'ordre d'insertion. remove les oublie sans toucher aux postings
+    (les identifiants retirés sont écartés à la lecture) ; l'index est reconstruit quand les retirés
+    deviennent plus nombreux que les présents. Chaque reconstruction (ou clear) change de génération :
+    un parcours de candidats commencé avant garde l'ancienne numérotation, et vérifie alors que chaque
+    littéral est encore présent (cf. _decoder).
+
+    Args:
+        profondeur: Longueur maximale des chemins indexés (None : tous). Les sous-termes plus profonds
+            ne sont pas indexés, ce qui élargit les candidats mais allège l'index.
+    """
+    def __init__(self, profondeur: Optional[int] = None):
+        self.profondeur = profondeur
+        self._partitions: Dict[Tuple[int, bool], _Partition] = {}
+        self._litteraux: Dict[int, Litteral] = {} # Identifiant -> littéral présent, dans l'ordre d'insertion
+        self._identifiants: Dict[Litteral, List[int]] = {}
+        self._prochain = 0
+        self._retires = 0
+        self._generation = 0 # Numérotation courante, changée par chaque reconstruction
+
+    def push(self, item: Litteral) -> None:
+        identifiant = self._prochain
+        self._prochain += 1
+        self._litteraux[identifiant] = item
+        self._identifiants.setdefault(item, []).append(identifiant)
+        self._indexer(item, identifiant)
+
+    def _indexer(self, item: Litteral, identifiant: int) -> None:
+        cle = (item.symbole, item.sign)
+        partition = self._partitions.get(cle)
+        if partition is None:
+            partition = self._partitions[cle] = _Partition()
+        partition.tous.ajouter(identifiant)
+
+        postings = partition.postings
+        pile: List[Tuple[Chemin, NoeudTerme]] = [((i,), enfant) for i, enfant in enumerate(item.enfants)]
+        while pile:
+            chemin, terme = pile.pop()
+            est_var = terme.etiquette == ETIQUETTE_VAR
+            cle = (chemin, None if est_var else terme.symbole)
+            posting = postings.get(cle)
+            if posting is None:
+                posting = postings[cle] = _Posting()
+            posting.ajouter(identifiant)
+            if not est_var and (self.profondeur is None or len(chemin) < self.profondeur):
+                pile.extend((chemin + (i,), enfant) for i, enfant in enumerate(terme.enfants))
+
+    def pop(self) -> Litteral:
+        if self.is_empty():
+            raise IndexError("pop from empty PathIndexStore")
+        # Le dernier littéral ajouté encore présent
+        identifiant = next(reversed(self._litteraux))
+        item = self._litteraux[identifiant]
+        self._identifiants[item].remove(identifiant)
+        self._oublier(item, identifiant)
+        return item
+
+    def remove(self, item: Litteral) -> None:
+        """Retire une occurrence de `item` (ValueError s'il n'est pas dans le store)."""
+        identifiants = self._identifiants.get(item)
+        if identifiants is None:
+            raise ValueError(f"{item} n'est pas dans le PathIndexStore")
+        self._oublier(item, identifiants.pop())
+
+    def _oublier(self, item: Litteral, identifiant: int) -> None:
+        if not self._identifiants[item]:
+            del self._identifiants[item]
+        del self._litteraux[identifiant]
+        self._retires += 1
+        if self._retires > max(len(self._litteraux), 1024):
+            self._reconstruire()
+
+    def _reconstruire(self) -> None:
+        """Renumérote les littéraux présents et reconstruit les postings."""
+        litteraux = list(self._litteraux.values())
+        self.clear()
+        for item in litteraux:
+            self.push(item)
+
+    def clear(self) -> None:
+        self._partitions.clear()
+        # Nouveau dictionnaire : les parcours en cours gardent celui de leur numérotation
+        self._litteraux = {}
+        self._identifiants.clear()
+        self._prochain = 0
+        self._retires = 0
+        self._generation += 1
+
+    def is_empty(self) -> bool:
+        return not self._litteraux
+
+    def __len__(self) -> int:
+        return len(self._litteraux)
+
+    def __iter__(self) -> Iterator[Litteral]:
+        # Instantané dans l'ordre d'insertion
+        return iter(list(self._litteraux.values()))
+
+    def __str__(self) -> str:
+        return f"PathIndexStore({list(self._litteraux.values())})"
+
+    def __repr__(self) -> str:
+        cles = [f"{'' if signe else '¬'}{SIGNATURE.nom(symbole)}/{SIGNATURE.arite(symbole)}" for symbole, signe in self._partitions]
+        return f"PathIndexStore(size={len(self)}, profondeur={self.profondeur}, keys={cles})"
+
+    def _decoder(self, bits: int) -> Iterator[Litteral]:
+        """
+        Littéraux présents dont l'identifiant est à 1 dans `bits`, dans l'ordre d'insertion.
+        La numérotation de `bits` est fixée à l'appel : si l'index est reconstruit pendant le parcours,
+        les identifiants restent lus dans l'ancienne numérotation, et chaque littéral n'est donné que
+        s'il est encore présent.
+        """
+        return self._parcourir(bits, self._litteraux, self._generation)
+
+    def _parcourir(self, bits: int, litteraux: Dict[int, Litteral], generation: int) -> Iterator[Litteral]:
+        for identifiant in _identifiants(bits):
+            item = litteraux.get(identifiant)
+            if item is not None and (generation == self._generation or self._present(item)):
+                yield item
+
+    def _present(self, item: Litteral) -> bool:
+        """True si l'objet `item` lui-même (pas seulement un littéral égal) est encore dans le store."""
+        identifiants = self._identifiants.get(item)
+        return identifiants is not None and any(self._litteraux[i] is item for i in identifiants)
+
+    # --- METHODE D'OPTIMISATION ---
+    def get_candidats(self, pred: Litteral, sign: bool) -> Iterator[Litteral]:
+        """
+        Retourne les littéraux de même prédicat et même arité que pred, et de signe `sign`.
+        """
+        partition = self._partitions.get((pred.symbole, sign))
+        if partition is None:
+            return iter([]) # Aucun candidat
+        return self._decoder(partition.tous.bits())
+
+    def get_candidats_compatibles(self, pred: Litteral, sign: bool) -> Iterator[Litteral]:
+        """
+        Comme get_candidats, mais en ne gardant que les littéraux compatibles avec pred à chaque chemin
+        où pred n'a pas de variable (intersection des postings).
+        """
+        partition = self._partitions.get((pred.symbole, sign))
+        if partition is None:
+            return iter([]) # Aucun candidat
+
+        resultat = None # Pas encore de contrainte
+        # (chemin, sous-terme de pred, littéraux ayant une variable à un préfixe strict du chemin)
+        pile: List[Tuple[Chemin, NoeudTerme, int]] = [((i,), enfant, 0) for i, enfant in enumerate(pred.enfants)]
+        while pile:
+            chemin, terme, prefixes = pile.pop()
+            if terme.etiquette == ETIQUETTE_VAR:
+                continue # Aucune contrainte sur ce chemin ni en dessous
+            variables = partition.bits(chemin, None) | prefixes
+            masque = partition.bits(chemin, terme.symbole) | variables
+            resultat = masque if resultat is None else resultat & masque
+            if not resultat:
+                return iter([])
+            if self.profondeur is None or len(chemin) < self.profondeur:
+                pile.extend((chemin + (i,), enfant, variables) for i, enfant in enumerate(terme.enfants))
+
+        if resultat is None:
+            resultat = partition.tous.bits()
+        return self._decoder(resultat)
+
+    def get_candidats_resolution(self, pred: Litteral) -> Iterator[Litteral]:
+        """
+        Retourne uniquement les littéraux pertinents pour la résolution :
+        - Même prédicat
+        - Signe opposé
+        - Même arité
+        - Compatibles avec pred à chaque chemin où pred a un symbole
+        """
+        # Si pred est positif, on veut unifier avec les négatifs (et inversement)
+        return self.get_candidats_compatibles(pred, not pred.sign)
@@ -4,16 +4,45 @@ from typing import TypeVar, Generic, Iterator
 T = TypeVar('T')
 
 class SetStore(TermStore[T]):
-    """Implémentation avec un ensemble (ordre non déterministe)."""
+    """
+    Implémentation avec un ensemble (sans doublons).
+    L'ensemble est un dict aux valeurs ignorées : l'ordre d'itération est l'ordre d'insertion,
+    et pop retire le dernier élement ajouté.
+
+    Comme pour ListStore, l'itération parcourt directement le dict, qui est recopié à la première
+    modification qui suit un parcours (copie sur écriture).
+    """
     
     def __init__(self):
-        self._data: set[T] = set()
+        self._data: dict[T, None] = {}
+        self._partage = False # True si un parcours a pu garder une référence à self._data
+
+    def _detacher(self) -> None:
+        """Copie sur écriture : le dict éventuellement en cours de parcours n'est plus modifié."""
+        self._data = self._data.copy()
+        self._partage = False
     
     def pop(self) -> T:
-        return self._data.pop()
+        if self._partage:
+            self._detacher()
+        return self._data.popitem()[0]
     
     def push(self, item: T) -> None:
-        self._data.add(item)
+        if self._partage:
+            self._detacher()
+        self._data[item] = None
+
+    def remove(self, item: T) -> None:
+        if self._partage:
+            self._detacher()
+        try:
+            del self._data[item]
+        except KeyError:
+            raise ValueError(f"{item} n'est pas dans le SetStore") from None
+    
+    def clear(self) -> None:
+        self._data = {} # Pas de clear en place : le dict peut être en cours de parcours
+        self._partage = False
     
     def is_empty(self) -> bool:
         return len(self._data) == 0
@@ -22,12 +51,14 @@ class SetStore(TermStore[T]):
         return len(self._data)
     
     def __str__(self) -> str:
-        return f"SetStore({self._data})"
+        return f"SetStore({set(self._data)})"
     
     def __repr__(self) -> str:
-        return f"SetStore(data={self._data!r}, len={len(self._data)})"
+        return f"SetStore(data={set(self._data)!r}, len={len(self._data)})"
 
     def __iter__(self) -> Iterator[T]:
+        # Instantané sans copie : le dict parcouru ne sera plus modifié (cf. _detacher)
+        self._partage = True
         return iter(self._data)
 
 # Exemple d'utilisation 
@@ -5,23 +5,34 @@ T = TypeVar('T')
 
 
 class TermStore(ABC, Generic[T]):
-    """Interface abstraite pour stocker les équations à unifier."""
+    """
+    Interface abstraite pour stocker les équations à unifier.
+
+    push, pop et remove sont en O(1) (amorti). L'itération parcourt un instantané du store pris au
+    début du parcours : on peut ajouter ou retirer des élements pendant une boucle "for x in store"
+    sans que le parcours en cours n'en soit affecté.
+    """
     
     @abstractmethod
     def pop(self) -> T:
         """Récupère et retire un élement"""
         ...
 
-    # @abstractmethod
-    # def remove(self, item: T) -> str:
-    #     """Retire un élement donné"""
-    #     ...
+    @abstractmethod
+    def remove(self, item: T) -> None:
+        """Retire une occurrence d'un élement donné (ValueError s'il est absent)"""
+        ...
     
     @abstractmethod
     def push(self, item: T) -> None:
         """Ajoute un élement"""
         ...
     
+    @abstractmethod
+    def clear(self) -> None:
+        """Retire tous les élements (pour réutiliser la structure)"""
+        ...
+    
     @abstractmethod
     def is_empty(self) -> bool:
         """Vérifie s'il reste des élements"""
@@ -44,5 +55,5 @@ class TermStore(ABC, Generic[T]):
 
     @abstractmethod
     def __iter__(self) -> Iterator[T]:
-        """Permet l'itération"""
+        """Permet l'itération (sur un instantané, cf. docstring de la classe)"""
         ...
@@ -0,0 +1,151 @@
+import random
+
+from unification.utils.stores import DictStore, ListStore, SetStore
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire, candidats_compatibles
+from unification.robinson import unifLitteraux, rechercherUnifiablesIter
+from unification.martelli_montanari import lit_dict_iter
+
+
+def _store(chaines, argument=0):
+    store = DictStore(argument)
+    for s in chaines:
+        store.push(Litteral.from_string(s))
+    return store
+
+def testSeaux():
+    """Une requête d'argument indexé clos ne parcourt que le seau de même tête et celui des variables"""
+    store = _store(["¬P(a, b)", "¬P(f(a), b)", "¬P(f(c), d)", "¬P(X, c)", "¬P(g(X), a)", "P(a, b)", "¬Q(a, b)", "¬P()"])
+
+    trouves = sorted(str(l) for l in store.get_candidats_resolution(Litteral.from_string("P(f(Y), b)")))
+    assert trouves == ["¬P(X, c)", "¬P(f(a), b)", "¬P(f(c), d)"], f"Obtenu : {trouves}"
+    # Argument indexé variable : tous les littéraux de même prédicat et de signe opposé
+    trouves = sorted(str(l) for l in store.get_candidats_resolution(Litteral.from_string("P(Y, b)")))
+    assert trouves == ["¬P(X, c)", "¬P(a, b)", "¬P(f(a), b)", "¬P(f(c), d)", "¬P(g(X), a)"], f"Obtenu : {trouves}"
+    assert len(list(store.get_candidats(Litteral.from_string("P(a, b)"), False))) == 5
+
+    # Indexation sur le second argument
+    store = _store(["¬P(a, b)", "¬P(f(a), b)", "¬P(f(c), d)", "¬P(X, c)", "¬P(g(X), Y)"], argument=1)
+    trouves = sorted(str(l) for l in store.get_candidats_resolution(Litteral.from_string("P(f(Y), b)")))
+    assert trouves == ["¬P(a, b)", "¬P(f(a), b)", "¬P(g(X), Y)"], f"Obtenu : {trouves}"
+    print("testSeaux OK")
+
+def testMutations():
+    """push, remove, pop, __iter__ et __len__ restent cohérents à travers les seaux"""
+    chaines = ["P(a)", "P(f(a))", "P(X)", "¬P(a)", "Q(a, b)", "R()"]
+    store = _store(chaines)
+    assert len(store) == 6 and sorted(str(l) for l in store) == sorted(chaines)
+
+    store.remove(Litteral.from_string("P(f(a))"))
+    assert len(store) == 5 and "P(f(a))" not in [str(l) for l in store]
+    try:
+        store.remove(Litteral.from_string("P(f(a))"))
+        assert False, "ValueError attendue"
+    except ValueError:
+        pass
+    retires = [str(store.pop()) for _ in range(5)]
+    assert sorted(retires) == sorted(c for c in chaines if c != "P(f(a))") and store.is_empty()
+    print("testMutations OK")
+
+def testEquivalence():
+    """Le filtrage par seaux ne perd aucun candidat unifiable"""
+    random.seed(22)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(500)
+    store = DictStore()
+    for l in litteraux:
+        store.push(l)
+    for requete in generateur.generer_litteraux(40):
+        attendus = sorted(map(str, (c for c in litteraux if unifLitteraux(requete, c) is not None)))
+        candidats = list(store.get_candidats_resolution(requete))
+        assert sorted(map(str, (c for c in candidats if unifLitteraux(requete, c) is not None))) == attendus, f"{requete}"
+        # Les seaux font au moins le travail du préfiltre sur le premier argument
+        assert len(candidats) <= sum(1 for c in litteraux if c.symbole == requete.symbole and c.sign != requete.sign)
+        assert set(candidats_compatibles(requete, litteraux)) <= set(candidats)
+    print("testEquivalence OK")
+
+def testChurn():
+    """Suite aléatoire de push / remove / pop sur chaque store, comparée à une liste de référence"""
+    random.seed(23)
+    litteraux = GenerateurLitteralAleatoire(["P", "Q"], 2, 2).generer_litteraux(300)
+    for classe in (ListStore, SetStore, DictStore):
+        store, reference = classe(), []
+        for etape in range(3000):
+            tirage = random.random()
+            if tirage < 0.5 or not reference:
+                l = random.choice(litteraux)
+                if classe is SetStore and l in reference:
+                    continue
+                store.push(l)
+                reference.append(l)
+            elif tirage < 0.8:
+                l = random.choice(reference)
+                store.remove(l)
+                reference.remove(l)
+            else:
+                reference.remove(store.pop())
+            assert len(store) == len(reference)
+            if etape % 50 == 0:
+                assert sorted(map(str, store)) == sorted(map(str, reference)), f"{classe.__name__} : étape {etape}"
+        if classe is DictStore:
+            # Après compactages, l'index donne toujours les bons candidats
+            for requete in litteraux[:20]:
+                attendus = sorted(str(c) for c in reference if c.symbole == requete.symbole and c.sign != requete.sign
+                                  and (requete.racines[0] is None or c.racines[0] in (None, requete.racines[0])))
+                assert sorted(map(str, store.get_candidats_resolution(requete))) == attendus, f"{requete}"
+    print("testChurn OK")
+
+def testIterationStable():
+    """Retirer ou ajouter pendant un parcours ne change pas le parcours en cours"""
+    for classe in (ListStore, SetStore, DictStore):
+        chaines = ["P(a)", "P(b)", "P(c)", "P(d)", "P(e)"]
+        store = _store([]) if classe is DictStore else classe()
+        for s in chaines:
+            store.push(Litteral.from_string(s))
+        vus = []
+        for l in store:
+            vus.append(str(l))
+            store.remove(l)
+            store.push(Litteral.from_string(f"Q({l.enfants[0]})"))
+        assert vus == chaines, f"{classe.__name__} : {vus}"
+        assert sorted(map(str, store)) == [f"Q({s[2]})" for s in chaines]
+    # Plusieurs parcours en cours, séparés par des modifications (copie sur écriture pour ListStore/SetStore)
+    for classe in (ListStore, SetStore, DictStore):
+        store = _store([]) if classe is DictStore else classe()
+        for s in ["P(a)", "P(b)", "P(c)"]:
+            store.push(Litteral.from_string(s))
+        premier = iter(store)
+        store.push(Litteral.from_string("P(d)"))
+        second = iter(store)
+        store.remove(Litteral.from_string("P(a)"))
+        store.clear()
+        assert [str(l) for l in premier] == ["P(a)", "P(b)", "P(c)"], classe.__name__
+        assert [str(l) for l in second] == ["P(a)", "P(b)", "P(c)", "P(d)"], classe.__name__
+        assert list(store) == []
+    # pop retire le dernier élement ajouté encore présent
+    store = _store(["P(a)", "P(b)", "P(c)"])
+    store.remove(Litteral.from_string("P(c)"))
+    assert str(store.pop()) == "P(b)"
+    print("testIterationStable OK")
+
+def testRetraitPendantRecherche():
+    """Retirer les candidats pendant le parcours de la vue (avec ou sans compactage) ne produit pas de tombe"""
+    requete = Litteral.from_string("¬P(X)")
+    for recherche in (lambda store: (p for p, _ in rechercherUnifiablesIter(requete, store)), lambda store: (p for p, _ in lit_dict_iter(requete, store))):
+        for n in (10, 200):
+            store = _store([f"P(c{i})" for i in range(n)] + ["P(Y)"])
+            vus = []
+            for l in recherche(store):
+                vus.append(str(l))
+                store.remove(l)
+                if len(store) > 1:
+                    store.remove(next(iter(store))) # Un littéral pas encore atteint
+            assert vus and all(v.startswith("P(") for v in vus), f"{vus}"
+    print("testRetraitPendantRecherche OK")
+
+if __name__ == "__main__":
+    testSeaux()
+    testMutations()
+    testEquivalence()
+    testChurn()
+    testIterationStable()
+    testRetraitPendantRecherche()
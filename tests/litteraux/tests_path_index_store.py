@@ -0,0 +1,93 @@
+import random
+
+from unification import rechercherUnifiablesOptimise, rechercherUnifiablesSimple
+from unification.martelli_montanari import lit_dict
+from unification.utils.stores import PathIndexStore, ListStore
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+
+
+def _store(chaines, profondeur=None):
+    store = PathIndexStore(profondeur)
+    for s in chaines:
+        store.push(Litteral.from_string(s))
+    return store
+
+def testIntersection():
+    """Seuls les littéraux compatibles à chaque chemin non variable de la requête sont candidats"""
+    store = _store(["¬P(f(a), b)", "¬P(f(c), b)", "¬P(f(X), c)", "¬P(X, b)", "¬P(g(a), Y)", "¬P(f(a, a), b)", "P(f(a), b)"])
+
+    trouves = sorted(str(l) for l in store.get_candidats_resolution(Litteral.from_string("P(f(a), b)")))
+    # ¬P(f(c), b) : clash en (0, 0) ; ¬P(f(X), c) : clash en (1) ; f/2 n'est pas f/1
+    assert trouves == ["¬P(X, b)", "¬P(f(a), b)"], f"Obtenu : {trouves}"
+    trouves = sorted(str(l) for l in store.get_candidats_resolution(Litteral.from_string("P(Z, b)")))
+    assert trouves == ["¬P(X, b)", "¬P(f(a), b)", "¬P(f(a, a), b)", "¬P(f(c), b)", "¬P(g(a), Y)"], f"Obtenu : {trouves}"
+    assert len(list(store.get_candidats_resolution(Litteral.from_string("P(Z, W)")))) == 6
+
+    # Chemins limités à la profondeur 1 : (0, 0) n'est plus indexé, ¬P(f(c), b) redevient candidat
+    store = _store(["¬P(f(a), b)", "¬P(f(c), b)", "¬P(g(a), b)"], profondeur=1)
+    trouves = sorted(str(l) for l in store.get_candidats_resolution(Litteral.from_string("P(f(a), b)")))
+    assert trouves == ["¬P(f(a), b)", "¬P(f(c), b)"], f"Obtenu : {trouves}"
+    print("testIntersection OK")
+
+def testEquivalence():
+    """Mêmes unifiables qu'un parcours complet, pour Robinson et Martelli-Montanari, avant et après retraits"""
+    random.seed(24)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(2500)
+    requetes = generateur.generer_litteraux(30)
+    for profondeur in (None, 2):
+        store, liste = PathIndexStore(profondeur), ListStore()
+        for l in litteraux:
+            store.push(l)
+            liste.push(l)
+        for retires in (litteraux[:1800], []):
+            for requete in requetes:
+                attendus = sorted(map(str, rechercherUnifiablesSimple(requete, liste)))
+                assert sorted(map(str, rechercherUnifiablesOptimise(requete, store))) == attendus, f"{requete}"
+                assert sorted(map(str, lit_dict(requete, store))) == attendus, f"MM : {requete}"
+            # Assez de retraits pour déclencher la reconstruction de l'index
+            for l in retires:
+                store.remove(l)
+                liste.remove(l)
+            assert len(store) == len(liste)
+    print("testEquivalence OK")
+
+def testMutations():
+    """pop retire le dernier ajouté encore présent, et l'itération se fait sur un instantané"""
+    store = _store(["P(a)", "P(b)", "P(c)", "P(a)"])
+    store.remove(Litteral.from_string("P(a)"))
+    assert [str(l) for l in store] == ["P(a)", "P(b)", "P(c)"]
+    assert str(store.pop()) == "P(c)"
+    for l in store:
+        store.remove(l)
+    assert store.is_empty() and list(store.get_candidats_resolution(Litteral.from_string("¬P(a)"))) == []
+    try:
+        store.remove(Litteral.from_string("P(a)"))
+        assert False, "ValueError attendue"
+    except ValueError:
+        pass
+    print("testMutations OK")
+
+def testReconstructionPendantUnParcours():
+    """Un parcours de candidats commencé avant une reconstruction de l'index ne perd aucun littéral restant"""
+    store = PathIndexStore()
+    litteraux = [Litteral.from_string(f"¬P(f(c{i}), X)") for i in range(3000)]
+    for l in litteraux:
+        store.push(l)
+    parcours = store.get_candidats_resolution(Litteral.from_string("P(Y, a)"))
+    vus = [next(parcours) for _ in range(10)]
+    generation = store._generation
+    for i, l in enumerate(litteraux):
+        if i % 3 != 0:
+            store.remove(l)
+    assert store._generation != generation, "Les retraits doivent déclencher la reconstruction"
+    vus.extend(parcours)
+    attendus = litteraux[:10] + [l for i, l in enumerate(litteraux) if i >= 10 and i % 3 == 0]
+    assert vus == attendus, f"{len(vus)} littéraux vus, {len(attendus)} attendus"
+    print("testReconstructionPendantUnParcours OK")
+
+if __name__ == "__main__":
+    testIntersection()
+    testEquivalence()
+    testMutations()
+    testReconstructionPendantUnParcours()
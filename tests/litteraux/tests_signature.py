@@ -0,0 +1,34 @@
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.utils.logique.litteral import Litteral
+from unification.utils.logique.signature import SIGNATURE, GENRE_FONCTION, GENRE_PREDICAT
+from unification.discrimination_tree import ArbreDeDiscrimination
+
+
+def testSymboles():
+    """Un symbole est identifié par (genre, nom, arité), et son arité se lit dans la table"""
+    a = FabriqueDeTermes.creer_cons("a")
+    f1 = FabriqueDeTermes.creer_fonc("f", 1, [a])
+    f2 = FabriqueDeTermes.creer_fonc("f", 2, [a, a])
+
+    assert f1.symbole != f2.symbole, "f/1 et f/2 sont deux symboles différents"
+    assert FabriqueDeTermes.creer_var("a").symbole != a.symbole, "Variable et constante de même nom"
+    assert f2.symbole == SIGNATURE.identifiant("f", GENRE_FONCTION, 2)
+    assert SIGNATURE.arite(f2.symbole) == 2 and SIGNATURE.nom(f2.symbole) == "f"
+
+    p1, p2 = Litteral.from_string("P(a)"), Litteral.from_string("P(a, b)")
+    assert p1.symbole != p2.symbole and p1.symbole == SIGNATURE.identifiant("P", GENRE_PREDICAT, 1)
+    print("testSymboles OK")
+
+def testAritesDifferentesArbre():
+    """Dans l'arbre, un nom utilisé avec deux arités ne fausse plus le saut des sous-termes"""
+    arbre = ArbreDeDiscrimination()
+    arbre.inserer(Litteral.from_string("P(f(a), b)"), "f/1")
+    arbre.inserer(Litteral.from_string("P(f(a, a), b)"), "f/2")
+
+    trouves = sorted(p for r in arbre.rechercher(Litteral.from_string("¬P(X, b)")) for p in r.pointeurs)
+    assert trouves == ["f/1", "f/2"], f"Obtenu : {trouves}"
+    print("testAritesDifferentesArbre OK")
+
+if __name__ == "__main__":
+    testSymboles()
+    testAritesDifferentesArbre()
@@ -0,0 +1,48 @@
+from unification.utils.logique.litteral import Litteral
+from unification.utils.logique.terme_plat import aplatir_terme, aplatir_litteral
+from unification.utils.logique.signature import SIGNATURE, GENRE_FONCTION, GENRE_CONSTANTE, GENRE_PREDICAT
+
+
+def testAplatirTerme():
+    """f(X, g(a, X)) donne 5 symboles en ordre préfixe avec les bonnes fins de sous-termes"""
+    terme = Litteral.from_string("P(f(X, g(a, X)))").enfants[0]
+    plat = aplatir_terme(terme)
+
+    f = SIGNATURE.identifiant("f", GENRE_FONCTION, 2)
+    g = SIGNATURE.identifiant("g", GENRE_FONCTION, 2)
+    a = SIGNATURE.identifiant("a", GENRE_CONSTANTE)
+
+    assert list(plat.symboles) == [f, -1, g, a, -1], f"Symboles obtenus : {list(plat.symboles)}"
+    assert list(plat.fins) == [5, 2, 5, 4, 5], f"Fins obtenues : {list(plat.fins)}"
+    assert plat.variables == ("X",)
+    assert plat.enfants(0) == [1, 2] and plat.enfants(2) == [3, 4]
+    print("testAplatirTerme OK")
+
+def testAllerRetourTerme():
+    """vers_terme redonne le même terme (interné)"""
+    terme = Litteral.from_string("P(h(f(X, b), Y, g(Y, Z, c)))").enfants[0]
+    assert aplatir_terme(terme).vers_terme() is terme
+    print("testAllerRetourTerme OK")
+
+def testAllerRetourLitteral():
+    """Un littéral encodé puis décodé est inchangé, le prédicat est en position 0"""
+    for chaine in ["P(f(X, a), Y)", "¬Q(a)", "R(X, X, g(h(Y), Z))", "S"]:
+        litteral = Litteral.from_string(chaine)
+        plat = aplatir_litteral(litteral)
+        assert plat.symboles[0] == SIGNATURE.identifiant(litteral.predicat, GENRE_PREDICAT, litteral.arity)
+        assert plat.fins[0] == len(plat)
+        assert plat.vers_litteral() == litteral, f"{plat.vers_litteral()} != {litteral}"
+    print("testAllerRetourLitteral OK")
+
+def testCacheLitteral():
+    """Litteral.plat est calculé une seule fois"""
+    litteral = Litteral.from_string("¬P(f(X), Y)")
+    assert litteral.plat is litteral.plat
+    assert litteral.plat.signe is False and litteral.plat.variables == ("X", "Y")
+    print("testCacheLitteral OK")
+
+if __name__ == "__main__":
+    testAplatirTerme()
+    testAllerRetourTerme()
+    testAllerRetourLitteral()
+    testCacheLitteral()
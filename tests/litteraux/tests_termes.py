@@ -0,0 +1,128 @@
+import copy
+import gc
+import pickle
+import random
+import weakref
+
+from unification.utils.logique.terme import FabriqueDeTermes, NoeudTerme
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+from unification.utils.stores import TermSystem
+from unification.robinson import apply_subst
+from unification.martelli_montanari import MartelliMontanari
+
+
+def testInternement():
+    """Deux termes structurellement égaux créés par la fabrique sont le même objet"""
+    X = FabriqueDeTermes.creer_var("X")
+    a = FabriqueDeTermes.creer_cons("a")
+    t1 = FabriqueDeTermes.creer_fonc("f", 2, [X, FabriqueDeTermes.creer_fonc("g", 1, [a])])
+    t2 = FabriqueDeTermes.creer_fonc("f", 2, [FabriqueDeTermes.creer_var("X"), FabriqueDeTermes.creer_fonc("g", 1, [FabriqueDeTermes.creer_cons("a")])])
+
+    assert t1 is t2, "On attend le même objet pour f(X, g(a))"
+    assert Litteral.from_string("P(f(X, g(a)))").enfants[0] is t1, "Le parsing doit aussi passer par la table"
+    assert FabriqueDeTermes.creer_var("a") is not a, "Une variable et une constante de même nom sont différentes"
+    print("testInternement OK")
+
+def testEgaliteNonInterne():
+    """Un terme construit hors de la fabrique reste égal (et de même hash) à son équivalent interné"""
+    a = FabriqueDeTermes.creer_cons("a")
+    interne = FabriqueDeTermes.creer_fonc("f", 1, [a])
+    libre = NoeudTerme("f", 1, [NoeudTerme("a", "cons")])
+
+    assert interne == libre and libre == interne, "Égalité structurelle attendue"
+    assert hash(interne) == hash(libre), "Hash identique attendu"
+    assert interne != FabriqueDeTermes.creer_fonc("f", 1, [FabriqueDeTermes.creer_cons("b")])
+    print("testEgaliteNonInterne OK")
+
+def testCopieEtPickle():
+    """Une copie ou un terme dépicklé d'un terme interné est le terme de la table, donc égal à l'original"""
+    t = Litteral.from_string("P(f(X, g(a)))").enfants[0]
+    for copie in (copy.copy(t), copy.deepcopy(t), pickle.loads(pickle.dumps(t))):
+        assert copie is t and copie == t, f"Obtenu : {copie}"
+
+    FabriqueDeTermes.internement = False
+    try:
+        copie = pickle.loads(pickle.dumps(t)) # Reconstruit hors de la table : plus marqué interné
+    finally:
+        FabriqueDeTermes.internement = True
+    assert copie is not t and not copie.est_interne and copie == t and t == copie
+
+    libre = NoeudTerme("f", 1, [NoeudTerme("a", "cons")])
+    copie = pickle.loads(pickle.dumps(libre))
+    assert not copie.est_interne and copie == libre and hash(copie) == hash(libre)
+    print("testCopieEtPickle OK")
+
+def testTableFaible():
+    """Un terme qui n'est plus référencé sort de la table"""
+    gc.collect()
+    taille_avant = FabriqueDeTermes.taille_table()
+    t = FabriqueDeTermes.creer_fonc("h_temporaire", 1, [FabriqueDeTermes.creer_cons("c_temporaire")])
+    assert FabriqueDeTermes.taille_table() == taille_avant + 2
+    reference = weakref.ref(t)
+    del t
+    gc.collect()
+    assert reference() is None, "La table doit être à valeurs faibles"
+    assert FabriqueDeTermes.creer_cons("c_temporaire").est_interne
+    print("testTableFaible OK")
+
+def testSansInternement():
+    """Avec l'internement désactivé, chaque appel crée un nouvel objet"""
+    FabriqueDeTermes.internement = False
+    try:
+        t1 = FabriqueDeTermes.creer_cons("a")
+        t2 = FabriqueDeTermes.creer_cons("a")
+    finally:
+        FabriqueDeTermes.internement = True
+
+    assert t1 is not t2 and t1 == t2
+    print("testSansInternement OK")
+
+def testGenerateurLocal():
+    """Un générateur local rejoue les mêmes littéraux (arités comprises) sans toucher au module random"""
+    etat = random.getstate()
+    jeux = [[str(l) for l in GenerateurLitteralAleatoire(["P", "Q"], 4, 3, alea=random.Random(7)).generer_litteraux(50)] for _ in range(2)]
+    assert jeux[0] == jeux[1]
+    assert random.getstate() == etat, "L'état global de random ne doit pas changer"
+    print("testGenerateurLocal OK")
+
+def testMetadonnees():
+    """Taille, profondeur, variables et clôture sont calculées à la construction"""
+    t = Litteral.from_string("P(f(X, g(a, Y)))").enfants[0]
+
+    assert t.taille == 5, f"On attend 5 noeuds, obtenu : {t.taille}"
+    assert t.profondeur == 3, f"On attend une profondeur de 3, obtenu : {t.profondeur}"
+    assert t.variables == frozenset({"X", "Y"}), f"Variables obtenues : {t.variables}"
+    assert not t.est_clos
+    assert t.enfants[1].enfants[0].est_clos and isinstance(t.enfants, tuple)
+    print("testMetadonnees OK")
+
+def testSubstitutionSansCopie():
+    """Sans internement, les sous-termes non touchés par la substitution restent les mêmes objets"""
+    FabriqueDeTermes.internement = False
+    try:
+        t = Litteral.from_string("P(f(g(Y, b), X, g(Y, b)))").enfants[0]
+        a = FabriqueDeTermes.creer_cons("a")
+        mm = MartelliMontanari(TermSystem())
+
+        assert apply_subst(t, {"Z": a}) is t, "Aucune variable liée : même objet attendu"
+        resultat = apply_subst(t, {"X": a})
+        assert resultat is not t and str(resultat) == "f(g(Y, b), a, g(Y, b))"
+        assert resultat.enfants[0] is t.enfants[0] and resultat.enfants[2] is t.enfants[2], "Sous-termes partagés"
+
+        assert mm.substitution(t, "Z", a) is t
+        resultat = mm.substitution(t, "Y", a)
+        assert str(resultat) == "f(g(a, b), X, g(a, b))" and resultat.enfants[1] is t.enfants[1]
+        assert resultat.enfants[0] is resultat.enfants[2], "Sous-terme répété calculé une seule fois"
+    finally:
+        FabriqueDeTermes.internement = True
+    print("testSubstitutionSansCopie OK")
+
+if __name__ == "__main__":
+    testInternement()
+    testEgaliteNonInterne()
+    testCopieEtPickle()
+    testTableFaible()
+    testSansInternement()
+    testGenerateurLocal()
+    testMetadonnees()
+    testSubstitutionSansCopie()
@@ -1,5 +1,10 @@
-from unification import UnificationError, MartelliMontanari
-from unification.utils.stores import TermSystem
+import random
+
+from unification import UnificationError, MartelliMontanari, MartelliMontanariMultiEquations
+from unification.martelli_montanari import MOTEURS, unifier_lot, TypeEchec, indexer, lit_dict, lit_liste, traiterLitterauxDict, traiterLitterauxSet
+from unification.robinson import unifLitteraux, apply_subst
+from unification.utils.logique.litteral import GenerateurLitteralAleatoire, Litteral
+from unification.utils.stores import TermSystem, Equation, ListStore
 from unification.utils.logique.terme import FabriqueDeTermes
 
 
@@ -135,7 +140,126 @@ def testOccurCheck():
         assert False, "On attend une UnificationError, aucune exception levée"
     except UnificationError:
         print("testOccurCheck OK")
-    
+
+def testChaine():
+    """f(X0, ..., Xn-1) = f(X1, ..., Xn-1, a) : toutes les variables finissent liées à a, sous forme résolue"""
+    n = 300
+    xs = [FabriqueDeTermes.creer_var(f"X{i}") for i in range(n)]
+    a = FabriqueDeTermes.creer_cons("a")
+    system = TermSystem()
+    system.add(FabriqueDeTermes.creer_fonc("f", n, xs), FabriqueDeTermes.creer_fonc("f", n, xs[1:] + [a]))
+
+    result = MartelliMontanari(system).solve()
+    assert result is system
+    assert len(result.equations) == n, f"On attend {n} équations, obtenu : {len(result.equations)}"
+    assert all(eq.right == a for eq in result.equations), f"Obtenu : {result}"
+    assert {eq.left for eq in result.equations} == set(xs)
+    print("testChaine OK")
+
+def testEliminationIndexee():
+    """f(X0, ..., Y0, ...) = f(g(Y0), ..., a, ...) : l'élimination de Yi réécrit le terme résolu de Xi"""
+    n = 50
+    xs = [FabriqueDeTermes.creer_var(f"X{i}") for i in range(n)]
+    ys = [FabriqueDeTermes.creer_var(f"Y{i}") for i in range(n)]
+    a = FabriqueDeTermes.creer_cons("a")
+    g_a = FabriqueDeTermes.creer_fonc("g", 1, [a])
+    system = TermSystem()
+    system.add(FabriqueDeTermes.creer_fonc("f", 2 * n, xs + ys),
+               FabriqueDeTermes.creer_fonc("f", 2 * n, [FabriqueDeTermes.creer_fonc("g", 1, [y]) for y in ys] + [a] * n))
+
+    resolu = {eq.left: eq.right for eq in MartelliMontanari(system).solve().equations}
+    assert resolu == {**{x: g_a for x in xs}, **{y: a for y in ys}}, f"Obtenu : {resolu}"
+    print("testEliminationIndexee OK")
+
+def testMultiEquations():
+    """Les deux moteurs (cf. MOTEURS) unifient les mêmes littéraux, avec un système résolu qui les unifie"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+    for system in [TermSystem([Equation(X, f(Y)), Equation(Y, f(X))]), TermSystem([Equation(f(X, Y), f(Y, f(X)))])]:
+        try:
+            MartelliMontanariMultiEquations(system).solve()
+            assert False, "On attend une UnificationError (cycle entre multi-équations)"
+        except UnificationError:
+            pass
+
+    random.seed(19)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 4, 4)
+    litteraux = generateur.generer_litteraux(500)
+    for requete in generateur.generer_litteraux(20):
+        regles = [p for p, _ in unifier_lot(requete, litteraux, moteur="regles")]
+        multi = list(unifier_lot(requete, litteraux, moteur="multi_equations"))
+        assert [p for p, _ in multi] == regles, f"{requete}"
+        assert regles == [p for p in litteraux if unifLitteraux(requete, p) is not None], f"{requete}"
+        for candidat, resolu in multi:
+            subst = {eq.left.nom: eq.right for eq in resolu.equations}
+            assert all(subst.keys().isdisjoint(terme.variables) for terme in subst.values()), f"Forme non résolue : {resolu}"
+            for t1, t2 in zip(requete.enfants, candidat.enfants):
+                assert apply_subst(t1, subst) == apply_subst(t2, subst), f"{requete} / {candidat} : {resolu}"
+    assert set(MOTEURS) == {"regles", "multi_equations"}
+    print("testMultiEquations OK")
+
+def testResolution():
+    """resoudre ne lève pas d'exception : cause de l'échec, termes en cause, message formaté à la demande"""
+    X = FabriqueDeTermes.creer_var("X")
+    a = FabriqueDeTermes.creer_cons("a")
+    b = FabriqueDeTermes.creer_cons("b")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+    g = lambda *enfants: FabriqueDeTermes.creer_fonc("g", len(enfants), list(enfants))
+    cas = [(a, b, TypeEchec.CLASH, "CLASH : Constantes différentes 'a' et 'b'"),
+           (f(X), g(X), TypeEchec.CLASH, "CLASH : Fonctions différentes 'f' et 'g'"),
+           (f(X), f(a, b), TypeEchec.ARITE, "ARITE : 'f' d'arités différentes (1 et 2)"),
+           (X, f(X), TypeEchec.OCCURS, "OCCUR CHECK : La variable X apparaît dans f(X)")]
+    for classe in MOTEURS.values():
+        for gauche, droite, echec, message in cas:
+            resultat = classe(TermSystem([Equation(gauche, droite)])).resoudre()
+            assert not resultat.succes and resultat.systeme is None
+            assert resultat.echec is echec, f"{classe.__name__} : {gauche} = {droite} -> {resultat.echec}"
+            if classe is MartelliMontanari:
+                assert resultat.message() == message, f"Obtenu : {resultat.message()}"
+            try:
+                resultat.valider()
+                assert False, "On attend une UnificationError"
+            except UnificationError as e:
+                assert str(e) == resultat.message()
+
+        system = TermSystem([Equation(f(X), f(a))])
+        resultat = classe(system).resoudre()
+        assert resultat.succes and resultat.valider() is system and resultat.message() == ""
+    print("testResolution OK")
+
+def testIndexIncremental():
+    """L'index (DictStore) suit les ajouts et retraits, et lit_dict accepte aussi un autre TermStore"""
+    random.seed(21)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(300)
+    index = indexer(litteraux[:200])
+    for l in litteraux[200:]:
+        index.push(l)
+    retires = litteraux[:50]
+    for l in retires:
+        index.remove(l)
+    restants = litteraux[50:]
+    liste = ListStore()
+    for l in restants:
+        liste.push(l)
+
+    for requete in generateur.generer_litteraux(20):
+        attendu = set(lit_liste(requete, restants))
+        assert set(lit_dict(requete, index)) == attendu, f"{requete}"
+        assert set(lit_dict(requete, liste)) == attendu, f"{requete} (ListStore)"
+        assert len(lit_dict(requete, index, touteUnif=False)) == min(1, len(attendu))
+    assert len(index) == len(restants)
+    print("testIndexIncremental OK")
+
+def testCompteursTraitement():
+    """traiterLitterauxDict compte les couples comme traiterLitterauxSet : autre arité ou clash écarté par l'index = échec"""
+    litteraux = [Litteral.from_string(s) for s in ["P(a)", "P(b, c)", "¬P(a, b)", "¬P(b)", "¬P(X)", "¬Q(a)"]]
+    # P(a) : 3 comparaisons (¬P(a, b), ¬P(b), ¬P(X)), 1 succès ; P(b, c) : 3 comparaisons, 0 succès
+    assert traiterLitterauxDict(litteraux) == (6, 1, 5)
+    assert traiterLitterauxDict(litteraux) == traiterLitterauxSet(litteraux)
+    print("testCompteursTraitement OK")
+
 if __name__ == "__main__":
     testDelete()
     testOrient()
@@ -143,4 +267,10 @@ if __name__ == "__main__":
     testDecomposition()
     testClashConstantes()
     testClashFonctions()
-    testOccurCheck()
\ No newline at end of file
+    testOccurCheck()
+    testChaine()
+    testEliminationIndexee()
+    testMultiEquations()
+    testResolution()
+    testIndexIncremental()
+    testCompteursTraitement()
\ No newline at end of file
@@ -0,0 +1,98 @@
+import random
+
+from unification import PatersonWegman, UnificationError, unifLitterauxPW
+from unification.robinson import unifLitteraux, apply_subst
+from unification.utils.stores import TermSystem
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+
+
+def _resolue(subst: dict, terme):
+    """Applique la substitution (triangulaire) jusqu'au point fixe."""
+    precedent = None
+    while precedent is not terme:
+        precedent, terme = terme, apply_subst(terme, subst)
+    return terme
+
+def testDecomposition():
+    """f(X, g(Y)) = f(a, g(b)) doit donner X = a et Y = b"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    a = FabriqueDeTermes.creer_cons("a")
+    b = FabriqueDeTermes.creer_cons("b")
+    system = TermSystem()
+    system.add(FabriqueDeTermes.creer_fonc("f", 2, [X, FabriqueDeTermes.creer_fonc("g", 1, [Y])]),
+               FabriqueDeTermes.creer_fonc("f", 2, [a, FabriqueDeTermes.creer_fonc("g", 1, [b])]))
+
+    subst = PatersonWegman(system).solve()
+    assert subst == {"X": a, "Y": b}, f"Obtenu : {subst}"
+    print("testDecomposition OK")
+
+def testMguNonDeveloppe():
+    """X = f(Y), Y = f(Z) : X reste lié au noeud f(Y) du DAG, sans être développé en f(f(Z))"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    Z = FabriqueDeTermes.creer_var("Z")
+    f_Y = FabriqueDeTermes.creer_fonc("f", 1, [Y])
+    system = TermSystem()
+    system.add(X, f_Y)
+    system.add(Y, FabriqueDeTermes.creer_fonc("f", 1, [Z]))
+
+    subst = PatersonWegman(system).solve()
+    assert subst["X"] is f_Y, f"Obtenu : {subst}"
+    assert str(_resolue(subst, X)) == "f(f(Z))"
+    print("testMguNonDeveloppe OK")
+
+def testEchecs():
+    """Clash et occurs check (direct ou à travers plusieurs classes)"""
+    for l1, l2 in [("P(a)", "¬P(b)"), ("P(f(X))", "¬P(g(X))"), ("P(X)", "¬P(f(X))"),
+                   ("P(X, Y)", "¬P(f(Y), g(X))"), ("P(f(X), X)", "¬P(Y, Y)")]:
+        assert unifLitterauxPW(Litteral.from_string(l1), Litteral.from_string(l2)) is None, f"{l1} / {l2}"
+
+    system = TermSystem()
+    system.add(FabriqueDeTermes.creer_cons("a"), FabriqueDeTermes.creer_cons("b"))
+    try:
+        PatersonWegman(system).solve()
+        assert False, "UnificationError attendue"
+    except UnificationError:
+        pass
+    print("testEchecs OK")
+
+def testTermesProfonds():
+    """Des termes bien plus profonds que la limite de récursion de Python : ni la construction du DAG ni FINISH ne récursent"""
+    n = 3000
+    X = FabriqueDeTermes.creer_var("X")
+    a = FabriqueDeTermes.creer_cons("a")
+    t1, t2 = X, a
+    for _ in range(n):
+        t1 = FabriqueDeTermes.creer_fonc("f", 1, [t1])
+        t2 = FabriqueDeTermes.creer_fonc("f", 1, [t2])
+    subst = unifLitterauxPW(Litteral("P", [t1]), Litteral("P", [t2], False))
+    assert subst == {"X": a}, f"Obtenu : {subst}"
+    assert unifLitteraux(Litteral("P", [t1]), Litteral("P", [t2], False)) is not None
+
+    # Occurs check au fond : P(f^n(X), X) / ¬P(Y, Y)
+    Y = FabriqueDeTermes.creer_var("Y")
+    assert unifLitterauxPW(Litteral("P", [t1, X]), Litteral("P", [Y, Y], False)) is None
+    print("testTermesProfonds OK")
+
+def testEquivalenceRobinson():
+    """Mêmes littéraux unifiables que unifLitteraux, et la substitution unifie bien les deux littéraux"""
+    random.seed(8)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(400)
+    for requete in generateur.generer_litteraux(20):
+        for candidat in litteraux:
+            obtenu = unifLitterauxPW(requete, candidat)
+            assert (unifLitteraux(requete, candidat) is None) == (obtenu is None), f"{requete} / {candidat}"
+            if obtenu is not None:
+                for t1, t2 in zip(requete.enfants, candidat.enfants):
+                    assert _resolue(obtenu, t1) == _resolue(obtenu, t2), f"{requete} / {candidat} : {obtenu}"
+    print("testEquivalenceRobinson OK")
+
+if __name__ == "__main__":
+    testDecomposition()
+    testMguNonDeveloppe()
+    testEchecs()
+    testTermesProfonds()
+    testEquivalenceRobinson()
@@ -0,0 +1,71 @@
+import random
+
+from unification import compilateur
+from unification.compilateur import compiler, source, _CODES
+from unification.robinson import unifLitteraux
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+
+
+def _unifie(subst, requete, candidat) -> bool:
+    return all(subst.appliquer(t1) == subst.appliquer(t2) for t1, t2 in zip(requete.enfants, candidat.enfants))
+
+def testCasParticuliers():
+    """Variables partagées entre requête et candidat, chaînes de liaisons et occurs check"""
+    for requete, candidat, unifiables in [("Q(W, V)", "¬Q(V, W)", True), ("P(X, f(X))", "¬P(Y, Y)", False),
+                                          ("P(X, Y)", "¬P(f(Y), g(X))", False), ("P(X, X, a)", "¬P(Y, Z, Z)", True),
+                                          ("P(f(X), a, X)", "¬P(f(b), a, c)", False), ("P(f(X), a)", "P(f(b), a)", False),
+                                          ("P(g(a, b), X)", "¬P(g(Y, b), Y)", True), ("P(X, g(X))", "¬P(Y, Y)", False)]:
+        r, c = Litteral.from_string(requete), Litteral.from_string(candidat)
+        subst = compiler(r)(c)
+        assert (subst is not None) == unifiables, f"{requete} / {candidat} : {subst}"
+        if subst is not None:
+            assert _unifie(subst, r, c), f"{requete} / {candidat} : {subst}"
+    print("testCasParticuliers OK")
+
+def testCacheParForme():
+    """Deux requêtes de même forme (aux noms de variables et à l'intérieur des sous-termes clos près) partagent le code"""
+    compiler(Litteral.from_string("R(f(X, g(a)), Y, X)"))
+    taille = len(_CODES)
+    filtre = compiler(Litteral.from_string("R(f(Z, g(b)), W, Z)"))
+    assert len(_CODES) == taille
+    assert str(filtre(Litteral.from_string("¬R(f(c, g(b)), d, c)"))) == "{'Z': c, 'W': d}"
+    assert filtre(Litteral.from_string("¬R(f(c, g(a)), d, c)")) is None
+    assert "def filtre" in source(Litteral.from_string("R(f(Z, b), W, Z)"))
+    print("testCacheParForme OK")
+
+def testCacheBorne():
+    """Le cache garde au plus TAILLE_CACHE formes, et oublie d'abord la moins récemment utilisée"""
+    taille_cache = compilateur.TAILLE_CACHE
+    compilateur.TAILLE_CACHE = 3
+    try:
+        requetes = [Litteral.from_string(s) for s in ["S(X)", "S(a, X)", "S(a, b, X)", "S(a, b, c, X)"]]
+        for r in requetes[:3]:
+            compiler(r)
+        compiler(requetes[0]) # S(X) devient la plus récente
+        filtre = compiler(requetes[3])
+        assert len(_CODES) == 3
+        assert list(_CODES) == [compilateur._cle(r, "toujours")[0] for r in (requetes[2], requetes[0], requetes[3])]
+        assert str(filtre(Litteral.from_string("¬S(a, b, c, d)"))) == "{'X': d}"
+    finally:
+        compilateur.TAILLE_CACHE = taille_cache
+    print("testCacheBorne OK")
+
+def testEquivalence():
+    """Même résultat que unifLitteraux sur des littéraux aléatoires"""
+    random.seed(13)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(400)
+    for requete in generateur.generer_litteraux(30):
+        filtre = compiler(requete)
+        for candidat in litteraux:
+            subst = filtre(candidat)
+            assert (subst is None) == (unifLitteraux(requete, candidat) is None), f"{requete} / {candidat}"
+            if subst is not None:
+                assert _unifie(subst, requete, candidat), f"{requete} / {candidat} : {subst}"
+    print("testEquivalence OK")
+
+if __name__ == "__main__":
+    testCasParticuliers()
+    testCacheParForme()
+    testCacheBorne()
+    testEquivalence()
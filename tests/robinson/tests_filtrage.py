@@ -0,0 +1,84 @@
+import random
+
+from unification import filtrer, filtrerLitteraux, rechercherInstances, rechercherGeneralisations
+from unification.robinson import apply_subst
+from unification.utils.logique.terme import FabriqueDeTermes, GenerateurDeTermesAleatoires
+from unification.utils.logique.litteral import Litteral
+from unification.utils.stores import DictStore, ListStore
+
+
+def testFiltrer():
+    """Seules les variables du motif sont liées"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    a = FabriqueDeTermes.creer_cons("a")
+    b = FabriqueDeTermes.creer_cons("b")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+    g = lambda *enfants: FabriqueDeTermes.creer_fonc("g", len(enfants), list(enfants))
+
+    assert filtrer(f(X, g(Y)), f(a, g(X))) == {"X": a, "Y": X}
+    assert filtrer(f(X, X), f(a, b)) is None
+    assert filtrer(f(X, X), f(Y, Y)) == {"X": Y}
+    assert filtrer(f(a, Y), f(X, b)) is None, "X (instance) n'est pas liée"
+    assert filtrer(X, f(X)) == {"X": f(X)}, "Pas d'occurs check : X de l'instance est une constante"
+    assert filtrer(f(X), g(a)) is None
+    print("testFiltrer OK")
+
+def testVariablesPartagees():
+    """Motif et instance partagent des variables : σ s'applique en une fois, sans chaîne de liaisons"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    a = FabriqueDeTermes.creer_cons("a")
+    p = lambda *enfants: FabriqueDeTermes.creer_fonc("p", len(enfants), list(enfants))
+
+    subst = filtrer(p(X, Y), p(Y, a))
+    assert subst == {"X": Y, "Y": a}
+    assert subst.appliquer(p(X, Y)) == p(Y, a)
+    assert apply_subst(p(X, Y), subst) == p(Y, a)
+    assert subst.resolve("X") == Y
+    assert subst.normaliser() == {"X": Y, "Y": a}
+
+    motif = Litteral.from_string("P(X, Y)")
+    instance = Litteral.from_string("P(Y, a)")
+    subst = filtrerLitteraux(motif, instance)
+    assert [subst.appliquer(t) for t in motif.enfants] == list(instance.enfants)
+    store = ListStore()
+    store.push(motif)
+    generalisations = rechercherGeneralisations(instance, store)
+    assert [generalisations[motif].appliquer(t) for t in motif.enfants] == list(instance.enfants)
+    print("testVariablesPartagees OK")
+
+def testInstanceAleatoire():
+    """Pour un motif aléatoire et une instance obtenue en remplaçant ses variables par des termes clos, σ redonne l'instance"""
+    random.seed(14)
+    generateur = GenerateurDeTermesAleatoires(3, 3)
+    for _ in range(300):
+        motif = generateur.generer_terme_aleatoire()
+        valeurs = {}
+        for nom in motif.variables:
+            terme = generateur.generer_terme_aleatoire()
+            valeurs[nom] = apply_subst(terme, {v: FabriqueDeTermes.creer_cons("c") for v in terme.variables})
+        instance = apply_subst(motif, valeurs)
+        subst = filtrer(motif, instance)
+        assert subst == valeurs, f"{motif} / {instance} : {subst}"
+    print("testInstanceAleatoire OK")
+
+def testRecherches():
+    """Instances et généralisations, avec ou sans DictStore"""
+    litteraux = [Litteral.from_string(s) for s in ["P(a, b)", "P(a, X)", "¬P(a, b)", "P(X, X)", "P(f(a), b)", "Q(a, b)"]]
+    for store in (ListStore(), DictStore()):
+        for l in litteraux:
+            store.push(l)
+        instances = rechercherInstances(Litteral.from_string("P(a, Y)"), store)
+        assert sorted(map(str, instances)) == ["P(a, X)", "P(a, b)"], f"{type(store)} : {instances}"
+        generalisations = rechercherGeneralisations(Litteral.from_string("P(a, a)"), store)
+        assert sorted(map(str, generalisations)) == ["P(X, X)", "P(a, X)"], f"{type(store)} : {generalisations}"
+        assert len(rechercherInstances(Litteral.from_string("P(X, Y)"), store, touteUnif=False)) == 1
+    assert filtrerLitteraux(Litteral.from_string("P(X)"), Litteral.from_string("¬P(a)")) is None, "Signes différents"
+    print("testRecherches OK")
+
+if __name__ == "__main__":
+    testFiltrer()
+    testVariablesPartagees()
+    testInstanceAleatoire()
+    testRecherches()
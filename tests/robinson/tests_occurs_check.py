@@ -0,0 +1,102 @@
+import random
+
+from unification import ArbreDeDiscrimination, MartelliMontanari, UnificationError, Substitution, OCCURS_TOUJOURS, OCCURS_DIFFERE, OCCURS_JAMAIS
+from unification.robinson import unify, unifyAll, unifLitteraux, unifier_lot
+from unification.utils.stores import ListStore, TermSystem
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+
+
+POLITIQUES = [OCCURS_TOUJOURS, OCCURS_DIFFERE, OCCURS_JAMAIS]
+
+def _mm(l1: str, l2: str, occurs: str):
+    """Système résolu de Martelli-Montanari pour les arguments des deux littéraux, None en cas d'échec."""
+    p1, p2 = Litteral.from_string(l1), Litteral.from_string(l2)
+    system = TermSystem()
+    for t1, t2 in zip(p1.enfants, p2.enfants):
+        system.add(t1, t2)
+    try:
+        return MartelliMontanari(system, occurs).solve()
+    except UnificationError:
+        return None
+
+def testCycles():
+    """Un cycle (direct ou à travers plusieurs liaisons) est rejeté par "toujours" et "differe", accepté par "jamais" """
+    for l1, l2 in [("P(X)", "¬P(f(X))"), ("P(X, Y)", "¬P(f(Y), g(X))"), ("P(f(X), X)", "¬P(Y, Y)")]:
+        p1, p2 = Litteral.from_string(l1), Litteral.from_string(l2)
+        for occurs in [OCCURS_TOUJOURS, OCCURS_DIFFERE]:
+            assert unifLitteraux(p1, p2, occurs) is None, f"{l1} / {l2} ({occurs})"
+            assert next(unifier_lot(p1, [p2], occurs=occurs), None) is None, f"{l1} / {l2} ({occurs}, compilé)"
+            assert _mm(l1, l2, occurs) is None, f"{l1} / {l2} ({occurs}, MM)"
+            arbre = ArbreDeDiscrimination(occurs=occurs)
+            arbre.inserer(p2, "p2")
+            assert arbre.rechercher(p1) == [], f"{l1} / {l2} ({occurs}, arbre)"
+        subst = unifLitteraux(p1, p2, OCCURS_JAMAIS)
+        assert subst is not None and subst.contient_cycle(), f"{l1} / {l2} : {subst}"
+        assert _mm(l1, l2, OCCURS_JAMAIS) is not None
+
+    try:
+        MartelliMontanari(TermSystem(), "parfois")
+        assert False, "ValueError attendue"
+    except ValueError:
+        pass
+    print("testCycles OK")
+
+def testTerminaison():
+    """X = f(X), Y = f(Y), X = Y : sans occurs check, la paire f(X) = f(Y) revient sans fin si elle est redécomposée"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+    g = lambda *enfants: FabriqueDeTermes.creer_fonc("g", len(enfants), list(enfants))
+
+    for occurs, attendu in [(OCCURS_TOUJOURS, False), (OCCURS_DIFFERE, False), (OCCURS_JAMAIS, True)]:
+        subst = unify(g(X, Y, X), g(f(X), f(Y), Y), ListStore(), Substitution(), occurs=occurs)
+        assert (subst is not None) == attendu, f"{occurs} : {subst}"
+
+    # unifyAll : une seule recherche de cycle, sur la substitution accumulée
+    termes = ListStore()
+    for t in [f(Y), f(g(X))]:
+        termes.push(t)
+    assert unifyAll(f(X), termes, ListStore(), occurs=OCCURS_DIFFERE) is None
+    termes = ListStore()
+    for t in [f(Y), f(g(Y))]:
+        termes.push(t)
+    assert unifyAll(f(X), termes, ListStore(), occurs=OCCURS_DIFFERE) is None
+    print("testTerminaison OK")
+
+def testCyclesSurLaMemeVariable():
+    """Sans occurs check, deux équations cycliques sur Z (Z = f(Z, Z) et Z = f(a, f(Z, Z))) doivent s'unifier : clash"""
+    l1, l2 = "P(f(Z, Z), f(Y, f(a, Y)))", "¬P(Y, f(Z, Z))"
+    p1, p2 = Litteral.from_string(l1), Litteral.from_string(l2)
+    for occurs in POLITIQUES:
+        assert unifLitteraux(p1, p2, occurs) is None, f"{occurs}"
+        assert _mm(l1, l2, occurs) is None, f"{occurs} (MM) : {_mm(l1, l2, occurs)}"
+    # Deux équations cycliques compatibles sont gardées
+    assert _mm("P(X, X)", "¬P(f(X), f(f(X)))", OCCURS_JAMAIS) is not None
+    print("testCyclesSurLaMemeVariable OK")
+
+def testEquivalence():
+    """Sur des littéraux aléatoires, "differe" unifie exactement les mêmes paires que "toujours", pour tous les moteurs"""
+    random.seed(16)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(400)
+    for requete in generateur.generer_litteraux(20):
+        attendus = [p for p, _ in unifier_lot(requete, litteraux)]
+        for occurs in [OCCURS_DIFFERE, OCCURS_JAMAIS]:
+            obtenus = [p for p, _ in unifier_lot(requete, litteraux, occurs=occurs)]
+            if occurs == OCCURS_DIFFERE:
+                assert obtenus == attendus, f"{requete} ({occurs})"
+            else:
+                assert set(attendus) <= set(obtenus), f"{requete} ({occurs})"
+        for candidat in litteraux:
+            attendu = unifLitteraux(requete, candidat) is not None
+            assert (unifLitteraux(requete, candidat, OCCURS_DIFFERE) is not None) == attendu, f"{requete} / {candidat}"
+            if candidat.sign != requete.sign and candidat.symbole == requete.symbole:
+                assert (_mm(str(requete), str(candidat), OCCURS_DIFFERE) is not None) == attendu, f"{requete} / {candidat} (MM)"
+    print("testEquivalence OK")
+
+if __name__ == "__main__":
+    testCycles()
+    testTerminaison()
+    testCyclesSurLaMemeVariable()
+    testEquivalence()
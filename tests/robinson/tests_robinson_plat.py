@@ -0,0 +1,87 @@
+import random
+
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+from unification.utils.stores import ListStore
+from unification.robinson import unifLitteraux, apply_subst, rechercherUnifiablesSimple
+from unification.robinson_plat import unifLitterauxPlat, unifier_plats
+from unification.discrimination_tree import ArbreDeDiscrimination
+
+
+def _resolue(subst: dict, terme):
+    """Applique la substitution (triangulaire) jusqu'au point fixe."""
+    precedent = None
+    while precedent is not terme:
+        precedent, terme = terme, apply_subst(terme, subst)
+    return terme
+
+def testUnifierPlats():
+    """Cas simples : succès, clash, occur check, variables partagées entre les deux littéraux"""
+    p1 = Litteral.from_string("P(X, f(Y), a)")
+    p2 = Litteral.from_string("¬P(g(Z), f(b), Z)")
+    subst = unifLitterauxPlat(p1, p2)
+    assert subst is not None
+    assert str(_resolue(subst, p1.enfants[0])) == "g(a)", f"Obtenu : {subst}"
+    assert str(_resolue(subst, p1.enfants[1])) == "f(b)"
+
+    assert unifLitterauxPlat(Litteral.from_string("P(a)"), Litteral.from_string("¬P(b)")) is None, "Clash attendu"
+    assert unifLitterauxPlat(Litteral.from_string("P(X)"), Litteral.from_string("¬P(f(X))")) is None, "Occur check attendu"
+    assert unifLitterauxPlat(Litteral.from_string("P(X, X)"), Litteral.from_string("¬P(Y, f(Y))")) is None, "Occur check indirect attendu"
+    assert unifLitterauxPlat(Litteral.from_string("P(X)"), Litteral.from_string("P(a)")) is None, "Même signe"
+
+    resultat = unifier_plats(Litteral.from_string("P(X, Y)").plat, Litteral.from_string("¬P(Y, a)").plat)
+    assert resultat is not None and len(resultat.noms) == 2, "X et Y sont partagés entre les deux côtés"
+    print("testUnifierPlats OK")
+
+def testEquivalenceRobinson():
+    """Le noyau plat trouve exactement les mêmes unifiables que unifLitteraux, et sa substitution unifie bien les deux littéraux"""
+    random.seed(4)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(400)
+    requetes = generateur.generer_litteraux(20)
+    for requete in requetes:
+        for candidat in litteraux:
+            attendu = unifLitteraux(requete, candidat)
+            obtenu = unifLitterauxPlat(requete, candidat)
+            assert (attendu is None) == (obtenu is None), f"{requete} / {candidat}"
+            if obtenu is not None:
+                for t1, t2 in zip(requete.enfants, candidat.enfants):
+                    assert _resolue(obtenu, t1) == _resolue(obtenu, t2), f"{requete} / {candidat} : {obtenu}"
+    print("testEquivalenceRobinson OK")
+
+def testBranchements():
+    """unifLitterauxPlat se branche dans la recherche simple et dans l'arbre de discrimination"""
+    random.seed(5)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(300)
+    store = ListStore()
+    arbre = ArbreDeDiscrimination()
+    arbre_plat = ArbreDeDiscrimination(unificateur=unifLitterauxPlat)
+    for i, litteral in enumerate(litteraux):
+        store.push(litteral)
+        arbre.inserer(litteral, i)
+        arbre_plat.inserer(litteral, i)
+
+    for requete in generateur.generer_litteraux(10):
+        assert rechercherUnifiablesSimple(requete, store).keys() == rechercherUnifiablesSimple(requete, store, unificateur=unifLitterauxPlat).keys()
+        assert [r.pointeurs for r in arbre.rechercher(requete)] == [r.pointeurs for r in arbre_plat.rechercher(requete)]
+    print("testBranchements OK")
+
+def testOccursCheckPartage():
+    """Liaisons partagées (DAG) : l'occur check ne suit chaque variable liée qu'une fois (sinon 2^n parcours)"""
+    n = 40
+    p1 = Litteral.from_string(f"P({', '.join(f'X{i}' for i in range(n, 0, -1))}, Y)")
+    p2 = Litteral.from_string(f"¬P({', '.join(f'f(X{i - 1}, X{i - 1})' for i in range(n, 0, -1))}, g(X{n}))")
+    subst = unifLitterauxPlat(p1, p2)
+    assert subst is not None and unifLitteraux(p1, p2) is not None
+    assert subst.resolve("Y").profondeur == n + 2
+    # X0 = X40 ferme le cycle : rejeté par l'occur check
+    p1 = Litteral.from_string(f"P({', '.join(f'X{i}' for i in range(n, 0, -1))}, X0)")
+    p2 = Litteral.from_string(f"¬P({', '.join(f'f(X{i - 1}, X{i - 1})' for i in range(n, 0, -1))}, X{n})")
+    assert unifLitterauxPlat(p1, p2) is None and unifLitteraux(p1, p2) is None
+    print("testOccursCheckPartage OK")
+
+if __name__ == "__main__":
+    testUnifierPlats()
+    testEquivalenceRobinson()
+    testBranchements()
+    testOccursCheckPartage()
@@ -0,0 +1,88 @@
+import random
+
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+from unification.utils.stores import ListStore, SetStore
+from unification.robinson import unifLitteraux, unifLitterauxUF, unifyUF, unifyAllUF, apply_subst
+
+
+def _resolue(subst: dict, terme):
+    """Applique la substitution (triangulaire) jusqu'au point fixe."""
+    precedent = None
+    while precedent is not terme:
+        precedent, terme = terme, apply_subst(terme, subst)
+    return terme
+
+def testChaine():
+    """h(X0, ..., Xn-1) = h(f(X1), ..., f(Xn)) : X0 = f(f(...f(Xn)))"""
+    n = 200
+    xs = [FabriqueDeTermes.creer_var(f"X{i}") for i in range(n + 1)]
+    t1 = FabriqueDeTermes.creer_fonc("h", n, xs[:n])
+    t2 = FabriqueDeTermes.creer_fonc("h", n, [FabriqueDeTermes.creer_fonc("f", 1, [x]) for x in xs[1:]])
+
+    subst = {}
+    assert unifyUF(t1, t2, ListStore(), subst) is subst
+    assert _resolue(subst, xs[0]).profondeur == n + 1, "X0 doit être lié à f^n(Xn)"
+    print("testChaine OK")
+
+def testCycle():
+    """Les cycles (directs ou via plusieurs variables) sont détectés à la fin"""
+    assert unifLitterauxUF(Litteral.from_string("P(X)"), Litteral.from_string("¬P(f(X))")) is None
+    assert unifLitterauxUF(Litteral.from_string("P(X, Y)"), Litteral.from_string("¬P(f(Y), g(X))")) is None
+    assert unifLitterauxUF(Litteral.from_string("P(X, X)"), Litteral.from_string("¬P(Y, f(Y))")) is None
+    assert unifLitterauxUF(Litteral.from_string("P(a)"), Litteral.from_string("¬P(b)")) is None, "Clash"
+    print("testCycle OK")
+
+def testTerminaison():
+    """Des variables déjà liées à des valeurs cycliques : la résolution termine (et échoue)"""
+    paires = [
+        ("P(f(X), X, f(Z), f(X))", "¬P(X, f(W), Z, W)"),
+        ("P(X, X)", "¬P(f(f(X)), f(X))"),
+        ("P(X, Y, X, Y)", "¬P(f(Y), f(X), Y, X)"),
+        ("P(f(X), X, Y, f(Y), X)", "¬P(X, f(Z), f(Z), Z, Y)"),
+    ]
+    for gauche, droite in paires:
+        p1, p2 = Litteral.from_string(gauche), Litteral.from_string(droite)
+        assert unifLitteraux(p1, p2) is None, f"{gauche} / {droite}"
+        assert unifLitterauxUF(p1, p2) is None, f"{gauche} / {droite}"
+    print("testTerminaison OK")
+
+def testUnifyAll():
+    """unifyAllUF accumule les contraintes de tous les termes, et part de la substitution initiale"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    a = FabriqueDeTermes.creer_cons("a")
+    b = FabriqueDeTermes.creer_cons("b")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+
+    termes = SetStore()
+    termes.push(f(a, Y))
+    termes.push(f(X, b))
+    subst = unifyAllUF(f(X, Y), termes, ListStore())
+    assert _resolue(subst, f(X, Y)) == f(a, b), f"Obtenu : {subst}"
+
+    termes = SetStore()
+    termes.push(f(b, Y))
+    assert unifyAllUF(f(X, Y), termes, ListStore(), {"X": a}) is None, "X est déjà lié à a"
+    print("testUnifyAll OK")
+
+def testEquivalenceRobinson():
+    """Mêmes littéraux unifiables que unifLitteraux, et la substitution unifie bien les deux littéraux"""
+    random.seed(7)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(400)
+    for requete in generateur.generer_litteraux(20):
+        for candidat in litteraux:
+            obtenu = unifLitterauxUF(requete, candidat)
+            assert (unifLitteraux(requete, candidat) is None) == (obtenu is None), f"{requete} / {candidat}"
+            if obtenu is not None:
+                for t1, t2 in zip(requete.enfants, candidat.enfants):
+                    assert _resolue(obtenu, t1) == _resolue(obtenu, t2), f"{requete} / {candidat} : {obtenu}"
+    print("testEquivalenceRobinson OK")
+
+if __name__ == "__main__":
+    testChaine()
+    testCycle()
+    testTerminaison()
+    testUnifyAll()
+    testEquivalenceRobinson()
@@ -0,0 +1,100 @@
+from unification import ArbreDeDiscrimination, Substitution
+from unification.robinson import unify, unifLitteraux, unifyMax
+from unification.utils.logique.substitution import Trace
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.utils.logique.litteral import Litteral
+from unification.utils.stores import ListStore, SetStore
+
+
+def testExponentiel():
+    """
+    f(X1, ..., Xn) = f(g(X0, X0), ..., g(Xn-1, Xn-1)) : Xn développé est de taille 2^(n+1) - 1,
+    mais le MGU reste triangulaire (chaque Xi lié à g(Xi-1, Xi-1))
+    """
+    n = 40
+    xs = [FabriqueDeTermes.creer_var(f"X{i}") for i in range(n + 1)]
+    t1 = FabriqueDeTermes.creer_fonc("f", n, xs[1:])
+    t2 = FabriqueDeTermes.creer_fonc("f", n, [FabriqueDeTermes.creer_fonc("g", 2, [x, x]) for x in xs[:n]])
+
+    subst = unify(t1, t2, ListStore(), Substitution())
+    assert isinstance(subst, Substitution)
+    assert len(subst) == n
+    assert all(terme.profondeur == 2 for terme in subst.values()), "Les liaisons ne doivent pas être développées"
+    assert not subst.est_idempotente()
+
+    # Le terme développé est partagé : il se calcule sans parcourir ses 2^41 noeuds
+    resolu = subst.resolve(f"X{n}")
+    assert resolu.profondeur == n + 1
+    assert resolu.variables == {"X0"}
+    assert subst.resolve("X0") is xs[0], "Variable libre"
+    print("testExponentiel OK")
+
+def testNormaliser():
+    """normaliser donne la substitution idempotente équivalente, sans liaison triviale"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    Z = FabriqueDeTermes.creer_var("Z")
+    a = FabriqueDeTermes.creer_cons("a")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+
+    subst = Substitution({"X": f(Y, Z), "Y": a, "Z": Z})
+    normalisee = subst.normaliser()
+    assert normalisee == {"X": f(a, Z), "Y": a}, f"Obtenu : {normalisee}"
+    assert normalisee.est_idempotente()
+    assert normalisee.normaliser() == normalisee
+    assert subst.appliquer(f(X, X)) == f(f(a, Z), f(a, Z))
+    print("testNormaliser OK")
+
+def testArbre():
+    """Les résultats de l'arbre de discrimination utilisent le même type"""
+    arbre = ArbreDeDiscrimination()
+    arbre.inserer(Litteral.from_string("¬P(f(Y), Y)"), "p1")
+    requete = Litteral.from_string("P(X, g(Z))")
+    resultats = arbre.rechercher(requete)
+    assert len(resultats) == 1
+    substitution = resultats[0].substitution
+    assert isinstance(substitution, Substitution)
+    assert str(substitution.resolve("X")) == "f(g(Z))"
+    assert substitution.normaliser() == unifLitteraux(requete, Litteral.from_string("¬P(f(Y), Y)")).normaliser()
+    print("testArbre OK")
+
+def testTrace():
+    """Un échec laisse des liaisons partielles, que la trace défait jusqu'à la marque"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    a = FabriqueDeTermes.creer_cons("a")
+    b = FabriqueDeTermes.creer_cons("b")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+
+    subst = Substitution()
+    trace = Trace()
+    assert unify(X, a, ListStore(), subst, trace) is not None
+    marque = trace.marquer()
+    assert unify(f(X, Y), f(b, b), ListStore(), subst, trace) is None
+    assert "Y" in subst, "Liaison partielle avant le clash"
+    trace.annuler(subst, marque)
+    assert subst == {"X": a} and trace == ["X"]
+    print("testTrace OK")
+
+def testUnifyMax():
+    """unifyMax garde les termes compatibles, les échecs n'ont laissé aucune liaison"""
+    X = FabriqueDeTermes.creer_var("X")
+    Y = FabriqueDeTermes.creer_var("Y")
+    a = FabriqueDeTermes.creer_cons("a")
+    b = FabriqueDeTermes.creer_cons("b")
+    f = lambda *enfants: FabriqueDeTermes.creer_fonc("f", len(enfants), list(enfants))
+
+    termes = ListStore()
+    for t in [f(a, Y), f(b, b), f(X, a)]:
+        termes.push(t)
+    subst, compatibles = unifyMax(f(X, Y), termes, SetStore())
+    assert set(compatibles) == {f(a, Y), f(X, a)}, f"Obtenu : {compatibles}"
+    assert subst.normaliser() == {"X": a, "Y": a}, f"Obtenu : {subst}"
+    print("testUnifyMax OK")
+
+if __name__ == "__main__":
+    testExponentiel()
+    testNormaliser()
+    testArbre()
+    testTrace()
+    testUnifyMax()
@@ -0,0 +1,74 @@
+import random
+
+from itertools import islice
+
+from unification import unifier_lot, rechercherUnifiablesIter, rechercherUnifiablesOptimise, ArbreDeDiscrimination
+from unification.utils.stores import DictStore
+from unification.utils.logique.terme import FabriqueDeTermes
+from unification.robinson import unifLitteraux
+from unification import martelli_montanari
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire, candidats_compatibles
+
+
+def testFiltre():
+    """Le préfiltre écarte signe, prédicat, arité et clash de tête, et garde les variables"""
+    requete = Litteral.from_string("P(f(X), a, Y)")
+    candidats = [Litteral.from_string(s) for s in
+                 ["¬P(f(b), Z, c)", "P(f(b), a, c)", "¬Q(f(b), a, c)", "¬P(f(b), a)", "¬P(g(b), a, c)", "¬P(Z, b, c)", "¬P(Z, Z, Z)"]]
+    gardes = [str(c) for c in candidats_compatibles(requete, candidats)]
+    assert gardes == ["¬P(f(b), Z, c)", "¬P(Z, Z, Z)"], f"Obtenu : {gardes}"
+    print("testFiltre OK")
+
+def testEquivalence():
+    """Mêmes candidats unifiables que unifLitteraux (et que Martelli-Montanari), et limite respectée"""
+    random.seed(12)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3)
+    litteraux = generateur.generer_litteraux(400)
+    for requete in generateur.generer_litteraux(20):
+        attendus = [c for c in litteraux if unifLitteraux(requete, c) is not None]
+        assert [c for c, _ in unifier_lot(requete, litteraux)] == attendus, f"{requete}"
+        obtenus = dict(unifier_lot(requete, litteraux))
+        for candidat, subst in obtenus.items():
+            for t1, t2 in zip(requete.enfants, candidat.enfants):
+                assert subst.appliquer(t1) == subst.appliquer(t2), f"{requete} / {candidat} : {subst}"
+        assert [c for c, _ in martelli_montanari.unifier_lot(requete, litteraux)] == attendus, f"MM : {requete}"
+        assert [c for c, _ in unifier_lot(requete, litteraux, limite=2)] == attendus[:2]
+    print("testEquivalence OK")
+
+def testIterateurs():
+    """Les recherches paresseuses ne consomment que les candidats nécessaires, et respectent la limite"""
+    random.seed(15)
+    generateur = GenerateurLitteralAleatoire(["P"], 2, 2)
+    litteraux = generateur.generer_litteraux(300)
+    # Requête la plus générale de même prédicat que le premier littéral, de signe opposé
+    modele = litteraux[0]
+    requete = Litteral(modele.predicat, [FabriqueDeTermes.creer_var(f"V{i}") for i in range(modele.arity)], not modele.sign)
+
+    consommes = []
+    def candidats():
+        for l in litteraux:
+            consommes.append(l)
+            yield l
+    premiers = list(islice(rechercherUnifiablesIter(requete, candidats()), 3))
+    assert len(premiers) == 3
+    assert consommes[-1] is premiers[-1][0], "Aucun candidat testé après le troisième résultat"
+
+    store = DictStore()
+    for l in litteraux:
+        store.push(l)
+    tous = list(rechercherUnifiablesIter(requete, store))
+    assert dict(tous) == rechercherUnifiablesOptimise(requete, store)
+    assert list(rechercherUnifiablesIter(requete, store, limite=5)) == tous[:5]
+
+    arbre = ArbreDeDiscrimination()
+    for i, l in enumerate(litteraux):
+        arbre.inserer(l, i)
+    resultats = arbre.rechercher(requete)
+    assert [r.pointeurs for r in arbre.rechercher_iter(requete, limite=4)] == [r.pointeurs for r in resultats[:4]]
+    assert arbre.rechercher_une(requete).pointeurs == resultats[0].pointeurs
+    print("testIterateurs OK")
+
+if __name__ == "__main__":
+    testFiltre()
+    testEquivalence()
+    testIterateurs()
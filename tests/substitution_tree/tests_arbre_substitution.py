@@ -0,0 +1,93 @@
+import random
+
+from unification import ArbreDeSubstitution, ArbreDeDiscrimination
+from unification.robinson import unifLitteraux, filtrerLitteraux
+from unification.utils.logique.litteral import Litteral, GenerateurLitteralAleatoire
+
+
+CHAINES = ["P(X, X)", "P(X, Y)", "P(g(a, X), Y)", "P(g(X, b), X)", "P(f(a), Z)", "P(a, b)", "P(b, b)", "P(X, f(b))"]
+
+def _arbre(chaines):
+    arbre = ArbreDeSubstitution()
+    for chaine in chaines:
+        arbre.inserer(Litteral.from_string(chaine), chaine)
+    return arbre
+
+def testPartage():
+    """Les littéraux partagent leur généralisation commune, variables comprises"""
+    arbre = _arbre(["P(f(a), X)", "P(f(b), X)"])
+    racine = next(iter(arbre.racines.values()))
+    assert len(racine.enfants) == 1, "Un seul noeud commun sous la racine"
+    commun = racine.enfants[0]
+    assert [str(t) for t in commun.substitution.values()] == ["f(□1)", "*1"], f"Obtenu : {commun.substitution}"
+    assert sorted(str(e.substitution["□1"]) for e in commun.enfants) == ["a", "b"]
+    # Deux littéraux égaux à renommage près partagent la même feuille
+    arbre.inserer(Litteral.from_string("P(f(a), Y)"), "P(f(a), Y)")
+    assert len(commun.enfants) == 2 and len(arbre) == 3
+    print("testPartage OK")
+
+def testRecherches():
+    """Unifiables (signe opposé), instances et généralisations (même signe)"""
+    arbre = _arbre(CHAINES)
+    trouves = sorted(r.pointeurs[0] for r in arbre.rechercher(Litteral.from_string("¬P(g(a, b), Y)")))
+    assert trouves == ["P(X, X)", "P(X, Y)", "P(X, f(b))", "P(g(X, b), X)", "P(g(a, X), Y)"], f"Obtenu : {trouves}"
+    assert arbre.rechercher(Litteral.from_string("P(g(a, b), Y)")) == []
+
+    trouves = sorted(r.pointeurs[0] for r in arbre.rechercher_instances(Litteral.from_string("P(U, b)")))
+    assert trouves == ["P(a, b)", "P(b, b)"], f"Obtenu : {trouves}"
+    trouves = sorted(r.pointeurs[0] for r in arbre.rechercher_generalisations(Litteral.from_string("P(f(a), f(b))")))
+    assert trouves == ["P(X, Y)", "P(X, f(b))", "P(f(a), Z)"], f"Obtenu : {trouves}"
+    assert arbre.rechercher_une(Litteral.from_string("¬P(c, c)")) is not None
+
+    # Requête et littéral stocké partagent leurs variables : σ ne se résout pas en chaîne
+    motif, requete = Litteral.from_string("P(X, Y)"), Litteral.from_string("P(Y, a)")
+    (resultat,) = _arbre(["P(X, Y)"]).rechercher_generalisations(requete)
+    assert [resultat.substitution.appliquer(t) for t in motif.enfants] == list(requete.enfants), f"Obtenu : {resultat.substitution}"
+    print("testRecherches OK")
+
+def testEquivalence():
+    """Mêmes résultats qu'un parcours complet (et que l'arbre de discrimination), avant et après suppressions"""
+    alea = random.Random(25)
+    generateur = GenerateurLitteralAleatoire(["P", "Q"], 3, 3, alea=alea)
+    litteraux = generateur.generer_litteraux(600)
+    requetes = generateur.generer_litteraux(25) + alea.sample(litteraux, 5)
+    arbre, discrimination = ArbreDeSubstitution(), ArbreDeDiscrimination()
+    for i, l in enumerate(litteraux):
+        arbre.inserer(l, i)
+        discrimination.inserer(l, i)
+
+    for q in requetes:
+        assert sorted(r.pointeurs[0] for r in arbre.rechercher(q)) == sorted(r.pointeurs[0] for r in discrimination.rechercher(q)), f"{q}"
+
+    presents = set(range(len(litteraux)))
+    for _ in range(2):
+        for q in requetes:
+            attendus = sorted(i for i in presents if litteraux[i].sign != q.sign and unifLitteraux(q, litteraux[i]) is not None)
+            assert sorted(r.pointeurs[0] for r in arbre.rechercher(q)) == attendus, f"{q}"
+            attendus = sorted(i for i in presents if filtrerLitteraux(q, litteraux[i]) is not None)
+            assert sorted(r.pointeurs[0] for r in arbre.rechercher_instances(q)) == attendus, f"Instances : {q}"
+            attendus = sorted(i for i in presents if filtrerLitteraux(litteraux[i], q) is not None)
+            assert sorted(r.pointeurs[0] for r in arbre.rechercher_generalisations(q)) == attendus, f"Généralisations : {q}"
+        for i in alea.sample(sorted(presents), 250):
+            assert arbre.supprimer(litteraux[i], i)
+            presents.discard(i)
+    print("testEquivalence OK")
+
+def testSuppression():
+    """Les feuilles vidées disparaissent, les noeuds à un seul enfant sont fusionnés"""
+    arbre = _arbre(CHAINES)
+    assert not arbre.supprimer(Litteral.from_string("P(c, c)"))
+    for chaine in CHAINES[:-1]:
+        assert arbre.supprimer(Litteral.from_string(chaine), chaine), chaine
+    racine = next(iter(arbre.racines.values()))
+    assert len(arbre) == 1 and len(racine.enfants) == 1
+    feuille = racine.enfants[0]
+    assert not feuille.enfants and [str(t) for t in feuille.substitution.values()] == ["*1", "f(b)"], f"Obtenu : {feuille.substitution}"
+    assert arbre.supprimer(Litteral.from_string("P(X, f(b))")) and not arbre.racines
+    print("testSuppression OK")
+
+if __name__ == "__main__":
+    testPartage()
+    testRecherches()
+    testEquivalence()
+    testSuppression()